@@ -9,7 +9,7 @@ from alembic import context
 
 from app.config import settings
 from app.database import Base
-from app.models import *  # noqa: Import all models
+import app.models._all  # noqa: Import all models
 
 # this is the Alembic Config object
 config = context.config
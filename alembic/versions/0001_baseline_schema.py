@@ -0,0 +1,851 @@
+"""Baseline schema
+
+The schema as created by init_db before any migrations existed. Databases
+created that way are stamped at this revision (``alembic stamp 0001``)
+and upgraded from here.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('audit_log_events',
+    sa.Column('event_type', sa.String(length=100), nullable=False),
+    sa.Column('event_category', sa.String(length=100), nullable=False),
+    sa.Column('actor_type', sa.String(length=50), nullable=False),
+    sa.Column('actor_gid', sa.String(length=32), nullable=True),
+    sa.Column('actor_email', sa.String(length=255), nullable=True),
+    sa.Column('resource_type', sa.String(length=50), nullable=True),
+    sa.Column('resource_gid', sa.String(length=32), nullable=True),
+    sa.Column('resource_name', sa.String(length=255), nullable=True),
+    sa.Column('context_type', sa.String(length=50), nullable=False),
+    sa.Column('context_gid', sa.String(length=32), nullable=False),
+    sa.Column('details', sa.Text(), nullable=True),
+    sa.Column('client_ip', sa.String(length=50), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_audit_log_events'))
+    )
+    op.create_index(op.f('ix_audit_log_events_actor_gid'), 'audit_log_events', ['actor_gid'], unique=False)
+    op.create_index(op.f('ix_audit_log_events_context_gid'), 'audit_log_events', ['context_gid'], unique=False)
+    op.create_index(op.f('ix_audit_log_events_event_category'), 'audit_log_events', ['event_category'], unique=False)
+    op.create_index(op.f('ix_audit_log_events_event_type'), 'audit_log_events', ['event_type'], unique=False)
+    op.create_index(op.f('ix_audit_log_events_gid'), 'audit_log_events', ['gid'], unique=False)
+    op.create_index(op.f('ix_audit_log_events_resource_gid'), 'audit_log_events', ['resource_gid'], unique=False)
+    op.create_table('users',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('email', sa.String(length=255), nullable=False),
+    sa.Column('photo', sa.Text(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('is_superuser', sa.Boolean(), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_users'))
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_gid'), 'users', ['gid'], unique=False)
+    op.create_table('workspaces',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('is_organization', sa.Boolean(), nullable=False),
+    sa.Column('email_domains', sa.String(length=1000), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_workspaces'))
+    )
+    op.create_index(op.f('ix_workspaces_gid'), 'workspaces', ['gid'], unique=False)
+    op.create_table('custom_fields',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('resource_subtype', sa.String(length=50), nullable=False),
+    sa.Column('type', sa.String(length=50), nullable=False),
+    sa.Column('format', sa.String(length=50), nullable=True),
+    sa.Column('currency_code', sa.String(length=10), nullable=True),
+    sa.Column('custom_label', sa.String(length=100), nullable=True),
+    sa.Column('custom_label_position', sa.String(length=20), nullable=True),
+    sa.Column('precision', sa.Integer(), nullable=False),
+    sa.Column('is_formula_field', sa.Boolean(), nullable=False),
+    sa.Column('is_important', sa.Boolean(), nullable=False),
+    sa.Column('has_notifications_enabled', sa.Boolean(), nullable=False),
+    sa.Column('date_value_has_time', sa.Boolean(), nullable=False),
+    sa.Column('workspace_gid', sa.String(length=32), nullable=False),
+    sa.Column('created_by_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['created_by_gid'], ['users.gid'], name=op.f('fk_custom_fields_created_by_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['workspace_gid'], ['workspaces.gid'], name=op.f('fk_custom_fields_workspace_gid_workspaces'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_custom_fields'))
+    )
+    op.create_index(op.f('ix_custom_fields_gid'), 'custom_fields', ['gid'], unique=False)
+    op.create_index(op.f('ix_custom_fields_workspace_gid'), 'custom_fields', ['workspace_gid'], unique=False)
+    op.create_table('event_records',
+    sa.Column('resource_gid', sa.String(length=32), nullable=False),
+    sa.Column('resource_type', sa.String(length=50), nullable=False),
+    sa.Column('parent_gid', sa.String(length=32), nullable=True),
+    sa.Column('parent_type', sa.String(length=50), nullable=True),
+    sa.Column('action', sa.String(length=50), nullable=False),
+    sa.Column('user_gid', sa.String(length=32), nullable=True),
+    sa.Column('change', sa.Text(), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_gid'], ['users.gid'], name=op.f('fk_event_records_user_gid_users'), ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_event_records'))
+    )
+    op.create_index(op.f('ix_event_records_gid'), 'event_records', ['gid'], unique=False)
+    op.create_index(op.f('ix_event_records_parent_gid'), 'event_records', ['parent_gid'], unique=False)
+    op.create_index(op.f('ix_event_records_resource_gid'), 'event_records', ['resource_gid'], unique=False)
+    op.create_table('jobs',
+    sa.Column('resource_subtype', sa.String(length=50), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=False),
+    sa.Column('new_project_gid', sa.String(length=32), nullable=True),
+    sa.Column('new_task_gid', sa.String(length=32), nullable=True),
+    sa.Column('new_project_template_gid', sa.String(length=32), nullable=True),
+    sa.Column('created_by_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['created_by_gid'], ['users.gid'], name=op.f('fk_jobs_created_by_gid_users'), ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_jobs'))
+    )
+    op.create_index(op.f('ix_jobs_gid'), 'jobs', ['gid'], unique=False)
+    op.create_table('organization_exports',
+    sa.Column('state', sa.String(length=50), nullable=False),
+    sa.Column('download_url', sa.Text(), nullable=True),
+    sa.Column('organization_gid', sa.String(length=32), nullable=False),
+    sa.Column('created_by_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['created_by_gid'], ['users.gid'], name=op.f('fk_organization_exports_created_by_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['organization_gid'], ['workspaces.gid'], name=op.f('fk_organization_exports_organization_gid_workspaces'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_organization_exports'))
+    )
+    op.create_index(op.f('ix_organization_exports_gid'), 'organization_exports', ['gid'], unique=False)
+    op.create_index(op.f('ix_organization_exports_organization_gid'), 'organization_exports', ['organization_gid'], unique=False)
+    op.create_table('portfolios',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('color', sa.String(length=50), nullable=True),
+    sa.Column('public', sa.Boolean(), nullable=False),
+    sa.Column('workspace_gid', sa.String(length=32), nullable=False),
+    sa.Column('owner_gid', sa.String(length=32), nullable=True),
+    sa.Column('current_status_update_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['owner_gid'], ['users.gid'], name=op.f('fk_portfolios_owner_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['workspace_gid'], ['workspaces.gid'], name=op.f('fk_portfolios_workspace_gid_workspaces'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_portfolios'))
+    )
+    op.create_index(op.f('ix_portfolios_gid'), 'portfolios', ['gid'], unique=False)
+    op.create_index(op.f('ix_portfolios_workspace_gid'), 'portfolios', ['workspace_gid'], unique=False)
+    op.create_table('tags',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('color', sa.String(length=50), nullable=True),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('workspace_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['workspace_gid'], ['workspaces.gid'], name=op.f('fk_tags_workspace_gid_workspaces'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_tags'))
+    )
+    op.create_index(op.f('ix_tags_gid'), 'tags', ['gid'], unique=False)
+    op.create_index(op.f('ix_tags_workspace_gid'), 'tags', ['workspace_gid'], unique=False)
+    op.create_table('teams',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('html_description', sa.Text(), nullable=True),
+    sa.Column('visibility', sa.String(length=50), nullable=False),
+    sa.Column('edit_team_name_or_description_access_level', sa.String(length=50), nullable=False),
+    sa.Column('edit_team_visibility_or_trash_team_access_level', sa.String(length=50), nullable=False),
+    sa.Column('guest_invite_management_access_level', sa.String(length=50), nullable=False),
+    sa.Column('join_request_management_access_level', sa.String(length=50), nullable=False),
+    sa.Column('member_invite_management_access_level', sa.String(length=50), nullable=False),
+    sa.Column('team_member_removal_access_level', sa.String(length=50), nullable=False),
+    sa.Column('workspace_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['workspace_gid'], ['workspaces.gid'], name=op.f('fk_teams_workspace_gid_workspaces'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_teams'))
+    )
+    op.create_index(op.f('ix_teams_gid'), 'teams', ['gid'], unique=False)
+    op.create_index(op.f('ix_teams_workspace_gid'), 'teams', ['workspace_gid'], unique=False)
+    op.create_table('time_periods',
+    sa.Column('display_name', sa.String(length=255), nullable=False),
+    sa.Column('period', sa.String(length=50), nullable=False),
+    sa.Column('start_on', sa.Date(), nullable=False),
+    sa.Column('end_on', sa.Date(), nullable=False),
+    sa.Column('parent_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['parent_gid'], ['workspaces.gid'], name=op.f('fk_time_periods_parent_gid_workspaces'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_time_periods'))
+    )
+    op.create_index(op.f('ix_time_periods_gid'), 'time_periods', ['gid'], unique=False)
+    op.create_index(op.f('ix_time_periods_parent_gid'), 'time_periods', ['parent_gid'], unique=False)
+    op.create_table('user_favorites',
+    sa.Column('resource_gid', sa.String(length=32), nullable=False),
+    sa.Column('resource_type', sa.String(length=50), nullable=False),
+    sa.Column('user_gid', sa.String(length=32), nullable=False),
+    sa.Column('workspace_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_gid'], ['users.gid'], name=op.f('fk_user_favorites_user_gid_users'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['workspace_gid'], ['workspaces.gid'], name=op.f('fk_user_favorites_workspace_gid_workspaces'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_user_favorites'))
+    )
+    op.create_index(op.f('ix_user_favorites_gid'), 'user_favorites', ['gid'], unique=False)
+    op.create_index(op.f('ix_user_favorites_resource_gid'), 'user_favorites', ['resource_gid'], unique=False)
+    op.create_index(op.f('ix_user_favorites_user_gid'), 'user_favorites', ['user_gid'], unique=False)
+    op.create_index(op.f('ix_user_favorites_workspace_gid'), 'user_favorites', ['workspace_gid'], unique=False)
+    op.create_table('user_task_lists',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('owner_gid', sa.String(length=32), nullable=False),
+    sa.Column('workspace_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['owner_gid'], ['users.gid'], name=op.f('fk_user_task_lists_owner_gid_users'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['workspace_gid'], ['workspaces.gid'], name=op.f('fk_user_task_lists_workspace_gid_workspaces'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_user_task_lists'))
+    )
+    op.create_index(op.f('ix_user_task_lists_gid'), 'user_task_lists', ['gid'], unique=False)
+    op.create_index(op.f('ix_user_task_lists_owner_gid'), 'user_task_lists', ['owner_gid'], unique=False)
+    op.create_index(op.f('ix_user_task_lists_workspace_gid'), 'user_task_lists', ['workspace_gid'], unique=False)
+    op.create_table('webhooks',
+    sa.Column('target', sa.Text(), nullable=False),
+    sa.Column('resource_gid', sa.String(length=32), nullable=False),
+    sa.Column('resource_type', sa.String(length=50), nullable=False),
+    sa.Column('active', sa.Boolean(), nullable=False),
+    sa.Column('secret', sa.String(length=255), nullable=False),
+    sa.Column('filters', sa.Text(), nullable=True),
+    sa.Column('last_success_at', sa.String(length=50), nullable=True),
+    sa.Column('last_failure_at', sa.String(length=50), nullable=True),
+    sa.Column('last_failure_content', sa.Text(), nullable=True),
+    sa.Column('created_by_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['created_by_gid'], ['users.gid'], name=op.f('fk_webhooks_created_by_gid_users'), ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_webhooks'))
+    )
+    op.create_index(op.f('ix_webhooks_gid'), 'webhooks', ['gid'], unique=False)
+    op.create_index(op.f('ix_webhooks_resource_gid'), 'webhooks', ['resource_gid'], unique=False)
+    op.create_table('workspace_memberships',
+    sa.Column('user_gid', sa.String(length=32), nullable=False),
+    sa.Column('workspace_gid', sa.String(length=32), nullable=False),
+    sa.Column('is_admin', sa.Boolean(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('is_guest', sa.Boolean(), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_gid'], ['users.gid'], name=op.f('fk_workspace_memberships_user_gid_users'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['workspace_gid'], ['workspaces.gid'], name=op.f('fk_workspace_memberships_workspace_gid_workspaces'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_workspace_memberships'))
+    )
+    op.create_index(op.f('ix_workspace_memberships_gid'), 'workspace_memberships', ['gid'], unique=False)
+    op.create_index(op.f('ix_workspace_memberships_user_gid'), 'workspace_memberships', ['user_gid'], unique=False)
+    op.create_index(op.f('ix_workspace_memberships_workspace_gid'), 'workspace_memberships', ['workspace_gid'], unique=False)
+    op.create_table('custom_field_enum_options',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('color', sa.String(length=50), nullable=True),
+    sa.Column('enabled', sa.Boolean(), nullable=False),
+    sa.Column('order', sa.Integer(), nullable=False),
+    sa.Column('custom_field_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['custom_field_gid'], ['custom_fields.gid'], name=op.f('fk_custom_field_enum_options_custom_field_gid_custom_fields'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_custom_field_enum_options'))
+    )
+    op.create_index(op.f('ix_custom_field_enum_options_custom_field_gid'), 'custom_field_enum_options', ['custom_field_gid'], unique=False)
+    op.create_index(op.f('ix_custom_field_enum_options_gid'), 'custom_field_enum_options', ['gid'], unique=False)
+    op.create_table('goals',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('html_notes', sa.Text(), nullable=True),
+    sa.Column('due_on', sa.Date(), nullable=True),
+    sa.Column('start_on', sa.Date(), nullable=True),
+    sa.Column('status', sa.String(length=50), nullable=True),
+    sa.Column('is_workspace_level', sa.Boolean(), nullable=False),
+    sa.Column('liked', sa.Boolean(), nullable=False),
+    sa.Column('num_likes', sa.Integer(), nullable=False),
+    sa.Column('metric_type', sa.String(length=50), nullable=True),
+    sa.Column('metric_unit', sa.String(length=50), nullable=True),
+    sa.Column('metric_precision', sa.Integer(), nullable=False),
+    sa.Column('metric_currency_code', sa.String(length=10), nullable=True),
+    sa.Column('metric_initial_number_value', sa.Float(), nullable=True),
+    sa.Column('metric_target_number_value', sa.Float(), nullable=True),
+    sa.Column('metric_current_number_value', sa.Float(), nullable=True),
+    sa.Column('workspace_gid', sa.String(length=32), nullable=False),
+    sa.Column('owner_gid', sa.String(length=32), nullable=True),
+    sa.Column('team_gid', sa.String(length=32), nullable=True),
+    sa.Column('time_period_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['owner_gid'], ['users.gid'], name=op.f('fk_goals_owner_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['team_gid'], ['teams.gid'], name=op.f('fk_goals_team_gid_teams'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['time_period_gid'], ['time_periods.gid'], name=op.f('fk_goals_time_period_gid_time_periods'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['workspace_gid'], ['workspaces.gid'], name=op.f('fk_goals_workspace_gid_workspaces'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_goals'))
+    )
+    op.create_index(op.f('ix_goals_gid'), 'goals', ['gid'], unique=False)
+    op.create_index(op.f('ix_goals_workspace_gid'), 'goals', ['workspace_gid'], unique=False)
+    op.create_table('portfolio_memberships',
+    sa.Column('portfolio_gid', sa.String(length=32), nullable=False),
+    sa.Column('user_gid', sa.String(length=32), nullable=False),
+    sa.Column('access_level', sa.String(length=50), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['portfolio_gid'], ['portfolios.gid'], name=op.f('fk_portfolio_memberships_portfolio_gid_portfolios'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_gid'], ['users.gid'], name=op.f('fk_portfolio_memberships_user_gid_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_portfolio_memberships'))
+    )
+    op.create_index(op.f('ix_portfolio_memberships_gid'), 'portfolio_memberships', ['gid'], unique=False)
+    op.create_index(op.f('ix_portfolio_memberships_portfolio_gid'), 'portfolio_memberships', ['portfolio_gid'], unique=False)
+    op.create_index(op.f('ix_portfolio_memberships_user_gid'), 'portfolio_memberships', ['user_gid'], unique=False)
+    op.create_table('project_templates',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('html_description', sa.Text(), nullable=True),
+    sa.Column('public', sa.Boolean(), nullable=False),
+    sa.Column('color', sa.String(length=50), nullable=True),
+    sa.Column('template_data', sa.Text(), nullable=True),
+    sa.Column('team_gid', sa.String(length=32), nullable=True),
+    sa.Column('owner_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['owner_gid'], ['users.gid'], name=op.f('fk_project_templates_owner_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['team_gid'], ['teams.gid'], name=op.f('fk_project_templates_team_gid_teams'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_project_templates'))
+    )
+    op.create_index(op.f('ix_project_templates_gid'), 'project_templates', ['gid'], unique=False)
+    op.create_index(op.f('ix_project_templates_team_gid'), 'project_templates', ['team_gid'], unique=False)
+    op.create_table('projects',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('html_notes', sa.Text(), nullable=True),
+    sa.Column('archived', sa.Boolean(), nullable=False),
+    sa.Column('public', sa.Boolean(), nullable=False),
+    sa.Column('color', sa.String(length=50), nullable=True),
+    sa.Column('default_view', sa.String(length=50), nullable=False),
+    sa.Column('due_on', sa.Date(), nullable=True),
+    sa.Column('due_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('start_on', sa.Date(), nullable=True),
+    sa.Column('completed', sa.Boolean(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('owner_gid', sa.String(length=32), nullable=True),
+    sa.Column('current_status_update_gid', sa.String(length=32), nullable=True),
+    sa.Column('icon', sa.String(length=50), nullable=True),
+    sa.Column('privacy_setting', sa.String(length=50), nullable=False),
+    sa.Column('workspace_gid', sa.String(length=32), nullable=False),
+    sa.Column('team_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['owner_gid'], ['users.gid'], name=op.f('fk_projects_owner_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['team_gid'], ['teams.gid'], name=op.f('fk_projects_team_gid_teams'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['workspace_gid'], ['workspaces.gid'], name=op.f('fk_projects_workspace_gid_workspaces'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_projects'))
+    )
+    op.create_index(op.f('ix_projects_gid'), 'projects', ['gid'], unique=False)
+    op.create_index(op.f('ix_projects_team_gid'), 'projects', ['team_gid'], unique=False)
+    op.create_index(op.f('ix_projects_workspace_gid'), 'projects', ['workspace_gid'], unique=False)
+    op.create_table('team_memberships',
+    sa.Column('user_gid', sa.String(length=32), nullable=False),
+    sa.Column('team_gid', sa.String(length=32), nullable=False),
+    sa.Column('is_admin', sa.Boolean(), nullable=False),
+    sa.Column('is_guest', sa.Boolean(), nullable=False),
+    sa.Column('is_limited_access', sa.Boolean(), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['team_gid'], ['teams.gid'], name=op.f('fk_team_memberships_team_gid_teams'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_gid'], ['users.gid'], name=op.f('fk_team_memberships_user_gid_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_team_memberships'))
+    )
+    op.create_index(op.f('ix_team_memberships_gid'), 'team_memberships', ['gid'], unique=False)
+    op.create_index(op.f('ix_team_memberships_team_gid'), 'team_memberships', ['team_gid'], unique=False)
+    op.create_index(op.f('ix_team_memberships_user_gid'), 'team_memberships', ['user_gid'], unique=False)
+    op.create_table('custom_field_settings',
+    sa.Column('is_important', sa.Boolean(), nullable=False),
+    sa.Column('custom_field_gid', sa.String(length=32), nullable=False),
+    sa.Column('project_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['custom_field_gid'], ['custom_fields.gid'], name=op.f('fk_custom_field_settings_custom_field_gid_custom_fields'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['project_gid'], ['projects.gid'], name=op.f('fk_custom_field_settings_project_gid_projects'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_custom_field_settings'))
+    )
+    op.create_index(op.f('ix_custom_field_settings_custom_field_gid'), 'custom_field_settings', ['custom_field_gid'], unique=False)
+    op.create_index(op.f('ix_custom_field_settings_gid'), 'custom_field_settings', ['gid'], unique=False)
+    op.create_index(op.f('ix_custom_field_settings_project_gid'), 'custom_field_settings', ['project_gid'], unique=False)
+    op.create_table('goal_memberships',
+    sa.Column('role', sa.String(length=50), nullable=False),
+    sa.Column('goal_gid', sa.String(length=32), nullable=False),
+    sa.Column('member_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['goal_gid'], ['goals.gid'], name=op.f('fk_goal_memberships_goal_gid_goals'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['member_gid'], ['users.gid'], name=op.f('fk_goal_memberships_member_gid_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_goal_memberships'))
+    )
+    op.create_index(op.f('ix_goal_memberships_gid'), 'goal_memberships', ['gid'], unique=False)
+    op.create_index(op.f('ix_goal_memberships_goal_gid'), 'goal_memberships', ['goal_gid'], unique=False)
+    op.create_index(op.f('ix_goal_memberships_member_gid'), 'goal_memberships', ['member_gid'], unique=False)
+    op.create_table('goal_relationships',
+    sa.Column('contribution_weight', sa.Float(), nullable=False),
+    sa.Column('supporting_goal_gid', sa.String(length=32), nullable=False),
+    sa.Column('supported_goal_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['supported_goal_gid'], ['goals.gid'], name=op.f('fk_goal_relationships_supported_goal_gid_goals'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['supporting_goal_gid'], ['goals.gid'], name=op.f('fk_goal_relationships_supporting_goal_gid_goals'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_goal_relationships'))
+    )
+    op.create_index(op.f('ix_goal_relationships_gid'), 'goal_relationships', ['gid'], unique=False)
+    op.create_index(op.f('ix_goal_relationships_supported_goal_gid'), 'goal_relationships', ['supported_goal_gid'], unique=False)
+    op.create_index(op.f('ix_goal_relationships_supporting_goal_gid'), 'goal_relationships', ['supporting_goal_gid'], unique=False)
+    op.create_table('portfolio_items',
+    sa.Column('order', sa.Integer(), nullable=False),
+    sa.Column('portfolio_gid', sa.String(length=32), nullable=False),
+    sa.Column('project_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['portfolio_gid'], ['portfolios.gid'], name=op.f('fk_portfolio_items_portfolio_gid_portfolios'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['project_gid'], ['projects.gid'], name=op.f('fk_portfolio_items_project_gid_projects'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_portfolio_items'))
+    )
+    op.create_index(op.f('ix_portfolio_items_gid'), 'portfolio_items', ['gid'], unique=False)
+    op.create_index(op.f('ix_portfolio_items_portfolio_gid'), 'portfolio_items', ['portfolio_gid'], unique=False)
+    op.create_index(op.f('ix_portfolio_items_project_gid'), 'portfolio_items', ['project_gid'], unique=False)
+    op.create_table('project_briefs',
+    sa.Column('title', sa.String(length=255), nullable=True),
+    sa.Column('text', sa.Text(), nullable=True),
+    sa.Column('html_text', sa.Text(), nullable=True),
+    sa.Column('project_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['project_gid'], ['projects.gid'], name=op.f('fk_project_briefs_project_gid_projects'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_project_briefs'))
+    )
+    op.create_index(op.f('ix_project_briefs_gid'), 'project_briefs', ['gid'], unique=False)
+    op.create_index(op.f('ix_project_briefs_project_gid'), 'project_briefs', ['project_gid'], unique=True)
+    op.create_table('project_memberships',
+    sa.Column('user_gid', sa.String(length=32), nullable=False),
+    sa.Column('project_gid', sa.String(length=32), nullable=False),
+    sa.Column('access_level', sa.String(length=50), nullable=False),
+    sa.Column('write_access', sa.String(length=50), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['project_gid'], ['projects.gid'], name=op.f('fk_project_memberships_project_gid_projects'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_gid'], ['users.gid'], name=op.f('fk_project_memberships_user_gid_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_project_memberships'))
+    )
+    op.create_index(op.f('ix_project_memberships_gid'), 'project_memberships', ['gid'], unique=False)
+    op.create_index(op.f('ix_project_memberships_project_gid'), 'project_memberships', ['project_gid'], unique=False)
+    op.create_index(op.f('ix_project_memberships_user_gid'), 'project_memberships', ['user_gid'], unique=False)
+    op.create_table('project_statuses',
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('text', sa.Text(), nullable=True),
+    sa.Column('html_text', sa.Text(), nullable=True),
+    sa.Column('color', sa.String(length=50), nullable=False),
+    sa.Column('project_gid', sa.String(length=32), nullable=False),
+    sa.Column('author_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['author_gid'], ['users.gid'], name=op.f('fk_project_statuses_author_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['project_gid'], ['projects.gid'], name=op.f('fk_project_statuses_project_gid_projects'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_project_statuses'))
+    )
+    op.create_index(op.f('ix_project_statuses_gid'), 'project_statuses', ['gid'], unique=False)
+    op.create_index(op.f('ix_project_statuses_project_gid'), 'project_statuses', ['project_gid'], unique=False)
+    op.create_table('sections',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('order', sa.Integer(), nullable=False),
+    sa.Column('project_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['project_gid'], ['projects.gid'], name=op.f('fk_sections_project_gid_projects'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_sections'))
+    )
+    op.create_index(op.f('ix_sections_gid'), 'sections', ['gid'], unique=False)
+    op.create_index(op.f('ix_sections_project_gid'), 'sections', ['project_gid'], unique=False)
+    op.create_table('status_updates',
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('text', sa.Text(), nullable=True),
+    sa.Column('html_text', sa.Text(), nullable=True),
+    sa.Column('status_type', sa.String(length=50), nullable=False),
+    sa.Column('resource_subtype', sa.String(length=50), nullable=False),
+    sa.Column('goal_gid', sa.String(length=32), nullable=True),
+    sa.Column('author_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['author_gid'], ['users.gid'], name=op.f('fk_status_updates_author_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['goal_gid'], ['goals.gid'], name=op.f('fk_status_updates_goal_gid_goals'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_status_updates'))
+    )
+    op.create_index(op.f('ix_status_updates_gid'), 'status_updates', ['gid'], unique=False)
+    op.create_index(op.f('ix_status_updates_goal_gid'), 'status_updates', ['goal_gid'], unique=False)
+    op.create_table('task_templates',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('template_data', sa.Text(), nullable=True),
+    sa.Column('project_gid', sa.String(length=32), nullable=True),
+    sa.Column('created_by_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['created_by_gid'], ['users.gid'], name=op.f('fk_task_templates_created_by_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['project_gid'], ['projects.gid'], name=op.f('fk_task_templates_project_gid_projects'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_task_templates'))
+    )
+    op.create_index(op.f('ix_task_templates_gid'), 'task_templates', ['gid'], unique=False)
+    op.create_index(op.f('ix_task_templates_project_gid'), 'task_templates', ['project_gid'], unique=False)
+    op.create_table('tasks',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('notes', sa.Text(), nullable=True),
+    sa.Column('html_notes', sa.Text(), nullable=True),
+    sa.Column('resource_subtype', sa.String(length=50), nullable=False),
+    sa.Column('completed', sa.Boolean(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('due_on', sa.Date(), nullable=True),
+    sa.Column('due_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('start_on', sa.Date(), nullable=True),
+    sa.Column('start_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('approval_status', sa.String(length=50), nullable=True),
+    sa.Column('liked', sa.Boolean(), nullable=False),
+    sa.Column('num_likes', sa.Integer(), nullable=False),
+    sa.Column('hearted', sa.Boolean(), nullable=False),
+    sa.Column('num_hearts', sa.Integer(), nullable=False),
+    sa.Column('num_subtasks', sa.Integer(), nullable=False),
+    sa.Column('order', sa.Integer(), nullable=False),
+    sa.Column('permalink_url', sa.String(length=500), nullable=True),
+    sa.Column('assignee_gid', sa.String(length=32), nullable=True),
+    sa.Column('assignee_status', sa.String(length=50), nullable=False),
+    sa.Column('section_gid', sa.String(length=32), nullable=True),
+    sa.Column('parent_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['assignee_gid'], ['users.gid'], name=op.f('fk_tasks_assignee_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['parent_gid'], ['tasks.gid'], name=op.f('fk_tasks_parent_gid_tasks'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['section_gid'], ['sections.gid'], name=op.f('fk_tasks_section_gid_sections'), ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_tasks'))
+    )
+    op.create_index(op.f('ix_tasks_assignee_gid'), 'tasks', ['assignee_gid'], unique=False)
+    op.create_index(op.f('ix_tasks_gid'), 'tasks', ['gid'], unique=False)
+    op.create_index(op.f('ix_tasks_parent_gid'), 'tasks', ['parent_gid'], unique=False)
+    op.create_index(op.f('ix_tasks_section_gid'), 'tasks', ['section_gid'], unique=False)
+    op.create_table('attachments',
+    sa.Column('name', sa.String(length=255), nullable=False),
+    sa.Column('resource_subtype', sa.String(length=50), nullable=False),
+    sa.Column('host', sa.String(length=50), nullable=False),
+    sa.Column('download_url', sa.Text(), nullable=True),
+    sa.Column('view_url', sa.Text(), nullable=True),
+    sa.Column('permanent_url', sa.Text(), nullable=True),
+    sa.Column('size', sa.Integer(), nullable=True),
+    sa.Column('connected_to_app', sa.Boolean(), nullable=False),
+    sa.Column('parent_gid', sa.String(length=32), nullable=False),
+    sa.Column('created_by_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['created_by_gid'], ['users.gid'], name=op.f('fk_attachments_created_by_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['parent_gid'], ['tasks.gid'], name=op.f('fk_attachments_parent_gid_tasks'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_attachments'))
+    )
+    op.create_index(op.f('ix_attachments_gid'), 'attachments', ['gid'], unique=False)
+    op.create_index(op.f('ix_attachments_parent_gid'), 'attachments', ['parent_gid'], unique=False)
+    op.create_table('stories',
+    sa.Column('resource_subtype', sa.String(length=50), nullable=False),
+    sa.Column('text', sa.Text(), nullable=True),
+    sa.Column('html_text', sa.Text(), nullable=True),
+    sa.Column('is_pinned', sa.Boolean(), nullable=False),
+    sa.Column('is_edited', sa.Boolean(), nullable=False),
+    sa.Column('liked', sa.Boolean(), nullable=False),
+    sa.Column('num_likes', sa.Integer(), nullable=False),
+    sa.Column('sticker_name', sa.String(length=100), nullable=True),
+    sa.Column('type', sa.String(length=50), nullable=False),
+    sa.Column('source', sa.String(length=50), nullable=False),
+    sa.Column('created_by_gid', sa.String(length=32), nullable=True),
+    sa.Column('target_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['created_by_gid'], ['users.gid'], name=op.f('fk_stories_created_by_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['target_gid'], ['tasks.gid'], name=op.f('fk_stories_target_gid_tasks'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_stories'))
+    )
+    op.create_index(op.f('ix_stories_created_by_gid'), 'stories', ['created_by_gid'], unique=False)
+    op.create_index(op.f('ix_stories_gid'), 'stories', ['gid'], unique=False)
+    op.create_index(op.f('ix_stories_target_gid'), 'stories', ['target_gid'], unique=False)
+    op.create_table('task_custom_field_values',
+    sa.Column('text_value', sa.Text(), nullable=True),
+    sa.Column('number_value', sa.Float(), nullable=True),
+    sa.Column('date_value', sa.String(length=50), nullable=True),
+    sa.Column('display_value', sa.String(length=500), nullable=True),
+    sa.Column('task_gid', sa.String(length=32), nullable=False),
+    sa.Column('custom_field_gid', sa.String(length=32), nullable=False),
+    sa.Column('enum_value_gid', sa.String(length=32), nullable=True),
+    sa.Column('multi_enum_values', sa.Text(), nullable=True),
+    sa.Column('people_values', sa.Text(), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['custom_field_gid'], ['custom_fields.gid'], name=op.f('fk_task_custom_field_values_custom_field_gid_custom_fields'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['enum_value_gid'], ['custom_field_enum_options.gid'], name=op.f('fk_task_custom_field_values_enum_value_gid_custom_field_enum_options'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['task_gid'], ['tasks.gid'], name=op.f('fk_task_custom_field_values_task_gid_tasks'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_task_custom_field_values'))
+    )
+    op.create_index(op.f('ix_task_custom_field_values_custom_field_gid'), 'task_custom_field_values', ['custom_field_gid'], unique=False)
+    op.create_index(op.f('ix_task_custom_field_values_gid'), 'task_custom_field_values', ['gid'], unique=False)
+    op.create_index(op.f('ix_task_custom_field_values_task_gid'), 'task_custom_field_values', ['task_gid'], unique=False)
+    op.create_table('task_dependencies',
+    sa.Column('task_gid', sa.String(length=32), nullable=False),
+    sa.Column('depends_on_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['depends_on_gid'], ['tasks.gid'], name=op.f('fk_task_dependencies_depends_on_gid_tasks'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['task_gid'], ['tasks.gid'], name=op.f('fk_task_dependencies_task_gid_tasks'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_task_dependencies'))
+    )
+    op.create_index(op.f('ix_task_dependencies_depends_on_gid'), 'task_dependencies', ['depends_on_gid'], unique=False)
+    op.create_index(op.f('ix_task_dependencies_gid'), 'task_dependencies', ['gid'], unique=False)
+    op.create_index(op.f('ix_task_dependencies_task_gid'), 'task_dependencies', ['task_gid'], unique=False)
+    op.create_table('task_followers',
+    sa.Column('task_gid', sa.String(length=32), nullable=False),
+    sa.Column('user_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['task_gid'], ['tasks.gid'], name=op.f('fk_task_followers_task_gid_tasks'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_gid'], ['users.gid'], name=op.f('fk_task_followers_user_gid_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_task_followers'))
+    )
+    op.create_index(op.f('ix_task_followers_gid'), 'task_followers', ['gid'], unique=False)
+    op.create_index(op.f('ix_task_followers_task_gid'), 'task_followers', ['task_gid'], unique=False)
+    op.create_index(op.f('ix_task_followers_user_gid'), 'task_followers', ['user_gid'], unique=False)
+    op.create_table('task_projects',
+    sa.Column('task_gid', sa.String(length=32), nullable=False),
+    sa.Column('project_gid', sa.String(length=32), nullable=False),
+    sa.Column('section_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['project_gid'], ['projects.gid'], name=op.f('fk_task_projects_project_gid_projects'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['section_gid'], ['sections.gid'], name=op.f('fk_task_projects_section_gid_sections'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['task_gid'], ['tasks.gid'], name=op.f('fk_task_projects_task_gid_tasks'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_task_projects'))
+    )
+    op.create_index(op.f('ix_task_projects_gid'), 'task_projects', ['gid'], unique=False)
+    op.create_index(op.f('ix_task_projects_project_gid'), 'task_projects', ['project_gid'], unique=False)
+    op.create_index(op.f('ix_task_projects_task_gid'), 'task_projects', ['task_gid'], unique=False)
+    op.create_table('task_tags',
+    sa.Column('task_gid', sa.String(length=32), nullable=False),
+    sa.Column('tag_gid', sa.String(length=32), nullable=False),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['tag_gid'], ['tags.gid'], name=op.f('fk_task_tags_tag_gid_tags'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['task_gid'], ['tasks.gid'], name=op.f('fk_task_tags_task_gid_tasks'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_task_tags'))
+    )
+    op.create_index(op.f('ix_task_tags_gid'), 'task_tags', ['gid'], unique=False)
+    op.create_index(op.f('ix_task_tags_tag_gid'), 'task_tags', ['tag_gid'], unique=False)
+    op.create_index(op.f('ix_task_tags_task_gid'), 'task_tags', ['task_gid'], unique=False)
+    op.create_table('time_tracking_entries',
+    sa.Column('duration_minutes', sa.Integer(), nullable=False),
+    sa.Column('entered_on', sa.Date(), nullable=False),
+    sa.Column('task_gid', sa.String(length=32), nullable=False),
+    sa.Column('created_by_gid', sa.String(length=32), nullable=True),
+    sa.Column('gid', sa.String(length=32), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['created_by_gid'], ['users.gid'], name=op.f('fk_time_tracking_entries_created_by_gid_users'), ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['task_gid'], ['tasks.gid'], name=op.f('fk_time_tracking_entries_task_gid_tasks'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('gid', name=op.f('pk_time_tracking_entries'))
+    )
+    op.create_index(op.f('ix_time_tracking_entries_gid'), 'time_tracking_entries', ['gid'], unique=False)
+    op.create_index(op.f('ix_time_tracking_entries_task_gid'), 'time_tracking_entries', ['task_gid'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_time_tracking_entries_task_gid'), table_name='time_tracking_entries')
+    op.drop_index(op.f('ix_time_tracking_entries_gid'), table_name='time_tracking_entries')
+    op.drop_table('time_tracking_entries')
+    op.drop_index(op.f('ix_task_tags_task_gid'), table_name='task_tags')
+    op.drop_index(op.f('ix_task_tags_tag_gid'), table_name='task_tags')
+    op.drop_index(op.f('ix_task_tags_gid'), table_name='task_tags')
+    op.drop_table('task_tags')
+    op.drop_index(op.f('ix_task_projects_task_gid'), table_name='task_projects')
+    op.drop_index(op.f('ix_task_projects_project_gid'), table_name='task_projects')
+    op.drop_index(op.f('ix_task_projects_gid'), table_name='task_projects')
+    op.drop_table('task_projects')
+    op.drop_index(op.f('ix_task_followers_user_gid'), table_name='task_followers')
+    op.drop_index(op.f('ix_task_followers_task_gid'), table_name='task_followers')
+    op.drop_index(op.f('ix_task_followers_gid'), table_name='task_followers')
+    op.drop_table('task_followers')
+    op.drop_index(op.f('ix_task_dependencies_task_gid'), table_name='task_dependencies')
+    op.drop_index(op.f('ix_task_dependencies_gid'), table_name='task_dependencies')
+    op.drop_index(op.f('ix_task_dependencies_depends_on_gid'), table_name='task_dependencies')
+    op.drop_table('task_dependencies')
+    op.drop_index(op.f('ix_task_custom_field_values_task_gid'), table_name='task_custom_field_values')
+    op.drop_index(op.f('ix_task_custom_field_values_gid'), table_name='task_custom_field_values')
+    op.drop_index(op.f('ix_task_custom_field_values_custom_field_gid'), table_name='task_custom_field_values')
+    op.drop_table('task_custom_field_values')
+    op.drop_index(op.f('ix_stories_target_gid'), table_name='stories')
+    op.drop_index(op.f('ix_stories_gid'), table_name='stories')
+    op.drop_index(op.f('ix_stories_created_by_gid'), table_name='stories')
+    op.drop_table('stories')
+    op.drop_index(op.f('ix_attachments_parent_gid'), table_name='attachments')
+    op.drop_index(op.f('ix_attachments_gid'), table_name='attachments')
+    op.drop_table('attachments')
+    op.drop_index(op.f('ix_tasks_section_gid'), table_name='tasks')
+    op.drop_index(op.f('ix_tasks_parent_gid'), table_name='tasks')
+    op.drop_index(op.f('ix_tasks_gid'), table_name='tasks')
+    op.drop_index(op.f('ix_tasks_assignee_gid'), table_name='tasks')
+    op.drop_table('tasks')
+    op.drop_index(op.f('ix_task_templates_project_gid'), table_name='task_templates')
+    op.drop_index(op.f('ix_task_templates_gid'), table_name='task_templates')
+    op.drop_table('task_templates')
+    op.drop_index(op.f('ix_status_updates_goal_gid'), table_name='status_updates')
+    op.drop_index(op.f('ix_status_updates_gid'), table_name='status_updates')
+    op.drop_table('status_updates')
+    op.drop_index(op.f('ix_sections_project_gid'), table_name='sections')
+    op.drop_index(op.f('ix_sections_gid'), table_name='sections')
+    op.drop_table('sections')
+    op.drop_index(op.f('ix_project_statuses_project_gid'), table_name='project_statuses')
+    op.drop_index(op.f('ix_project_statuses_gid'), table_name='project_statuses')
+    op.drop_table('project_statuses')
+    op.drop_index(op.f('ix_project_memberships_user_gid'), table_name='project_memberships')
+    op.drop_index(op.f('ix_project_memberships_project_gid'), table_name='project_memberships')
+    op.drop_index(op.f('ix_project_memberships_gid'), table_name='project_memberships')
+    op.drop_table('project_memberships')
+    op.drop_index(op.f('ix_project_briefs_project_gid'), table_name='project_briefs')
+    op.drop_index(op.f('ix_project_briefs_gid'), table_name='project_briefs')
+    op.drop_table('project_briefs')
+    op.drop_index(op.f('ix_portfolio_items_project_gid'), table_name='portfolio_items')
+    op.drop_index(op.f('ix_portfolio_items_portfolio_gid'), table_name='portfolio_items')
+    op.drop_index(op.f('ix_portfolio_items_gid'), table_name='portfolio_items')
+    op.drop_table('portfolio_items')
+    op.drop_index(op.f('ix_goal_relationships_supporting_goal_gid'), table_name='goal_relationships')
+    op.drop_index(op.f('ix_goal_relationships_supported_goal_gid'), table_name='goal_relationships')
+    op.drop_index(op.f('ix_goal_relationships_gid'), table_name='goal_relationships')
+    op.drop_table('goal_relationships')
+    op.drop_index(op.f('ix_goal_memberships_member_gid'), table_name='goal_memberships')
+    op.drop_index(op.f('ix_goal_memberships_goal_gid'), table_name='goal_memberships')
+    op.drop_index(op.f('ix_goal_memberships_gid'), table_name='goal_memberships')
+    op.drop_table('goal_memberships')
+    op.drop_index(op.f('ix_custom_field_settings_project_gid'), table_name='custom_field_settings')
+    op.drop_index(op.f('ix_custom_field_settings_gid'), table_name='custom_field_settings')
+    op.drop_index(op.f('ix_custom_field_settings_custom_field_gid'), table_name='custom_field_settings')
+    op.drop_table('custom_field_settings')
+    op.drop_index(op.f('ix_team_memberships_user_gid'), table_name='team_memberships')
+    op.drop_index(op.f('ix_team_memberships_team_gid'), table_name='team_memberships')
+    op.drop_index(op.f('ix_team_memberships_gid'), table_name='team_memberships')
+    op.drop_table('team_memberships')
+    op.drop_index(op.f('ix_projects_workspace_gid'), table_name='projects')
+    op.drop_index(op.f('ix_projects_team_gid'), table_name='projects')
+    op.drop_index(op.f('ix_projects_gid'), table_name='projects')
+    op.drop_table('projects')
+    op.drop_index(op.f('ix_project_templates_team_gid'), table_name='project_templates')
+    op.drop_index(op.f('ix_project_templates_gid'), table_name='project_templates')
+    op.drop_table('project_templates')
+    op.drop_index(op.f('ix_portfolio_memberships_user_gid'), table_name='portfolio_memberships')
+    op.drop_index(op.f('ix_portfolio_memberships_portfolio_gid'), table_name='portfolio_memberships')
+    op.drop_index(op.f('ix_portfolio_memberships_gid'), table_name='portfolio_memberships')
+    op.drop_table('portfolio_memberships')
+    op.drop_index(op.f('ix_goals_workspace_gid'), table_name='goals')
+    op.drop_index(op.f('ix_goals_gid'), table_name='goals')
+    op.drop_table('goals')
+    op.drop_index(op.f('ix_custom_field_enum_options_gid'), table_name='custom_field_enum_options')
+    op.drop_index(op.f('ix_custom_field_enum_options_custom_field_gid'), table_name='custom_field_enum_options')
+    op.drop_table('custom_field_enum_options')
+    op.drop_index(op.f('ix_workspace_memberships_workspace_gid'), table_name='workspace_memberships')
+    op.drop_index(op.f('ix_workspace_memberships_user_gid'), table_name='workspace_memberships')
+    op.drop_index(op.f('ix_workspace_memberships_gid'), table_name='workspace_memberships')
+    op.drop_table('workspace_memberships')
+    op.drop_index(op.f('ix_webhooks_resource_gid'), table_name='webhooks')
+    op.drop_index(op.f('ix_webhooks_gid'), table_name='webhooks')
+    op.drop_table('webhooks')
+    op.drop_index(op.f('ix_user_task_lists_workspace_gid'), table_name='user_task_lists')
+    op.drop_index(op.f('ix_user_task_lists_owner_gid'), table_name='user_task_lists')
+    op.drop_index(op.f('ix_user_task_lists_gid'), table_name='user_task_lists')
+    op.drop_table('user_task_lists')
+    op.drop_index(op.f('ix_user_favorites_workspace_gid'), table_name='user_favorites')
+    op.drop_index(op.f('ix_user_favorites_user_gid'), table_name='user_favorites')
+    op.drop_index(op.f('ix_user_favorites_resource_gid'), table_name='user_favorites')
+    op.drop_index(op.f('ix_user_favorites_gid'), table_name='user_favorites')
+    op.drop_table('user_favorites')
+    op.drop_index(op.f('ix_time_periods_parent_gid'), table_name='time_periods')
+    op.drop_index(op.f('ix_time_periods_gid'), table_name='time_periods')
+    op.drop_table('time_periods')
+    op.drop_index(op.f('ix_teams_workspace_gid'), table_name='teams')
+    op.drop_index(op.f('ix_teams_gid'), table_name='teams')
+    op.drop_table('teams')
+    op.drop_index(op.f('ix_tags_workspace_gid'), table_name='tags')
+    op.drop_index(op.f('ix_tags_gid'), table_name='tags')
+    op.drop_table('tags')
+    op.drop_index(op.f('ix_portfolios_workspace_gid'), table_name='portfolios')
+    op.drop_index(op.f('ix_portfolios_gid'), table_name='portfolios')
+    op.drop_table('portfolios')
+    op.drop_index(op.f('ix_organization_exports_organization_gid'), table_name='organization_exports')
+    op.drop_index(op.f('ix_organization_exports_gid'), table_name='organization_exports')
+    op.drop_table('organization_exports')
+    op.drop_index(op.f('ix_jobs_gid'), table_name='jobs')
+    op.drop_table('jobs')
+    op.drop_index(op.f('ix_event_records_resource_gid'), table_name='event_records')
+    op.drop_index(op.f('ix_event_records_parent_gid'), table_name='event_records')
+    op.drop_index(op.f('ix_event_records_gid'), table_name='event_records')
+    op.drop_table('event_records')
+    op.drop_index(op.f('ix_custom_fields_workspace_gid'), table_name='custom_fields')
+    op.drop_index(op.f('ix_custom_fields_gid'), table_name='custom_fields')
+    op.drop_table('custom_fields')
+    op.drop_index(op.f('ix_workspaces_gid'), table_name='workspaces')
+    op.drop_table('workspaces')
+    op.drop_index(op.f('ix_users_gid'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_audit_log_events_resource_gid'), table_name='audit_log_events')
+    op.drop_index(op.f('ix_audit_log_events_gid'), table_name='audit_log_events')
+    op.drop_index(op.f('ix_audit_log_events_event_type'), table_name='audit_log_events')
+    op.drop_index(op.f('ix_audit_log_events_event_category'), table_name='audit_log_events')
+    op.drop_index(op.f('ix_audit_log_events_context_gid'), table_name='audit_log_events')
+    op.drop_index(op.f('ix_audit_log_events_actor_gid'), table_name='audit_log_events')
+    op.drop_table('audit_log_events')
@@ -0,0 +1,86 @@
+"""Store created_at/modified_at as naive UTC timestamps
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every table of the baseline schema carries both columns
+TABLES = (
+    "attachments",
+    "audit_log_events",
+    "custom_field_enum_options",
+    "custom_field_settings",
+    "custom_fields",
+    "event_records",
+    "goal_memberships",
+    "goal_relationships",
+    "goals",
+    "jobs",
+    "organization_exports",
+    "portfolio_items",
+    "portfolio_memberships",
+    "portfolios",
+    "project_briefs",
+    "project_memberships",
+    "project_statuses",
+    "project_templates",
+    "projects",
+    "sections",
+    "status_updates",
+    "stories",
+    "tags",
+    "task_custom_field_values",
+    "task_dependencies",
+    "task_followers",
+    "task_projects",
+    "task_tags",
+    "task_templates",
+    "tasks",
+    "team_memberships",
+    "teams",
+    "time_periods",
+    "time_tracking_entries",
+    "user_favorites",
+    "user_task_lists",
+    "users",
+    "webhooks",
+    "workspace_memberships",
+    "workspaces",
+)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        for column in ("created_at", "modified_at"):
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=False),
+                server_default=sa.text("timezone('utc', now())"),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        for column in ("created_at", "modified_at"):
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=True),
+                server_default=sa.text("now()"),
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
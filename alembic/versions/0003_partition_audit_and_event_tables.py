@@ -0,0 +1,181 @@
+"""Range-partition audit_log_events and event_records by month, MessagePack payloads
+
+Partitioning cannot be switched on for an existing table, so both tables
+are rebuilt: the old table is renamed, the partitioned table is created
+with a DEFAULT partition, and the rows are copied over. The primary key
+becomes (created_at, gid) since Postgres requires the partition key in it.
+
+The JSON text in audit_log_events.details and event_records.change is
+re-encoded as MessagePack bytes. The composite context/category/time
+indexes replace the single-column context_gid, event_category and
+event_type indexes on audit_log_events.
+
+Monthly partitions are created by the application at startup; rows of
+those months are moved out of the DEFAULT partition then.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16 00:00:00
+
+"""
+import json
+from typing import Any, Callable, Optional, Sequence, Union
+
+import msgpack
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+
+def _audit_log_events_columns(payload_type: sa.types.TypeEngine) -> list:
+    return [
+        sa.Column("event_type", sa.String(length=100), nullable=False),
+        sa.Column("event_category", sa.String(length=100), nullable=False),
+        sa.Column("actor_type", sa.String(length=50), nullable=False),
+        sa.Column("actor_gid", sa.String(length=32), nullable=True),
+        sa.Column("actor_email", sa.String(length=255), nullable=True),
+        sa.Column("resource_type", sa.String(length=50), nullable=True),
+        sa.Column("resource_gid", sa.String(length=32), nullable=True),
+        sa.Column("resource_name", sa.String(length=255), nullable=True),
+        sa.Column("context_type", sa.String(length=50), nullable=False),
+        sa.Column("context_gid", sa.String(length=32), nullable=False),
+        sa.Column("details", payload_type, nullable=True),
+        sa.Column("client_ip", sa.String(length=50), nullable=True),
+        sa.Column("gid", sa.String(length=32), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=False),
+        sa.Column("modified_at", sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=False),
+    ]
+
+
+def _event_records_columns(payload_type: sa.types.TypeEngine) -> list:
+    return [
+        sa.Column("resource_gid", sa.String(length=32), nullable=False),
+        sa.Column("resource_type", sa.String(length=50), nullable=False),
+        sa.Column("parent_gid", sa.String(length=32), nullable=True),
+        sa.Column("parent_type", sa.String(length=50), nullable=True),
+        sa.Column("action", sa.String(length=50), nullable=False),
+        sa.Column("user_gid", sa.String(length=32), nullable=True),
+        sa.Column("change", payload_type, nullable=True),
+        sa.Column("gid", sa.String(length=32), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=False),
+        sa.Column("modified_at", sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=False),
+    ]
+
+
+# table -> (columns factory, payload column, indexes as (name, columns))
+TABLES = {
+    "audit_log_events": (
+        _audit_log_events_columns,
+        "details",
+        [
+            ("ix_audit_log_events_actor_gid", ["actor_gid"]),
+            ("ix_audit_log_events_gid", ["gid"]),
+            ("ix_audit_log_events_resource_gid", ["resource_gid"]),
+        ],
+    ),
+    "event_records": (
+        _event_records_columns,
+        "change",
+        [
+            ("ix_event_records_gid", ["gid"]),
+            ("ix_event_records_parent_gid", ["parent_gid"]),
+            ("ix_event_records_resource_gid", ["resource_gid"]),
+        ],
+    ),
+}
+
+AUDIT_SINGLE_COLUMN_INDEXES = [
+    ("ix_audit_log_events_context_gid", ["context_gid"]),
+    ("ix_audit_log_events_event_category", ["event_category"]),
+    ("ix_audit_log_events_event_type", ["event_type"]),
+]
+AUDIT_COMPOSITE_INDEXES = [
+    ("ix_audit_log_events_context_category_created", ["context_gid", "event_category", "created_at"]),
+    ("ix_audit_log_events_context_type_created", ["context_gid", "event_type", "created_at"]),
+]
+
+
+def _json_to_msgpack(value: str) -> bytes:
+    try:
+        payload = json.loads(value)
+    except ValueError:
+        payload = value
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def _msgpack_to_json(value: bytes) -> str:
+    return json.dumps(msgpack.unpackb(value, raw=False))
+
+
+def _copy_rows(source: str, target: str, columns: list, payload: str, convert: Callable[[Any], Any]) -> None:
+    """Copy every row of ``source`` into ``target``, converting the payload column in Python."""
+    bind = op.get_bind()
+    names = [column.name for column in columns]
+    target_table = sa.table(target, *[sa.column(name) for name in names])
+    result = bind.execute(sa.text(f"SELECT {', '.join(names)} FROM {source}"))
+    while True:
+        batch = result.mappings().fetchmany(BATCH_SIZE)
+        if not batch:
+            break
+        rows = []
+        for row in batch:
+            row = dict(row)
+            if row[payload] is not None:
+                row[payload] = convert(row[payload])
+            rows.append(row)
+        bind.execute(sa.insert(target_table), rows)
+
+
+def _create_table(table: str, columns: list, partitioned: bool, indexes: list) -> None:
+    kwargs = {"postgresql_partition_by": "RANGE (created_at)"} if partitioned else {}
+    primary_key = ["created_at", "gid"] if partitioned else ["gid"]
+    constraints = [sa.PrimaryKeyConstraint(*primary_key, name=f"pk_{table}")]
+    if table == "event_records":
+        constraints.append(sa.ForeignKeyConstraint(
+            ["user_gid"], ["users.gid"],
+            name="fk_event_records_user_gid_users", ondelete="SET NULL",
+        ))
+    op.create_table(table, *columns, *constraints, **kwargs)
+    for name, index_columns in indexes:
+        op.create_index(name, table, index_columns, unique=False)
+    if partitioned:
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def _rebuild(table: str, partitioned: bool, payload_type: sa.types.TypeEngine, convert: Callable[[Any], Any], extra_indexes: Optional[list] = None) -> None:
+    columns_for, payload, indexes = TABLES[table]
+    old = f"{table}_old"
+    op.rename_table(table, old)
+    # Constraint and index names are reused by the new table
+    op.execute(f"ALTER TABLE {old} DROP CONSTRAINT pk_{table}")
+    if table == "event_records":
+        op.execute(f"ALTER TABLE {old} DROP CONSTRAINT fk_event_records_user_gid_users")
+    op.execute(
+        f"DO $$ DECLARE name text; BEGIN "
+        f"FOR name IN SELECT indexname FROM pg_indexes WHERE tablename = '{old}' LOOP "
+        f"EXECUTE format('DROP INDEX %I', name); END LOOP; END $$"
+    )
+    columns = columns_for(payload_type)
+    _create_table(table, columns, partitioned, indexes + (extra_indexes or []))
+    _copy_rows(old, table, columns, payload, convert)
+    op.drop_table(old)
+
+
+def upgrade() -> None:
+    _rebuild("audit_log_events", True, sa.LargeBinary(), _json_to_msgpack, AUDIT_COMPOSITE_INDEXES)
+    _rebuild("event_records", True, sa.LargeBinary(), _json_to_msgpack)
+
+
+def downgrade() -> None:
+    # The partitions, including those created by the application, are
+    # copied through their parent and dropped with it
+    _rebuild("audit_log_events", False, sa.Text(), _msgpack_to_json, AUDIT_SINGLE_COLUMN_INDEXES)
+    _rebuild("event_records", False, sa.Text(), _msgpack_to_json)
@@ -0,0 +1,97 @@
+"""Store primary and foreign key GIDs as 8-byte binary
+
+The 16 hex character GIDs are decoded into the 8 raw bytes the GID column
+type stores. Foreign keys cannot span a type change, so every foreign key
+is dropped, the columns converted and the foreign keys restored from their
+recorded definitions.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> gid, foreign key and parent reference columns
+COLUMNS = {
+    "attachments": ("gid", "parent_gid", "created_by_gid"),
+    "audit_log_events": ("gid",),
+    "custom_field_enum_options": ("gid", "custom_field_gid"),
+    "custom_field_settings": ("gid", "custom_field_gid", "project_gid"),
+    "custom_fields": ("gid", "workspace_gid", "created_by_gid"),
+    "event_records": ("gid", "user_gid"),
+    "goal_memberships": ("gid", "goal_gid", "member_gid"),
+    "goal_relationships": ("gid", "supporting_goal_gid", "supported_goal_gid"),
+    "goals": ("gid", "workspace_gid", "owner_gid", "team_gid", "time_period_gid"),
+    "jobs": ("gid", "created_by_gid"),
+    "organization_exports": ("gid", "organization_gid", "created_by_gid"),
+    "portfolio_items": ("gid", "portfolio_gid", "project_gid"),
+    "portfolio_memberships": ("gid", "portfolio_gid", "user_gid"),
+    "portfolios": ("gid", "workspace_gid", "owner_gid"),
+    "project_briefs": ("gid", "project_gid"),
+    "project_memberships": ("gid", "user_gid", "project_gid"),
+    "project_statuses": ("gid", "project_gid", "author_gid"),
+    "project_templates": ("gid", "team_gid", "owner_gid"),
+    "projects": ("gid", "owner_gid", "workspace_gid", "team_gid"),
+    "sections": ("gid", "project_gid"),
+    "status_updates": ("gid", "goal_gid", "author_gid"),
+    "stories": ("gid", "created_by_gid", "target_gid"),
+    "tags": ("gid", "workspace_gid"),
+    "task_custom_field_values": ("gid", "task_gid", "custom_field_gid", "enum_value_gid"),
+    "task_dependencies": ("gid", "task_gid", "depends_on_gid"),
+    "task_followers": ("gid", "task_gid", "user_gid"),
+    "task_projects": ("gid", "task_gid", "project_gid", "section_gid"),
+    "task_tags": ("gid", "task_gid", "tag_gid"),
+    "task_templates": ("gid", "project_gid", "created_by_gid"),
+    "tasks": ("gid", "assignee_gid", "section_gid", "parent_gid"),
+    "team_memberships": ("gid", "user_gid", "team_gid"),
+    "teams": ("gid", "workspace_gid"),
+    "time_periods": ("gid", "parent_gid"),
+    "time_tracking_entries": ("gid", "task_gid", "created_by_gid"),
+    "user_favorites": ("gid", "user_gid", "workspace_gid"),
+    "user_task_lists": ("gid", "owner_gid", "workspace_gid"),
+    "users": ("gid",),
+    "webhooks": ("gid", "created_by_gid"),
+    "workspace_memberships": ("gid", "user_gid", "workspace_gid"),
+    "workspaces": ("gid",),
+}
+
+
+def _foreign_keys() -> list:
+    """(table, name, definition) of every foreign key; partitions inherit theirs."""
+    result = op.get_bind().execute(sa.text(
+        "SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid) "
+        "FROM pg_constraint "
+        "WHERE contype = 'f' AND conparentid = 0 "
+        "AND connamespace = 'public'::regnamespace"
+    ))
+    return [tuple(row) for row in result]
+
+
+def _convert(type_: sa.types.TypeEngine, using: str) -> None:
+    foreign_keys = _foreign_keys()
+    for table, name, _ in foreign_keys:
+        op.drop_constraint(name, table, type_="foreignkey")
+    for table, columns in COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=type_, postgresql_using=using.format(column))
+    for table, name, definition in foreign_keys:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} {definition}")
+
+
+def upgrade() -> None:
+    _convert(sa.LargeBinary(), "decode({}, 'hex')")
+
+
+def downgrade() -> None:
+    _convert(sa.String(length=32), "encode({}, 'hex')")
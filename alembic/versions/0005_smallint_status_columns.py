@@ -0,0 +1,63 @@
+"""Store low-cardinality status columns as SMALLINT codes
+
+Each name is stored as its position in the model's SmallEnum list. A value
+outside the list becomes NULL in a nullable column and the model default
+otherwise, since it could not be loaded through the SmallEnum type.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Optional, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUS_TYPES = ("on_track", "at_risk", "off_track", "on_hold", "complete")
+
+# (table, column, names in code order, fallback for unknown values)
+COLUMNS: Sequence[Tuple[str, str, Tuple[str, ...], Optional[str]]] = (
+    ("goals", "status", STATUS_TYPES, None),
+    ("goals", "metric_type", ("number", "percent", "currency"), None),
+    ("goal_memberships", "role", ("member", "follower", "commenter", "editor"), "member"),
+    ("status_updates", "status_type", STATUS_TYPES, "on_track"),
+    ("jobs", "status", ("not_started", "in_progress", "succeeded", "failed"), "not_started"),
+    ("organization_exports", "state", ("pending", "started", "finished", "error"), "pending"),
+    ("portfolio_memberships", "access_level", ("admin", "editor", "viewer"), "editor"),
+)
+
+
+def _case(column: str, pairs: Sequence[Tuple[str, str]], fallback: str) -> str:
+    whens = " ".join(f"WHEN {old} THEN {new}" for old, new in pairs)
+    return f"CASE {column} {whens} ELSE {fallback} END"
+
+
+def upgrade() -> None:
+    for table, column, names, fallback in COLUMNS:
+        pairs = [(f"'{name}'", str(code)) for code, name in enumerate(names)]
+        default = "NULL" if fallback is None else str(names.index(fallback))
+        op.alter_column(
+            table,
+            column,
+            type_=sa.SmallInteger(),
+            postgresql_using=_case(column, pairs, default),
+        )
+
+
+def downgrade() -> None:
+    for table, column, names, _ in COLUMNS:
+        pairs = [(str(code), f"'{name}'") for code, name in enumerate(names)]
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=50),
+            postgresql_using=_case(column, pairs, "NULL"),
+        )
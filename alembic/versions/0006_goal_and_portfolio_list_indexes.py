@@ -0,0 +1,46 @@
+"""Add composite indexes matching goal and portfolio list queries
+
+Each composite index leads with the column of the single-column index it
+replaces.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, replaced single-column index, column, composite index, columns)
+INDEXES = (
+    ("goals", "ix_goals_workspace_gid", "workspace_gid",
+     "ix_goals_workspace_name", ["workspace_gid", "name"]),
+    ("goal_relationships", "ix_goal_relationships_supported_goal_gid", "supported_goal_gid",
+     "ix_goal_relationships_supported_supporting", ["supported_goal_gid", "supporting_goal_gid"]),
+    ("status_updates", "ix_status_updates_goal_gid", "goal_gid",
+     "ix_status_updates_goal_created", ["goal_gid", "created_at"]),
+    ("portfolios", "ix_portfolios_workspace_gid", "workspace_gid",
+     "ix_portfolios_workspace_name", ["workspace_gid", "name"]),
+    ("portfolio_items", "ix_portfolio_items_portfolio_gid", "portfolio_gid",
+     "ix_portfolio_items_portfolio_order", ["portfolio_gid", "order"]),
+)
+
+
+def upgrade() -> None:
+    for table, old_name, _, name, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+        op.drop_index(old_name, table_name=table)
+
+
+def downgrade() -> None:
+    for table, old_name, column, name, _ in INDEXES:
+        op.create_index(old_name, table, [column], unique=False)
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,71 @@
+"""Collapse the goal metric_* columns into one JSONB column
+
+The metric is stored in its API response form. Goals without a
+metric_type had no metric in their responses and get a NULL metric.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# metric_type is a SMALLINT code into this list since 0005
+METRIC_TYPES = ("number", "percent", "currency")
+
+# metric key -> (column, type)
+METRIC_COLUMNS = {
+    "unit": ("metric_unit", sa.String(length=50)),
+    "precision": ("metric_precision", sa.Integer()),
+    "currency_code": ("metric_currency_code", sa.String(length=10)),
+    "initial_number_value": ("metric_initial_number_value", sa.Float()),
+    "target_number_value": ("metric_target_number_value", sa.Float()),
+    "current_number_value": ("metric_current_number_value", sa.Float()),
+}
+
+
+def upgrade() -> None:
+    op.add_column("goals", sa.Column("metric", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    metric_type = " ".join(
+        f"WHEN {code} THEN '{name}'" for code, name in enumerate(METRIC_TYPES)
+    )
+    fields = ", ".join(f"'{key}', {column}" for key, (column, _) in METRIC_COLUMNS.items())
+    op.execute(
+        f"UPDATE goals SET metric = jsonb_build_object("
+        f"'metric_type', CASE metric_type {metric_type} END, {fields}) "
+        f"WHERE metric_type IS NOT NULL"
+    )
+    op.drop_column("goals", "metric_type")
+    for column, _ in METRIC_COLUMNS.values():
+        op.drop_column("goals", column)
+
+
+def downgrade() -> None:
+    op.add_column("goals", sa.Column("metric_type", sa.SmallInteger(), nullable=True))
+    for column, type_ in METRIC_COLUMNS.values():
+        op.add_column("goals", sa.Column(column, type_, nullable=True))
+    metric_type = " ".join(
+        f"WHEN '{name}' THEN {code}" for code, name in enumerate(METRIC_TYPES)
+    )
+    fields = ", ".join(
+        f"{column} = (metric ->> '{key}')::{type_.compile(dialect=postgresql.dialect())}"
+        for key, (column, type_) in METRIC_COLUMNS.items()
+    )
+    op.execute(
+        f"UPDATE goals SET metric_type = CASE metric ->> 'metric_type' {metric_type} END, "
+        f"{fields} WHERE metric IS NOT NULL"
+    )
+    op.execute("UPDATE goals SET metric_precision = 0 WHERE metric_precision IS NULL")
+    op.alter_column("goals", "metric_precision", nullable=False)
+    op.drop_column("goals", "metric")
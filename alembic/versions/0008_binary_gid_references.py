@@ -0,0 +1,43 @@
+"""Store the remaining GID reference columns as 8-byte binary
+
+These reference other resources without a foreign key, so the columns are
+converted in place.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = {
+    "jobs": ("new_project_gid", "new_task_gid", "new_project_template_gid"),
+    "portfolios": ("current_status_update_gid",),
+    "projects": ("current_status_update_gid",),
+}
+
+
+def upgrade() -> None:
+    for table, columns in COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table, column, type_=sa.LargeBinary(), postgresql_using=f"decode({column}, 'hex')"
+            )
+
+
+def downgrade() -> None:
+    for table, columns in COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table, column, type_=sa.String(length=32), postgresql_using=f"encode({column}, 'hex')"
+            )
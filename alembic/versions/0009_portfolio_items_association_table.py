@@ -0,0 +1,54 @@
+"""Key portfolio_items by (portfolio_gid, project_gid)
+
+Items become a plain association table: the surrogate gid and created_at
+columns are dropped. A project listed more than once in a portfolio keeps
+its earliest item.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "DELETE FROM portfolio_items WHERE gid IN ("
+        "SELECT gid FROM (SELECT gid, row_number() OVER ("
+        "PARTITION BY portfolio_gid, project_gid ORDER BY created_at, gid) AS n "
+        "FROM portfolio_items) AS items WHERE n > 1)"
+    )
+    op.drop_index("ix_portfolio_items_gid", table_name="portfolio_items")
+    op.drop_constraint("pk_portfolio_items", "portfolio_items", type_="primary")
+    op.create_primary_key("pk_portfolio_items", "portfolio_items", ["portfolio_gid", "project_gid"])
+    op.drop_column("portfolio_items", "gid")
+    op.drop_column("portfolio_items", "created_at")
+
+
+def downgrade() -> None:
+    op.add_column("portfolio_items", sa.Column("gid", sa.LargeBinary(), nullable=True))
+    op.add_column(
+        "portfolio_items",
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=True),
+    )
+    # Fresh 8-byte gids; created_at is not known, modified_at is the closest
+    op.execute(
+        "UPDATE portfolio_items SET created_at = modified_at, "
+        "gid = decode(substr(md5(random()::text || clock_timestamp()::text), 1, 16), 'hex')"
+    )
+    op.alter_column("portfolio_items", "gid", nullable=False)
+    op.alter_column("portfolio_items", "created_at", nullable=False)
+    op.drop_constraint("pk_portfolio_items", "portfolio_items", type_="primary")
+    op.create_primary_key("pk_portfolio_items", "portfolio_items", ["gid"])
+    op.create_index("ix_portfolio_items_gid", "portfolio_items", ["gid"], unique=False)
@@ -0,0 +1,38 @@
+"""Add composite indexes matching task, section, story and project list queries
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, index, columns)
+INDEXES = (
+    ("projects", "ix_projects_workspace_archived_created", ["workspace_gid", "archived", "created_at"]),
+    ("project_statuses", "ix_project_statuses_project_created", ["project_gid", "created_at"]),
+    ("sections", "ix_sections_project_order", ["project_gid", "order"]),
+    ("stories", "ix_stories_target_created", ["target_gid", "created_at"]),
+    ("tasks", "ix_tasks_section_order", ["section_gid", "order"]),
+    ("tasks", "ix_tasks_parent_order", ["parent_gid", "order"]),
+    ("tasks", "ix_tasks_assignee_created", ["assignee_gid", "created_at"]),
+)
+
+
+def upgrade() -> None:
+    for table, name, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for table, name, _ in INDEXES:
+        op.drop_index(name, table_name=table)
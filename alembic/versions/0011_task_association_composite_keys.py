@@ -0,0 +1,70 @@
+"""Key the task association tables by composite primary keys
+
+task_projects, task_tags, task_dependencies and task_followers lose their
+surrogate gid and timestamp columns and are keyed by (task_gid, other).
+A pair listed more than once keeps its earliest row. The single-column
+indexes are replaced by the primary key, which leads with task_gid, and
+a (other, task_gid) index for lookups from the other side.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> (other key column, reverse lookup index)
+TABLES = {
+    "task_projects": ("project_gid", "ix_task_projects_project_task"),
+    "task_tags": ("tag_gid", "ix_task_tags_tag_task"),
+    "task_dependencies": ("depends_on_gid", "ix_task_dependencies_depends_on_task"),
+    "task_followers": ("user_gid", "ix_task_followers_user_task"),
+}
+
+
+def upgrade() -> None:
+    for table, (other, index) in TABLES.items():
+        op.execute(
+            f"DELETE FROM {table} WHERE gid IN ("
+            f"SELECT gid FROM (SELECT gid, row_number() OVER ("
+            f"PARTITION BY task_gid, {other} ORDER BY created_at, gid) AS n "
+            f"FROM {table}) AS rows WHERE n > 1)"
+        )
+        for column in ("gid", "task_gid", other):
+            op.drop_index(f"ix_{table}_{column}", table_name=table)
+        op.drop_constraint(f"pk_{table}", table, type_="primary")
+        op.create_primary_key(f"pk_{table}", table, ["task_gid", other])
+        op.create_index(index, table, [other, "task_gid"], unique=False)
+        for column in ("gid", "created_at", "modified_at"):
+            op.drop_column(table, column)
+
+
+def downgrade() -> None:
+    for table, (other, index) in TABLES.items():
+        op.add_column(table, sa.Column("gid", sa.LargeBinary(), nullable=True))
+        for column in ("created_at", "modified_at"):
+            op.add_column(
+                table,
+                sa.Column(column, sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=False),
+            )
+        # Fresh 8-byte gids
+        op.execute(
+            f"UPDATE {table} SET "
+            f"gid = decode(substr(md5(random()::text || clock_timestamp()::text), 1, 16), 'hex')"
+        )
+        op.alter_column(table, "gid", nullable=False)
+        op.drop_index(index, table_name=table)
+        op.drop_constraint(f"pk_{table}", table, type_="primary")
+        op.create_primary_key(f"pk_{table}", table, ["gid"])
+        for column in ("gid", "task_gid", other):
+            op.create_index(f"ix_{table}_{column}", table, [column], unique=False)
@@ -0,0 +1,55 @@
+"""Maintain tasks.num_subtasks with a trigger
+
+Installs the trigger the application installs with the tasks table and
+recounts num_subtasks from the existing subtasks, so the counter starts
+out correct.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE OR REPLACE FUNCTION bump_num_subtasks() RETURNS trigger AS $$\n"
+        "BEGIN\n"
+        "    IF TG_OP = 'UPDATE' AND OLD.parent_gid IS NOT DISTINCT FROM NEW.parent_gid THEN\n"
+        "        RETURN NULL;\n"
+        "    END IF;\n"
+        "    IF TG_OP <> 'INSERT' AND OLD.parent_gid IS NOT NULL THEN\n"
+        "        UPDATE tasks SET num_subtasks = num_subtasks - 1\n"
+        "        WHERE gid = OLD.parent_gid AND num_subtasks > 0;\n"
+        "    END IF;\n"
+        "    IF TG_OP <> 'DELETE' AND NEW.parent_gid IS NOT NULL THEN\n"
+        "        UPDATE tasks SET num_subtasks = num_subtasks + 1 WHERE gid = NEW.parent_gid;\n"
+        "    END IF;\n"
+        "    RETURN NULL;\n"
+        "END;\n"
+        "$$ LANGUAGE plpgsql"
+    )
+    op.execute(
+        "CREATE TRIGGER tasks_num_subtasks "
+        "AFTER INSERT OR DELETE OR UPDATE OF parent_gid ON tasks "
+        "FOR EACH ROW EXECUTE FUNCTION bump_num_subtasks()"
+    )
+    op.execute(
+        "UPDATE tasks SET num_subtasks = ("
+        "SELECT count(*) FROM tasks AS subtasks WHERE subtasks.parent_gid = tasks.gid)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER tasks_num_subtasks ON tasks")
+    op.execute("DROP FUNCTION bump_num_subtasks()")
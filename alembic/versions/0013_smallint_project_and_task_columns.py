@@ -0,0 +1,59 @@
+"""Store fixed-vocabulary project and task columns as SMALLINT codes
+
+Each name is stored as its position in the model's SmallEnum list. A value
+outside the list becomes NULL in a nullable column and the model default
+otherwise, since it could not be loaded through the SmallEnum type.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Optional, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, names in code order, fallback for unknown values)
+COLUMNS: Sequence[Tuple[str, str, Tuple[str, ...], Optional[str]]] = (
+    ("projects", "default_view", ("list", "board", "calendar", "timeline"), "list"),
+    ("projects", "privacy_setting", ("public_to_workspace", "private_to_team", "private"), "public_to_workspace"),
+    ("tasks", "resource_subtype", ("default_task", "milestone", "section", "approval"), "default_task"),
+    ("tasks", "approval_status", ("pending", "approved", "rejected", "changes_requested"), None),
+    ("tasks", "assignee_status", ("inbox", "today", "upcoming", "later", "new"), "upcoming"),
+)
+
+
+def _case(column: str, pairs: Sequence[Tuple[str, str]], fallback: str) -> str:
+    whens = " ".join(f"WHEN {old} THEN {new}" for old, new in pairs)
+    return f"CASE {column} {whens} ELSE {fallback} END"
+
+
+def upgrade() -> None:
+    for table, column, names, fallback in COLUMNS:
+        pairs = [(f"'{name}'", str(code)) for code, name in enumerate(names)]
+        default = "NULL" if fallback is None else str(names.index(fallback))
+        op.alter_column(
+            table,
+            column,
+            type_=sa.SmallInteger(),
+            postgresql_using=_case(column, pairs, default),
+        )
+
+
+def downgrade() -> None:
+    for table, column, names, _ in COLUMNS:
+        pairs = [(str(code), f"'{name}'") for code, name in enumerate(names)]
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=50),
+            postgresql_using=_case(column, pairs, "NULL"),
+        )
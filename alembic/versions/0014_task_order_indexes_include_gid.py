@@ -0,0 +1,37 @@
+"""Extend the task section and parent ordering indexes with gid
+
+Listings order by (order, gid), so the indexes cover the full ordering.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0014"
+down_revision: Union[str, None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# index -> leading column
+INDEXES = {
+    "ix_tasks_section_order": "section_gid",
+    "ix_tasks_parent_order": "parent_gid",
+}
+
+
+def upgrade() -> None:
+    for name, column in INDEXES.items():
+        op.drop_index(name, table_name="tasks")
+        op.create_index(name, "tasks", [column, "order", "gid"], unique=False)
+
+
+def downgrade() -> None:
+    for name, column in INDEXES.items():
+        op.drop_index(name, table_name="tasks")
+        op.create_index(name, "tasks", [column, "order"], unique=False)
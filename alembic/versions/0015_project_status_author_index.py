@@ -0,0 +1,25 @@
+"""Index project_statuses.author_gid
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0015"
+down_revision: Union[str, None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_project_statuses_author_gid", "project_statuses", ["author_gid"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_project_statuses_author_gid", table_name="project_statuses")
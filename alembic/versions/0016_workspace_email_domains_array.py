@@ -0,0 +1,40 @@
+"""Store workspace email domains as a varchar array
+
+The comma-separated lists are split into arrays; empty lists become NULL,
+which responses render as an empty list as before.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0016"
+down_revision: Union[str, None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "workspaces",
+        "email_domains",
+        type_=postgresql.ARRAY(sa.String(length=255)),
+        postgresql_using="string_to_array(NULLIF(email_domains, ''), ',')",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "workspaces",
+        "email_domains",
+        type_=sa.String(length=1000),
+        postgresql_using="array_to_string(email_domains, ',')",
+    )
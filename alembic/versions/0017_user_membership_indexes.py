@@ -0,0 +1,44 @@
+"""Index favorites, task lists and memberships by user and parent
+
+Each composite index leads with the column of the single-column index it
+replaces.
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0017"
+down_revision: Union[str, None] = "0016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, replaced single-column index, column, composite index, columns)
+INDEXES = (
+    ("team_memberships", "ix_team_memberships_user_gid", "user_gid",
+     "ix_team_memberships_user_team", ["user_gid", "team_gid"]),
+    ("user_favorites", "ix_user_favorites_user_gid", "user_gid",
+     "ix_user_favorites_user_workspace", ["user_gid", "workspace_gid"]),
+    ("user_task_lists", "ix_user_task_lists_owner_gid", "owner_gid",
+     "ix_user_task_lists_owner_workspace", ["owner_gid", "workspace_gid"]),
+    ("workspace_memberships", "ix_workspace_memberships_user_gid", "user_gid",
+     "ix_workspace_memberships_user_workspace", ["user_gid", "workspace_gid"]),
+)
+
+
+def upgrade() -> None:
+    for table, old_name, _, name, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+        op.drop_index(old_name, table_name=table)
+
+
+def downgrade() -> None:
+    for table, old_name, column, name, _ in INDEXES:
+        op.create_index(old_name, table, [column], unique=False)
+        op.drop_index(name, table_name=table)
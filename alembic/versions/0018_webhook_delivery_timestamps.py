@@ -0,0 +1,46 @@
+"""Store webhook delivery times as timestamps
+
+The ISO 8601 strings are parsed as timestamptz and stored as naive UTC.
+Strings without an offset are taken to be UTC, like naive values bound
+through UTCDateTime.
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0018"
+down_revision: Union[str, None] = "0017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = ("last_success_at", "last_failure_at")
+
+
+def upgrade() -> None:
+    op.execute("SET LOCAL TimeZone = 'UTC'")
+    for column in COLUMNS:
+        op.alter_column(
+            "webhooks",
+            column,
+            type_=sa.DateTime(),
+            postgresql_using=f"NULLIF({column}, '')::timestamptz AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    # Back to the isoformat() of an aware UTC datetime
+    for column in COLUMNS:
+        op.alter_column(
+            "webhooks",
+            column,
+            type_=sa.String(length=50),
+            postgresql_using=f"replace({column}::text, ' ', 'T') || '+00:00'",
+        )
@@ -0,0 +1,63 @@
+"""Store team visibility and access levels as SMALLINT codes
+
+Each name is stored as its position in the model's SmallEnum list. A value
+outside the list becomes NULL in a nullable column and the model default
+otherwise, since it could not be loaded through the SmallEnum type.
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-16 00:00:00
+
+"""
+from typing import Optional, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0019"
+down_revision: Union[str, None] = "0018"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TEAM_ACCESS_LEVELS = ("all_team_members", "only_team_admins")
+
+# (table, column, names in code order, fallback for unknown values)
+COLUMNS: Sequence[Tuple[str, str, Tuple[str, ...], Optional[str]]] = (
+    ("teams", "visibility", ("public", "members", "secret"), "members"),
+    ("teams", "edit_team_name_or_description_access_level", TEAM_ACCESS_LEVELS, "all_team_members"),
+    ("teams", "edit_team_visibility_or_trash_team_access_level", TEAM_ACCESS_LEVELS, "only_team_admins"),
+    ("teams", "guest_invite_management_access_level", TEAM_ACCESS_LEVELS, "only_team_admins"),
+    ("teams", "join_request_management_access_level", TEAM_ACCESS_LEVELS, "only_team_admins"),
+    ("teams", "member_invite_management_access_level", TEAM_ACCESS_LEVELS, "only_team_admins"),
+    ("teams", "team_member_removal_access_level", TEAM_ACCESS_LEVELS, "only_team_admins"),
+)
+
+
+def _case(column: str, pairs: Sequence[Tuple[str, str]], fallback: str) -> str:
+    whens = " ".join(f"WHEN {old} THEN {new}" for old, new in pairs)
+    return f"CASE {column} {whens} ELSE {fallback} END"
+
+
+def upgrade() -> None:
+    for table, column, names, fallback in COLUMNS:
+        pairs = [(f"'{name}'", str(code)) for code, name in enumerate(names)]
+        default = "NULL" if fallback is None else str(names.index(fallback))
+        op.alter_column(
+            table,
+            column,
+            type_=sa.SmallInteger(),
+            postgresql_using=_case(column, pairs, default),
+        )
+
+
+def downgrade() -> None:
+    for table, column, names, _ in COLUMNS:
+        pairs = [(str(code), f"'{name}'") for code, name in enumerate(names)]
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=50),
+            postgresql_using=_case(column, pairs, "NULL"),
+        )
@@ -1,5 +1,7 @@
-from typing import Optional, AsyncGenerator
-from fastapi import Depends, HTTPException, status, Query
+from typing import Optional, AsyncGenerator, Awaitable, Callable, Type, TypeVar
+from fastapi import Body, Depends, HTTPException, status, Query
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ValidationError, create_model
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -16,9 +18,40 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def data_body(model: Type[ModelT]) -> Callable[..., Awaitable[ModelT]]:
+    """
+    Dependency parsing an Asana ``{"data": {...}}`` request body into ``model``.
+    
+    The envelope is declared as a typed body parameter, so it is documented as
+    the operation's requestBody. An empty or missing body, or one without a
+    ``data`` key, validates ``model`` against an empty object.
+    """
+    envelope = create_model(
+        f"{model.__name__}Body",
+        data=(model, Field(default={}, validate_default=True)),
+    )
+    
+    async def parse(body: Optional[envelope] = Body(default=None)) -> ModelT:
+        if body is None:
+            try:
+                body = envelope()
+            except ValidationError as exc:
+                raise RequestValidationError(
+                    [{**error, "loc": ("body", *error["loc"])} for error in exc.errors()]
+                ) from exc
+        return body.data
+    
+    return parse
+
+
 class CommonQueryParams:
     """Common query parameters for list endpoints."""
     
+    __slots__ = ("limit", "offset", "opt_fields")
+    
     def __init__(
         self,
         limit: int = Query(default=settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE),
@@ -33,6 +66,8 @@ class CommonQueryParams:
 class WorkspaceQueryParams:
     """Query parameters that include workspace filter."""
     
+    __slots__ = ("workspace", "limit", "offset", "opt_fields")
+    
     def __init__(
         self,
         workspace: Optional[str] = Query(default=None, description="Workspace GID to filter by"),
@@ -49,6 +84,8 @@ class WorkspaceQueryParams:
 class ProjectQueryParams:
     """Query parameters that include project filter."""
     
+    __slots__ = ("project", "workspace", "limit", "offset", "opt_fields")
+    
     def __init__(
         self,
         project: Optional[str] = Query(default=None, description="Project GID to filter by"),
@@ -67,6 +104,11 @@ class ProjectQueryParams:
 class TaskQueryParams:
     """Query parameters for task list endpoints."""
     
+    __slots__ = (
+        "project", "section", "workspace", "assignee", "completed_since",
+        "modified_since", "limit", "offset", "opt_fields",
+    )
+    
     def __init__(
         self,
         project: Optional[str] = Query(default=None, description="Project GID to filter by"),
@@ -15,7 +15,7 @@ from app.core.exceptions import NotFoundError, ValidationError, ForbiddenError
 from app.core.security import generate_gid
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -86,10 +86,7 @@ async def get_access_requests(
         base_path="/access_requests",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
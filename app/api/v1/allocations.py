@@ -16,7 +16,7 @@ from app.core.exceptions import NotFoundError, ValidationError
 from app.core.security import generate_gid
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -88,10 +88,7 @@ async def get_allocations(
         base_path="/allocations",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
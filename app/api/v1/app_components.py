@@ -21,7 +21,7 @@ from app.core.exceptions import NotFoundError, ValidationError
 from app.core.security import generate_gid
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -79,10 +79,7 @@ async def get_modal_forms(
         base_path="/modal_forms",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @modal_forms_router.post("")
@@ -208,10 +205,7 @@ async def get_rule_actions(
         base_path="/rule_actions",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @rule_actions_router.post("")
@@ -362,10 +356,7 @@ async def get_lookups(
         base_path="/lookups",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @lookups_router.post("/{lookup_gid}/run")
@@ -14,7 +14,7 @@ from app.models.attachment import Attachment
 from app.schemas.attachment import AttachmentCreate
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, json_list_response, paginated_response
 from app.config import settings
 
 
@@ -41,6 +41,19 @@ async def get_attachments(
     )
     attachments = result.scalars().all()
     
+    if not params.opt_fields:
+        # Fast path: paginate rows first, then splice pre-encoded JSON
+        paginated = paginate(
+            attachments,
+            offset=params.offset,
+            limit=params.limit,
+            base_path="/attachments",
+        )
+        return json_list_response(
+            [a.to_response_json() for a in paginated.data],
+            paginated.next_page,
+        )
+    
     parser = OptFieldsParser(params.opt_fields)
     attachment_responses = [parser.filter(a.to_response()) for a in attachments]
     
@@ -51,10 +64,7 @@ async def get_attachments(
         base_path="/attachments",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
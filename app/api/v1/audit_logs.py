@@ -8,6 +8,7 @@ from sqlalchemy import select
 from app.api.deps import get_db, CommonQueryParams
 from app.models.audit_log import AuditLogEvent
 from app.utils.pagination import paginate
+from app.utils.response import paginated_response
 from app.utils.filters import OptFieldsParser
 
 
@@ -76,9 +77,6 @@ async def get_audit_log_events(
         base_path="/audit_log_events",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
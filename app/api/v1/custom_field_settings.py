@@ -18,7 +18,7 @@ from app.models.project import Project
 from app.models.portfolio import Portfolio
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -58,10 +58,7 @@ async def get_custom_field_settings_for_project(
         base_path="/custom_field_settings",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
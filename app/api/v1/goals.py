@@ -3,13 +3,23 @@ from typing import Any, Optional
 from fastapi import APIRouter, Depends, Query, Body
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import undefer_group
 
-from app.api.deps import get_db, CommonQueryParams
-from app.core.exceptions import NotFoundError
+from app.api.deps import get_db, data_body, CommonQueryParams
+from app.core.exceptions import NotFoundError, ValidationError
 from app.core.security import generate_gid
 from app.models.workspace import Workspace
 from app.models.team import Team
-from app.models.goal import Goal, GoalRelationship, StatusUpdate, GoalMembership
+from app.models.goal import (
+    Goal,
+    GoalRelationship,
+    StatusUpdate,
+    GoalMembership,
+    BODY_GROUP,
+    METRIC_TYPES,
+    goal_row_to_response,
+    write_goal_json,
+)
 from app.schemas.goal import (
     GoalCreate, GoalUpdate,
     GoalRelationshipCreate, GoalRelationshipUpdate,
@@ -17,7 +27,7 @@ from app.schemas.goal import (
 )
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, json_fragments_response, paginated_response
 
 
 router = APIRouter()
@@ -26,6 +36,21 @@ status_router = APIRouter()
 membership_router = APIRouter()
 
 
+async def _reload_goal(db: AsyncSession, goal_gid: str) -> None:
+    """
+    Reload a committed goal in place, including its deferred notes.
+    
+    ``db.refresh`` only reloads the non-deferred columns, which would leave
+    notes and html_notes out of the response.
+    """
+    await db.execute(
+        select(Goal)
+        .options(undefer_group(BODY_GROUP))
+        .where(Goal.gid == goal_gid)
+        .execution_options(populate_existing=True)
+    )
+
+
 @router.get("")
 async def get_goals(
     workspace: str = Query(..., description="Workspace GID"),
@@ -38,23 +63,31 @@ async def get_goals(
     """
     Get goals in a workspace.
     """
-    query = select(Goal).where(Goal.workspace_gid == workspace)
-    
-    if team:
-        query = query.where(Goal.team_gid == team)
-    
-    if is_workspace_level is not None:
-        query = query.where(Goal.is_workspace_level == is_workspace_level)
-    
-    if time_periods:
-        period_gids = [p.strip() for p in time_periods.split(",")]
-        query = query.where(Goal.time_period_gid.in_(period_gids))
+    period_gids = [p.strip() for p in time_periods.split(",")] if time_periods else None
+    goals = await Goal.list_rows(
+        db,
+        workspace,
+        team_gid=team,
+        is_workspace_level=is_workspace_level,
+        time_period_gids=period_gids,
+    )
     
-    result = await db.execute(query.order_by(Goal.name))
-    goals = result.scalars().all()
+    if not params.opt_fields:
+        # Fast path: paginate rows first, then encode straight into one buffer
+        paginated = paginate(
+            goals,
+            offset=params.offset,
+            limit=params.limit,
+            base_path="/goals",
+        )
+        return json_fragments_response(
+            paginated.data,
+            write_goal_json,
+            paginated.next_page,
+        )
     
     parser = OptFieldsParser(params.opt_fields)
-    goal_responses = [parser.filter(g.to_response()) for g in goals]
+    goal_responses = [parser.filter(goal_row_to_response(row)) for row in goals]
     
     paginated = paginate(
         goal_responses,
@@ -63,22 +96,17 @@ async def get_goals(
         base_path="/goals",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
 async def create_goal(
-    data: dict = Body(...),
+    goal_data: GoalCreate = Depends(data_body(GoalCreate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
     Create a new goal.
     """
-    goal_data = GoalCreate(**data.get("data", {}))
-    
     # Verify workspace exists
     result = await db.execute(select(Workspace).where(Workspace.gid == goal_data.workspace))
     if not result.scalar_one_or_none():
@@ -100,14 +128,8 @@ async def create_goal(
     )
     
     # Set metric if provided
-    if goal_data.metric:
-        goal.metric_type = goal_data.metric.metric_type
-        goal.metric_unit = goal_data.metric.unit
-        goal.metric_precision = goal_data.metric.precision
-        goal.metric_currency_code = goal_data.metric.currency_code
-        goal.metric_initial_number_value = goal_data.metric.initial_number_value
-        goal.metric_target_number_value = goal_data.metric.target_number_value
-        goal.metric_current_number_value = goal_data.metric.current_number_value
+    if goal_data.metric and goal_data.metric.metric_type:
+        goal.metric = goal_data.metric.model_dump()
     
     db.add(goal)
     await db.commit()
@@ -124,7 +146,7 @@ async def get_goal(
     """
     Get a goal by GID.
     """
-    result = await db.execute(select(Goal).where(Goal.gid == goal_gid))
+    result = await db.execute(select(Goal).options(undefer_group(BODY_GROUP)).where(Goal.gid == goal_gid))
     goal = result.scalar_one_or_none()
     
     if not goal:
@@ -137,26 +159,24 @@ async def get_goal(
 @router.put("/{goal_gid}")
 async def update_goal(
     goal_gid: str,
-    data: dict = Body(...),
+    update_data: GoalUpdate = Depends(data_body(GoalUpdate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
     Update a goal.
     """
-    result = await db.execute(select(Goal).where(Goal.gid == goal_gid))
+    result = await db.execute(select(Goal).options(undefer_group(BODY_GROUP)).where(Goal.gid == goal_gid))
     goal = result.scalar_one_or_none()
     
     if not goal:
         raise NotFoundError("Goal", goal_gid)
     
-    update_data = GoalUpdate(**data.get("data", {}))
-    
     for field, value in update_data.model_dump(exclude_unset=True).items():
         if value is not None:
             setattr(goal, field, value)
     
     await db.commit()
-    await db.refresh(goal)
+    await _reload_goal(db, goal_gid)
     
     return wrap_response(goal.to_response())
 
@@ -190,7 +210,7 @@ async def set_goal_metric(
     """
     Set the metric for a goal.
     """
-    result = await db.execute(select(Goal).where(Goal.gid == goal_gid))
+    result = await db.execute(select(Goal).options(undefer_group(BODY_GROUP)).where(Goal.gid == goal_gid))
     goal = result.scalar_one_or_none()
     
     if not goal:
@@ -198,16 +218,25 @@ async def set_goal_metric(
     
     metric_data = data.get("data", {}).get("metric", {})
     
-    goal.metric_type = metric_data.get("metric_type")
-    goal.metric_unit = metric_data.get("unit")
-    goal.metric_precision = metric_data.get("precision", 0)
-    goal.metric_currency_code = metric_data.get("currency_code")
-    goal.metric_initial_number_value = metric_data.get("initial_number_value")
-    goal.metric_target_number_value = metric_data.get("target_number_value")
-    goal.metric_current_number_value = metric_data.get("current_number_value")
+    metric_type = metric_data.get("metric_type")
+    if metric_type is not None and metric_type not in METRIC_TYPES:
+        raise ValidationError(f"Invalid metric_type: {metric_type}")
+    
+    if metric_type:
+        goal.metric = {
+            "metric_type": metric_type,
+            "unit": metric_data.get("unit"),
+            "precision": metric_data.get("precision", 0),
+            "currency_code": metric_data.get("currency_code"),
+            "initial_number_value": metric_data.get("initial_number_value"),
+            "target_number_value": metric_data.get("target_number_value"),
+            "current_number_value": metric_data.get("current_number_value"),
+        }
+    else:
+        goal.metric = None
     
     await db.commit()
-    await db.refresh(goal)
+    await _reload_goal(db, goal_gid)
     
     return wrap_response(goal.to_response())
 
@@ -221,18 +250,19 @@ async def set_goal_metric_current_value(
     """
     Set the current value of a goal's metric.
     """
-    result = await db.execute(select(Goal).where(Goal.gid == goal_gid))
+    result = await db.execute(select(Goal).options(undefer_group(BODY_GROUP)).where(Goal.gid == goal_gid))
     goal = result.scalar_one_or_none()
     
     if not goal:
         raise NotFoundError("Goal", goal_gid)
     
     current_value = data.get("data", {}).get("current_number_value")
-    if current_value is not None:
-        goal.metric_current_number_value = current_value
+    if current_value is not None and goal.metric:
+        # Assign a new dict so the JSONB change is detected
+        goal.metric = {**goal.metric, "current_number_value": current_value}
     
     await db.commit()
-    await db.refresh(goal)
+    await _reload_goal(db, goal_gid)
     
     return wrap_response(goal.to_response())
 
@@ -240,7 +270,7 @@ async def set_goal_metric_current_value(
 @router.post("/{goal_gid}/addSupportingRelationship")
 async def add_supporting_relationship(
     goal_gid: str,
-    data: dict = Body(...),
+    relationship_data: GoalRelationshipCreate = Depends(data_body(GoalRelationshipCreate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -252,8 +282,6 @@ async def add_supporting_relationship(
     if not goal:
         raise NotFoundError("Goal", goal_gid)
     
-    relationship_data = GoalRelationshipCreate(**data.get("data", {}))
-    
     relationship = GoalRelationship(
         gid=generate_gid(),
         supporting_goal_gid=relationship_data.supporting_resource,
@@ -300,14 +328,19 @@ async def get_parent_goals(
     """
     Get parent goals (goals this goal supports).
     """
-    result = await db.execute(
+    parser = OptFieldsParser(params.opt_fields)
+    
+    query = (
         select(Goal)
         .join(GoalRelationship, Goal.gid == GoalRelationship.supported_goal_gid)
         .where(GoalRelationship.supporting_goal_gid == goal_gid)
     )
+    if parser.has_field("notes") or parser.has_field("html_notes"):
+        query = query.options(undefer_group(BODY_GROUP))
+    
+    result = await db.execute(query)
     goals = result.scalars().all()
     
-    parser = OptFieldsParser(params.opt_fields)
     goal_responses = [parser.filter(g.to_response()) for g in goals]
     
     return {"data": goal_responses}
@@ -338,7 +371,7 @@ async def get_goal_relationship(
 @relationship_router.put("/{goal_relationship_gid}")
 async def update_goal_relationship(
     goal_relationship_gid: str,
-    data: dict = Body(...),
+    update_data: GoalRelationshipUpdate = Depends(data_body(GoalRelationshipUpdate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -352,8 +385,6 @@ async def update_goal_relationship(
     if not relationship:
         raise NotFoundError("GoalRelationship", goal_relationship_gid)
     
-    update_data = GoalRelationshipUpdate(**data.get("data", {}))
-    
     if update_data.contribution_weight is not None:
         relationship.contribution_weight = update_data.contribution_weight
     
@@ -396,7 +427,9 @@ async def get_status_update(
     Get a status update by GID.
     """
     result = await db.execute(
-        select(StatusUpdate).where(StatusUpdate.gid == status_update_gid)
+        select(StatusUpdate)
+        .options(undefer_group(BODY_GROUP))
+        .where(StatusUpdate.gid == status_update_gid)
     )
     status_update = result.scalar_one_or_none()
     
@@ -409,14 +442,12 @@ async def get_status_update(
 
 @status_router.post("")
 async def create_status_update(
-    data: dict = Body(...),
+    status_data: StatusUpdateCreate = Depends(data_body(StatusUpdateCreate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
     Create a status update for a goal.
     """
-    status_data = StatusUpdateCreate(**data.get("data", {}))
-    
     # Verify goal exists
     result = await db.execute(select(Goal).where(Goal.gid == status_data.parent))
     goal = result.scalar_one_or_none()
@@ -474,14 +505,19 @@ async def get_status_updates(
     
     Returns all status updates for the specified goal or project.
     """
-    result = await db.execute(
+    parser = OptFieldsParser(params.opt_fields)
+    
+    query = (
         select(StatusUpdate)
         .where(StatusUpdate.goal_gid == parent)
         .order_by(StatusUpdate.created_at.desc())
     )
+    if parser.has_field("text") or parser.has_field("html_text"):
+        query = query.options(undefer_group(BODY_GROUP))
+    
+    result = await db.execute(query)
     status_updates = result.scalars().all()
     
-    parser = OptFieldsParser(params.opt_fields)
     update_responses = [parser.filter(s.to_response()) for s in status_updates]
     
     paginated = paginate(
@@ -491,10 +527,7 @@ async def get_status_updates(
         base_path="/status_updates",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 # Additional Goal Relationship endpoints
@@ -525,15 +558,12 @@ async def get_goal_relationships(
         base_path="/goal_relationships",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @relationship_router.post("")
 async def create_goal_relationship(
-    data: dict = Body(...),
+    relationship_data: GoalRelationshipCreate = Depends(data_body(GoalRelationshipCreate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -541,8 +571,6 @@ async def create_goal_relationship(
     
     Creates a new supporting relationship between two goals.
     """
-    relationship_data = GoalRelationshipCreate(**data.get("data", {}))
-    
     relationship = GoalRelationship(
         gid=generate_gid(),
         supporting_goal_gid=relationship_data.supporting_resource,
@@ -589,10 +617,7 @@ async def get_goal_memberships(
         base_path="/goal_memberships",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @membership_router.get("/{goal_membership_gid}")
@@ -629,7 +654,7 @@ async def add_followers_to_goal(
     
     Adds followers to a goal. Returns the goal the followers were added to.
     """
-    result = await db.execute(select(Goal).where(Goal.gid == goal_gid))
+    result = await db.execute(select(Goal).options(undefer_group(BODY_GROUP)).where(Goal.gid == goal_gid))
     goal = result.scalar_one_or_none()
     
     if not goal:
@@ -670,7 +695,7 @@ async def remove_followers_from_goal(
     
     Removes followers from a goal. Returns the goal the followers were removed from.
     """
-    result = await db.execute(select(Goal).where(Goal.gid == goal_gid))
+    result = await db.execute(select(Goal).options(undefer_group(BODY_GROUP)).where(Goal.gid == goal_gid))
     goal = result.scalar_one_or_none()
     
     if not goal:
@@ -16,10 +16,10 @@ from app.core.security import generate_gid
 from app.models.workspace import WorkspaceMembership
 from app.models.team import TeamMembership
 from app.models.project import ProjectMembership
-from app.models.portfolio import PortfolioMembership
+from app.models.portfolio import PortfolioMembership, PORTFOLIO_ACCESS_LEVELS
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -82,10 +82,7 @@ async def get_memberships(
         base_path="/memberships",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
@@ -158,11 +155,14 @@ async def create_membership(
     from app.models.portfolio import Portfolio
     result = await db.execute(select(Portfolio).where(Portfolio.gid == parent))
     if result.scalar_one_or_none():
+        access_level = membership_data.get("access_level", "editor")
+        if access_level not in PORTFOLIO_ACCESS_LEVELS:
+            raise ValidationError(f"Invalid access_level: {access_level}")
         membership = PortfolioMembership(
             gid=generate_gid(),
             portfolio_gid=parent,
             user_gid=member,
-            access_level=membership_data.get("access_level", "editor"),
+            access_level=access_level,
         )
         db.add(membership)
         await db.commit()
@@ -273,6 +273,8 @@ async def update_membership(
     membership = result.scalar_one_or_none()
     if membership:
         if "access_level" in update_data:
+            if update_data["access_level"] not in PORTFOLIO_ACCESS_LEVELS:
+                raise ValidationError(f"Invalid access_level: {update_data['access_level']}")
             membership.access_level = update_data["access_level"]
         await db.commit()
         await db.refresh(membership)
@@ -11,7 +11,7 @@ from app.models.workspace import Workspace
 from app.models.organization_export import OrganizationExport
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -46,10 +46,7 @@ async def get_organization_exports(
         base_path="/organization_exports",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
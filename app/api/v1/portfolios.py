@@ -2,15 +2,15 @@ from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, Query, Body
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, select
 
-from app.api.deps import get_db, CommonQueryParams
+from app.api.deps import get_db, data_body, CommonQueryParams
 from app.core.exceptions import NotFoundError, ValidationError
 from app.core.security import generate_gid
 from app.models.user import User
 from app.models.workspace import Workspace
 from app.models.project import Project
-from app.models.portfolio import Portfolio, PortfolioMembership, PortfolioItem
+from app.models.portfolio import Portfolio, PortfolioMembership, portfolio_items
 from app.schemas.portfolio import (
     PortfolioCreate, PortfolioUpdate,
     AddItemRequest, RemoveItemRequest,
@@ -18,7 +18,7 @@ from app.schemas.portfolio import (
 )
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -53,22 +53,17 @@ async def get_portfolios(
         base_path="/portfolios",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
 async def create_portfolio(
-    data: dict = Body(...),
+    portfolio_data: PortfolioCreate = Depends(data_body(PortfolioCreate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
     Create a new portfolio.
     """
-    portfolio_data = PortfolioCreate(**data.get("data", {}))
-    
     # Verify workspace exists
     result = await db.execute(select(Workspace).where(Workspace.gid == portfolio_data.workspace))
     if not result.scalar_one_or_none():
@@ -130,7 +125,7 @@ async def get_portfolio(
 @router.put("/{portfolio_gid}")
 async def update_portfolio(
     portfolio_gid: str,
-    data: dict = Body(...),
+    update_data: PortfolioUpdate = Depends(data_body(PortfolioUpdate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -142,8 +137,6 @@ async def update_portfolio(
     if not portfolio:
         raise NotFoundError("Portfolio", portfolio_gid)
     
-    update_data = PortfolioUpdate(**data.get("data", {}))
-    
     if update_data.name is not None:
         portfolio.name = update_data.name
     if update_data.color is not None:
@@ -192,9 +185,9 @@ async def get_portfolio_items(
     
     result = await db.execute(
         select(Project)
-        .join(PortfolioItem, Project.gid == PortfolioItem.project_gid)
-        .where(PortfolioItem.portfolio_gid == portfolio_gid)
-        .order_by(PortfolioItem.order)
+        .join(portfolio_items, Project.gid == portfolio_items.c.project_gid)
+        .where(portfolio_items.c.portfolio_gid == portfolio_gid)
+        .order_by(portfolio_items.c.order)
     )
     projects = result.scalars().all()
     
@@ -208,16 +201,13 @@ async def get_portfolio_items(
         base_path=f"/portfolios/{portfolio_gid}/items",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("/{portfolio_gid}/addItem")
 async def add_portfolio_item(
     portfolio_gid: str,
-    data: dict = Body(...),
+    request_data: AddItemRequest = Depends(data_body(AddItemRequest)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -229,8 +219,6 @@ async def add_portfolio_item(
     if not portfolio:
         raise NotFoundError("Portfolio", portfolio_gid)
     
-    request_data = AddItemRequest(**data.get("data", {}))
-    
     # Verify project exists
     result = await db.execute(select(Project).where(Project.gid == request_data.item))
     if not result.scalar_one_or_none():
@@ -238,30 +226,28 @@ async def add_portfolio_item(
     
     # Check if already in portfolio
     result = await db.execute(
-        select(PortfolioItem)
-        .where(PortfolioItem.portfolio_gid == portfolio_gid)
-        .where(PortfolioItem.project_gid == request_data.item)
+        select(portfolio_items.c.project_gid)
+        .where(portfolio_items.c.portfolio_gid == portfolio_gid)
+        .where(portfolio_items.c.project_gid == request_data.item)
     )
     if result.scalar_one_or_none():
         return wrap_response(portfolio.to_response())
     
     # Get max order
     result = await db.execute(
-        select(PortfolioItem)
-        .where(PortfolioItem.portfolio_gid == portfolio_gid)
-        .order_by(PortfolioItem.order.desc())
-        .limit(1)
+        select(func.max(portfolio_items.c.order))
+        .where(portfolio_items.c.portfolio_gid == portfolio_gid)
     )
-    last_item = result.scalar_one_or_none()
-    order = (last_item.order + 1) if last_item else 0
-    
-    item = PortfolioItem(
-        gid=generate_gid(),
-        portfolio_gid=portfolio_gid,
-        project_gid=request_data.item,
-        order=order,
+    last_order = result.scalar_one()
+    order = (last_order + 1) if last_order is not None else 0
+    
+    await db.execute(
+        insert(portfolio_items).values(
+            portfolio_gid=portfolio_gid,
+            project_gid=request_data.item,
+            order=order,
+        )
     )
-    db.add(item)
     await db.commit()
     
     return wrap_response(portfolio.to_response())
@@ -270,7 +256,7 @@ async def add_portfolio_item(
 @router.post("/{portfolio_gid}/removeItem")
 async def remove_portfolio_item(
     portfolio_gid: str,
-    data: dict = Body(...),
+    request_data: RemoveItemRequest = Depends(data_body(RemoveItemRequest)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -282,17 +268,12 @@ async def remove_portfolio_item(
     if not portfolio:
         raise NotFoundError("Portfolio", portfolio_gid)
     
-    request_data = RemoveItemRequest(**data.get("data", {}))
-    
     result = await db.execute(
-        select(PortfolioItem)
-        .where(PortfolioItem.portfolio_gid == portfolio_gid)
-        .where(PortfolioItem.project_gid == request_data.item)
+        delete(portfolio_items)
+        .where(portfolio_items.c.portfolio_gid == portfolio_gid)
+        .where(portfolio_items.c.project_gid == request_data.item)
     )
-    item = result.scalar_one_or_none()
-    
-    if item:
-        await db.delete(item)
+    if result.rowcount:
         await db.commit()
     
     return wrap_response(portfolio.to_response())
@@ -301,7 +282,7 @@ async def remove_portfolio_item(
 @router.post("/{portfolio_gid}/addMembers")
 async def add_portfolio_members(
     portfolio_gid: str,
-    data: dict = Body(...),
+    members_data: AddMembersRequest = Depends(data_body(AddMembersRequest)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -313,8 +294,7 @@ async def add_portfolio_members(
     if not portfolio:
         raise NotFoundError("Portfolio", portfolio_gid)
     
-    members_str = data.get("data", {}).get("members", "")
-    member_gids = [m.strip() for m in members_str.split(",") if m.strip()]
+    member_gids = members_data.members
     
     for user_gid in member_gids:
         result = await db.execute(
@@ -339,7 +319,7 @@ async def add_portfolio_members(
 @router.post("/{portfolio_gid}/removeMembers")
 async def remove_portfolio_members(
     portfolio_gid: str,
-    data: dict = Body(...),
+    members_data: RemoveMembersRequest = Depends(data_body(RemoveMembersRequest)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -351,8 +331,7 @@ async def remove_portfolio_members(
     if not portfolio:
         raise NotFoundError("Portfolio", portfolio_gid)
     
-    members_str = data.get("data", {}).get("members", "")
-    member_gids = [m.strip() for m in members_str.split(",") if m.strip()]
+    member_gids = members_data.members
     
     for user_gid in member_gids:
         result = await db.execute(
@@ -421,10 +400,7 @@ async def get_portfolio_memberships(
         base_path="/portfolio_memberships",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 # Additional Portfolio endpoints
@@ -11,7 +11,7 @@ from app.models.team import Team
 from app.models.project import ProjectTemplate
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -27,7 +27,10 @@ async def get_project_templates(
     """
     Get project templates.
     """
-    query = select(ProjectTemplate)
+    parser = OptFieldsParser(params.opt_fields)
+    query = select(ProjectTemplate).options(
+        *parser.defer_unrequested(ProjectTemplate.description, ProjectTemplate.html_description)
+    )
     
     if team:
         query = query.where(ProjectTemplate.team_gid == team)
@@ -41,7 +44,6 @@ async def get_project_templates(
     result = await db.execute(query.order_by(ProjectTemplate.name))
     templates = result.scalars().all()
     
-    parser = OptFieldsParser(params.opt_fields)
     template_responses = [parser.filter(t.to_response()) for t in templates]
     
     paginated = paginate(
@@ -51,10 +53,7 @@ async def get_project_templates(
         base_path="/project_templates",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.get("/{project_template_gid}")
@@ -101,8 +100,7 @@ async def instantiate_project_from_template(
     project_data = data.get("data", {})
     
     # Get team's workspace
-    result = await db.execute(select(Team).where(Team.gid == template.team_gid))
-    team = result.scalar_one_or_none()
+    team = await db.get(Team, template.team_gid)
     
     # Create project from template
     project = Project(
@@ -175,8 +173,7 @@ async def get_project_template_team(
     if not template.team_gid:
         raise NotFoundError("Team", "None")
     
-    result = await db.execute(select(Team).where(Team.gid == template.team_gid))
-    team = result.scalar_one_or_none()
+    team = await db.get(Team, template.team_gid)
     
     if not team:
         raise NotFoundError("Team", template.team_gid)
@@ -1,11 +1,11 @@
 from typing import Any, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query, Body
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
-from app.api.deps import get_db, CommonQueryParams
+from app.api.deps import get_db, data_body, CommonQueryParams
 from app.core.exceptions import NotFoundError, ForbiddenError, ValidationError
 from app.core.security import generate_gid
 from app.models.user import User
@@ -13,10 +13,10 @@ from app.models.workspace import Workspace, WorkspaceMembership
 from app.models.team import Team
 from app.models.project import Project, ProjectMembership, ProjectStatus, ProjectBrief
 from app.models.section import Section
-from app.models.task import Task, TaskProject
+from app.models.task import Task, TaskProject, task_row_to_response
 from app.schemas.project import (
     ProjectCreate, ProjectUpdate, ProjectDuplicateRequest,
-    AddMembersRequest, RemoveMembersRequest, AddFollowersRequest,
+    AddMembersRequest, RemoveMembersRequest, AddFollowersRequest, RemoveFollowersRequest,
     TaskCountsResponse, ProjectStatusCreate,
     ProjectBriefCreate, ProjectBriefUpdate,
     SaveAsTemplateRequest, AddCustomFieldRequest, RemoveCustomFieldRequest,
@@ -24,7 +24,7 @@ from app.schemas.project import (
 )
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -44,7 +44,8 @@ async def get_projects(
     """
     Get multiple projects.
     """
-    query = select(Project)
+    parser = OptFieldsParser(params.opt_fields)
+    query = select(Project).options(*parser.defer_unrequested(Project.notes, Project.html_notes))
     
     if workspace:
         query = query.where(Project.workspace_gid == workspace)
@@ -58,7 +59,6 @@ async def get_projects(
     result = await db.execute(query.order_by(Project.created_at.desc()))
     projects = result.scalars().all()
     
-    parser = OptFieldsParser(params.opt_fields)
     project_responses = [parser.filter(p.to_response()) for p in projects]
     
     paginated = paginate(
@@ -68,25 +68,19 @@ async def get_projects(
         base_path="/projects",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
 async def create_project(
-    data: dict = Body(...),
+    project_data: ProjectCreate = Depends(data_body(ProjectCreate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
     Create a new project.
     """
-    project_data = ProjectCreate(**data.get("data", {}))
-    
     # Verify workspace exists
-    result = await db.execute(select(Workspace).where(Workspace.gid == project_data.workspace))
-    workspace = result.scalar_one_or_none()
+    workspace = await db.get(Workspace, project_data.workspace)
     if not workspace:
         raise NotFoundError("Workspace", project_data.workspace)
     
@@ -168,7 +162,7 @@ async def get_project(
 @router.put("/{project_gid}")
 async def update_project(
     project_gid: str,
-    data: dict = Body(...),
+    update_data: ProjectUpdate = Depends(data_body(ProjectUpdate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -180,8 +174,6 @@ async def update_project(
     if not project:
         raise NotFoundError("Project", project_gid)
     
-    update_data = ProjectUpdate(**data.get("data", {}))
-    
     for field, value in update_data.model_dump(exclude_unset=True).items():
         if value is not None:
             setattr(project, field, value)
@@ -220,7 +212,7 @@ async def delete_project(
 @router.post("/{project_gid}/duplicate")
 async def duplicate_project(
     project_gid: str,
-    data: dict = Body(...),
+    dup_data: ProjectDuplicateRequest = Depends(data_body(ProjectDuplicateRequest)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -232,8 +224,6 @@ async def duplicate_project(
     if not project:
         raise NotFoundError("Project", project_gid)
     
-    dup_data = ProjectDuplicateRequest(**data.get("data", {}))
-    
     # Create new project
     new_project = Project(
         gid=generate_gid(),
@@ -288,38 +278,19 @@ async def get_project_task_counts(
     if not project:
         raise NotFoundError("Project", project_gid)
     
-    # Count tasks
-    result = await db.execute(
-        select(func.count(Task.gid))
-        .join(TaskProject, Task.gid == TaskProject.task_gid)
-        .where(TaskProject.project_gid == project_gid)
-    )
-    total = result.scalar() or 0
-    
+    # Count tasks, completed tasks and milestones in one pass over the project's tasks
+    is_milestone = Task.resource_subtype == "milestone"
     result = await db.execute(
-        select(func.count(Task.gid))
-        .join(TaskProject, Task.gid == TaskProject.task_gid)
-        .where(TaskProject.project_gid == project_gid)
-        .where(Task.completed == True)
-    )
-    completed = result.scalar() or 0
-    
-    result = await db.execute(
-        select(func.count(Task.gid))
-        .join(TaskProject, Task.gid == TaskProject.task_gid)
-        .where(TaskProject.project_gid == project_gid)
-        .where(Task.resource_subtype == "milestone")
-    )
-    milestones = result.scalar() or 0
-    
-    result = await db.execute(
-        select(func.count(Task.gid))
+        select(
+            func.count(Task.gid),
+            func.count(Task.gid).filter(Task.completed),
+            func.count(Task.gid).filter(is_milestone),
+            func.count(Task.gid).filter(is_milestone, Task.completed),
+        )
         .join(TaskProject, Task.gid == TaskProject.task_gid)
         .where(TaskProject.project_gid == project_gid)
-        .where(Task.resource_subtype == "milestone")
-        .where(Task.completed == True)
     )
-    completed_milestones = result.scalar() or 0
+    total, completed, milestones, completed_milestones = result.one()
     
     return wrap_response({
         "num_tasks": total,
@@ -334,7 +305,7 @@ async def get_project_task_counts(
 @router.post("/{project_gid}/addMembers")
 async def add_project_members(
     project_gid: str,
-    data: dict = Body(...),
+    members_data: AddMembersRequest = Depends(data_body(AddMembersRequest)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -346,26 +317,9 @@ async def add_project_members(
     if not project:
         raise NotFoundError("Project", project_gid)
     
-    members_str = data.get("data", {}).get("members", "")
-    member_gids = [m.strip() for m in members_str.split(",") if m.strip()]
-    
-    for user_gid in member_gids:
-        # Check if already a member
-        result = await db.execute(
-            select(ProjectMembership)
-            .where(ProjectMembership.project_gid == project_gid)
-            .where(ProjectMembership.user_gid == user_gid)
-        )
-        if not result.scalar_one_or_none():
-            membership = ProjectMembership(
-                gid=generate_gid(),
-                user_gid=user_gid,
-                project_gid=project_gid,
-                access_level="editor",
-                write_access="full_write",
-            )
-            db.add(membership)
+    member_gids = members_data.members
     
+    await ProjectMembership.bulk_add(db, project_gid, member_gids)
     await db.commit()
     
     return wrap_response(project.to_response())
@@ -374,7 +328,7 @@ async def add_project_members(
 @router.post("/{project_gid}/removeMembers")
 async def remove_project_members(
     project_gid: str,
-    data: dict = Body(...),
+    members_data: RemoveMembersRequest = Depends(data_body(RemoveMembersRequest)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -386,8 +340,7 @@ async def remove_project_members(
     if not project:
         raise NotFoundError("Project", project_gid)
     
-    members_str = data.get("data", {}).get("members", "")
-    member_gids = [m.strip() for m in members_str.split(",") if m.strip()]
+    member_gids = members_data.members
     
     for user_gid in member_gids:
         result = await db.execute(
@@ -434,10 +387,7 @@ async def get_project_sections(
         base_path=f"/projects/{project_gid}/sections",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.get("/{project_gid}/tasks")
@@ -454,18 +404,16 @@ async def get_project_tasks(
     if not result.scalar_one_or_none():
         raise NotFoundError("Project", project_gid)
     
+    parser = OptFieldsParser(params.opt_fields)
     query = (
-        select(Task)
+        Task.select_rows(with_notes=parser.has_field("notes") or parser.has_field("html_notes"))
         .join(TaskProject, Task.gid == TaskProject.task_gid)
         .where(TaskProject.project_gid == project_gid)
         .order_by(Task.created_at.desc())
     )
     
     result = await db.execute(query)
-    tasks = result.scalars().all()
-    
-    parser = OptFieldsParser(params.opt_fields)
-    task_responses = [parser.filter(t.to_response()) for t in tasks]
+    task_responses = [parser.filter(task_row_to_response(row)) for row in result.all()]
     
     paginated = paginate(
         task_responses,
@@ -474,10 +422,7 @@ async def get_project_tasks(
         base_path=f"/projects/{project_gid}/tasks",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.get("/{project_gid}/project_statuses")
@@ -493,14 +438,15 @@ async def get_project_statuses(
     if not result.scalar_one_or_none():
         raise NotFoundError("Project", project_gid)
     
+    parser = OptFieldsParser(params.opt_fields)
     result = await db.execute(
         select(ProjectStatus)
+        .options(*parser.defer_unrequested(ProjectStatus.text, ProjectStatus.html_text))
         .where(ProjectStatus.project_gid == project_gid)
         .order_by(ProjectStatus.created_at.desc())
     )
     statuses = result.scalars().all()
     
-    parser = OptFieldsParser(params.opt_fields)
     status_responses = [parser.filter(s.to_response()) for s in statuses]
     
     paginated = paginate(
@@ -510,16 +456,13 @@ async def get_project_statuses(
         base_path=f"/projects/{project_gid}/project_statuses",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("/{project_gid}/project_statuses")
 async def create_project_status(
     project_gid: str,
-    data: dict = Body(...),
+    status_data: ProjectStatusCreate = Depends(data_body(ProjectStatusCreate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -531,8 +474,6 @@ async def create_project_status(
     if not project:
         raise NotFoundError("Project", project_gid)
     
-    status_data = ProjectStatusCreate(**data.get("data", {}))
-    
     status = ProjectStatus(
         gid=generate_gid(),
         title=status_data.title,
@@ -603,10 +544,7 @@ async def get_project_memberships(
         base_path="/project_memberships",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 # Project Status Router
@@ -678,7 +616,7 @@ async def get_project_brief(
 @brief_router.put("/{project_brief_gid}")
 async def update_project_brief(
     project_brief_gid: str,
-    data: dict = Body(...),
+    update_data: ProjectBriefUpdate = Depends(data_body(ProjectBriefUpdate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -692,8 +630,6 @@ async def update_project_brief(
     if not brief:
         raise NotFoundError("ProjectBrief", project_brief_gid)
     
-    update_data = ProjectBriefUpdate(**data.get("data", {}))
-    
     if update_data.title is not None:
         brief.title = update_data.title
     if update_data.text is not None:
@@ -733,7 +669,7 @@ async def delete_project_brief(
 @router.post("/{project_gid}/addFollowers")
 async def add_project_followers(
     project_gid: str,
-    data: dict = Body(...),
+    followers_data: AddFollowersRequest = Depends(data_body(AddFollowersRequest)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -748,8 +684,7 @@ async def add_project_followers(
     if not project:
         raise NotFoundError("Project", project_gid)
     
-    followers_str = data.get("data", {}).get("followers", "")
-    follower_gids = [f.strip() for f in followers_str.split(",") if f.strip()]
+    follower_gids = followers_data.followers
     
     for user_gid in follower_gids:
         # Check if already a member (followers are members in our model)
@@ -776,7 +711,7 @@ async def add_project_followers(
 @router.post("/{project_gid}/removeFollowers")
 async def remove_project_followers(
     project_gid: str,
-    data: dict = Body(...),
+    followers_data: RemoveFollowersRequest = Depends(data_body(RemoveFollowersRequest)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -790,8 +725,7 @@ async def remove_project_followers(
     if not project:
         raise NotFoundError("Project", project_gid)
     
-    followers_str = data.get("data", {}).get("followers", "")
-    follower_gids = [f.strip() for f in followers_str.split(",") if f.strip()]
+    follower_gids = followers_data.followers
     
     for user_gid in follower_gids:
         result = await db.execute(
@@ -812,7 +746,7 @@ async def remove_project_followers(
 @router.post("/{project_gid}/addCustomFieldSetting")
 async def add_custom_field_setting_to_project(
     project_gid: str,
-    data: dict = Body(...),
+    setting_request: AddCustomFieldRequest = Depends(data_body(AddCustomFieldRequest)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -832,8 +766,6 @@ async def add_custom_field_setting_to_project(
         raise NotFoundError("Project", project_gid)
     
     # Parse request using schema
-    setting_request = AddCustomFieldRequest(**data.get("data", {}))
-    
     # Check if already added
     result = await db.execute(
         select(CustomFieldSetting)
@@ -859,7 +791,7 @@ async def add_custom_field_setting_to_project(
 @router.post("/{project_gid}/removeCustomFieldSetting")
 async def remove_custom_field_setting_from_project(
     project_gid: str,
-    data: dict = Body(...),
+    remove_request: RemoveCustomFieldRequest = Depends(data_body(RemoveCustomFieldRequest)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -878,8 +810,6 @@ async def remove_custom_field_setting_from_project(
         raise NotFoundError("Project", project_gid)
     
     # Parse request using schema
-    remove_request = RemoveCustomFieldRequest(**data.get("data", {}))
-    
     result = await db.execute(
         select(CustomFieldSetting)
         .where(CustomFieldSetting.project_gid == project_gid)
@@ -897,7 +827,7 @@ async def remove_custom_field_setting_from_project(
 @router.post("/{project_gid}/saveAsTemplate")
 async def save_project_as_template(
     project_gid: str,
-    data: dict = Body(...),
+    template_request: SaveAsTemplateRequest = Depends(data_body(SaveAsTemplateRequest)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -920,8 +850,6 @@ async def save_project_as_template(
         raise NotFoundError("Project", project_gid)
     
     # Parse request using schema
-    template_request = SaveAsTemplateRequest(**data.get("data", {}))
-    
     template = ProjectTemplate(
         gid=generate_gid(),
         name=template_request.name,
@@ -950,7 +878,7 @@ async def save_project_as_template(
 @router.post("/{project_gid}/project_brief")
 async def create_project_brief(
     project_gid: str,
-    data: dict = Body(...),
+    brief_data: ProjectBriefCreate = Depends(data_body(ProjectBriefCreate)),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """
@@ -965,8 +893,6 @@ async def create_project_brief(
     if not project:
         raise NotFoundError("Project", project_gid)
     
-    brief_data = ProjectBriefCreate(**data.get("data", {}))
-    
     brief = ProjectBrief(
         gid=generate_gid(),
         title=brief_data.title,
@@ -9,11 +9,11 @@ from app.core.exceptions import NotFoundError, ValidationError
 from app.core.security import generate_gid
 from app.models.project import Project
 from app.models.section import Section
-from app.models.task import Task, TaskProject
+from app.models.task import Task, TaskProject, task_row_to_response
 from app.schemas.section import SectionCreate, SectionUpdate, AddTaskRequest
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -49,10 +49,7 @@ async def get_sections(
         base_path="/sections",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
@@ -216,7 +213,6 @@ async def add_task_to_section(
         task_project.section_gid = section_gid
     else:
         task_project = TaskProject(
-            gid=generate_gid(),
             task_gid=task_gid,
             project_gid=section.project_gid,
             section_gid=section_gid,
@@ -243,15 +239,13 @@ async def get_section_tasks(
     if not section:
         raise NotFoundError("Section", section_gid)
     
+    parser = OptFieldsParser(params.opt_fields)
     result = await db.execute(
-        select(Task)
+        Task.select_rows(with_notes=parser.has_field("notes") or parser.has_field("html_notes"))
         .where(Task.section_gid == section_gid)
-        .order_by(Task.order)
+        .order_by(Task.order, Task.gid)
     )
-    tasks = result.scalars().all()
-    
-    parser = OptFieldsParser(params.opt_fields)
-    task_responses = [parser.filter(t.to_response()) for t in tasks]
+    task_responses = [parser.filter(task_row_to_response(row)) for row in result.all()]
     
     paginated = paginate(
         task_responses,
@@ -260,10 +254,7 @@ async def get_section_tasks(
         base_path=f"/sections/{section_gid}/tasks",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("/{section_gid}/insert")
@@ -12,7 +12,7 @@ from app.models.story import Story
 from app.schemas.story import StoryCreate, StoryUpdate
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -115,14 +115,15 @@ async def get_stories(
     if not result.scalar_one_or_none():
         raise NotFoundError("Task", task)
     
+    parser = OptFieldsParser(params.opt_fields)
     result = await db.execute(
         select(Story)
+        .options(*parser.defer_unrequested(Story.text, Story.html_text))
         .where(Story.target_gid == task)
         .order_by(Story.created_at)
     )
     stories = result.scalars().all()
     
-    parser = OptFieldsParser(params.opt_fields)
     story_responses = [parser.filter(s.to_response()) for s in stories]
     
     paginated = paginate(
@@ -132,10 +133,7 @@ async def get_stories(
         base_path="/stories",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
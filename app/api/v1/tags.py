@@ -9,11 +9,11 @@ from app.core.exceptions import NotFoundError, ValidationError
 from app.core.security import generate_gid
 from app.models.workspace import Workspace
 from app.models.tag import Tag
-from app.models.task import Task, TaskTag
+from app.models.task import Task, TaskTag, task_row_to_response
 from app.schemas.tag import TagCreate, TagUpdate
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -32,14 +32,15 @@ async def get_tags(
     if not result.scalar_one_or_none():
         raise NotFoundError("Workspace", workspace)
     
+    parser = OptFieldsParser(params.opt_fields)
     result = await db.execute(
         select(Tag)
+        .options(*parser.defer_unrequested(Tag.notes))
         .where(Tag.workspace_gid == workspace)
         .order_by(Tag.name)
     )
     tags = result.scalars().all()
     
-    parser = OptFieldsParser(params.opt_fields)
     tag_responses = [parser.filter(t.to_response()) for t in tags]
     
     paginated = paginate(
@@ -49,10 +50,7 @@ async def get_tags(
         base_path="/tags",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
@@ -165,16 +163,14 @@ async def get_tag_tasks(
     if not result.scalar_one_or_none():
         raise NotFoundError("Tag", tag_gid)
     
+    parser = OptFieldsParser(params.opt_fields)
     result = await db.execute(
-        select(Task)
+        Task.select_rows(with_notes=parser.has_field("notes") or parser.has_field("html_notes"))
         .join(TaskTag, Task.gid == TaskTag.task_gid)
         .where(TaskTag.tag_gid == tag_gid)
         .order_by(Task.created_at.desc())
     )
-    tasks = result.scalars().all()
-    
-    parser = OptFieldsParser(params.opt_fields)
-    task_responses = [parser.filter(t.to_response()) for t in tasks]
+    task_responses = [parser.filter(task_row_to_response(row)) for row in result.all()]
     
     paginated = paginate(
         task_responses,
@@ -183,10 +179,7 @@ async def get_tag_tasks(
         base_path=f"/tags/{tag_gid}/tasks",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
@@ -234,14 +227,15 @@ async def get_tags_for_workspace(
     if not result.scalar_one_or_none():
         raise NotFoundError("Workspace", workspace_gid)
     
+    parser = OptFieldsParser(params.opt_fields)
     result = await db.execute(
         select(Tag)
+        .options(*parser.defer_unrequested(Tag.notes))
         .where(Tag.workspace_gid == workspace_gid)
         .order_by(Tag.name)
     )
     tags = result.scalars().all()
     
-    parser = OptFieldsParser(params.opt_fields)
     tag_responses = [parser.filter(t.to_response()) for t in tags]
     
     paginated = paginate(
@@ -251,9 +245,6 @@ async def get_tags_for_workspace(
         base_path=f"/workspaces/{workspace_gid}/tags",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
@@ -11,7 +11,7 @@ from app.models.project import Project
 from app.models.task import Task, TaskTemplate, TaskProject
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -30,14 +30,15 @@ async def get_task_templates(
     if not result.scalar_one_or_none():
         raise NotFoundError("Project", project)
     
+    parser = OptFieldsParser(params.opt_fields)
     result = await db.execute(
         select(TaskTemplate)
+        .options(*parser.defer_unrequested(TaskTemplate.description))
         .where(TaskTemplate.project_gid == project)
         .order_by(TaskTemplate.name)
     )
     templates = result.scalars().all()
     
-    parser = OptFieldsParser(params.opt_fields)
     template_responses = [parser.filter(t.to_response()) for t in templates]
     
     paginated = paginate(
@@ -47,10 +48,7 @@ async def get_task_templates(
         base_path="/task_templates",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.get("/{task_template_gid}")
@@ -107,7 +105,6 @@ async def instantiate_task_from_template(
     # Add to project if template has project
     if template.project_gid:
         task_project = TaskProject(
-            gid=generate_gid(),
             task_gid=task.gid,
             project_gid=template.project_gid,
         )
@@ -12,7 +12,7 @@ from app.core.security import generate_gid
 from app.models.workspace import Workspace
 from app.models.project import Project
 from app.models.section import Section
-from app.models.task import Task, TaskProject, TaskTag, TaskDependency, TaskFollower
+from app.models.task import Task, TaskProject, TaskTag, TaskDependency, TaskFollower, task_row_to_response
 from app.models.tag import Tag
 from app.models.tag import Tag
 from app.schemas.task import (
@@ -25,7 +25,7 @@ from app.schemas.task import (
 )
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -39,7 +39,8 @@ async def get_tasks(
     """
     Get multiple tasks with various filters.
     """
-    query = select(Task)
+    parser = OptFieldsParser(params.opt_fields)
+    query = Task.select_rows(with_notes=parser.has_field("notes") or parser.has_field("html_notes"))
     
     if params.project:
         query = (
@@ -56,10 +57,7 @@ async def get_tasks(
     query = query.order_by(Task.created_at.desc())
     
     result = await db.execute(query)
-    tasks = result.scalars().all()
-    
-    parser = OptFieldsParser(params.opt_fields)
-    task_responses = [parser.filter(t.to_response()) for t in tasks]
+    task_responses = [parser.filter(task_row_to_response(row)) for row in result.all()]
     
     paginated = paginate(
         task_responses,
@@ -68,10 +66,7 @@ async def get_tasks(
         base_path="/tasks",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
@@ -112,50 +107,20 @@ async def create_task(
     db.add(task)
     await db.flush()
     
-    # Add to projects
+    # Add to projects, tags and followers (one INSERT each)
     if task_data.projects:
-        for project_gid in task_data.projects:
-            task_project = TaskProject(
-                gid=generate_gid(),
-                task_gid=task.gid,
-                project_gid=project_gid,
-            )
-            db.add(task_project)
-    
-    # Add tags
+        await TaskProject.bulk_add(db, task.gid, task_data.projects)
     if task_data.tags:
-        for tag_gid in task_data.tags:
-            task_tag = TaskTag(
-                gid=generate_gid(),
-                task_gid=task.gid,
-                tag_gid=tag_gid,
-            )
-            db.add(task_tag)
-    
-    # Add followers
+        await TaskTag.bulk_add(db, task.gid, task_data.tags)
     if task_data.followers:
-        for user_gid in task_data.followers:
-            follower = TaskFollower(
-                gid=generate_gid(),
-                task_gid=task.gid,
-                user_gid=user_gid,
-            )
-            db.add(follower)
+        await TaskFollower.bulk_add(db, task.gid, task_data.followers)
     
     # Always add creator as follower
     creator_follower = TaskFollower(
-        gid=generate_gid(),
         task_gid=task.gid,
     )
     db.add(creator_follower)
     
-    # Update parent task's subtask count
-    if task_data.parent:
-        result = await db.execute(select(Task).where(Task.gid == task_data.parent))
-        parent = result.scalar_one_or_none()
-        if parent:
-            parent.num_subtasks += 1
-    
     await db.commit()
     
     return wrap_response(task.to_response())
@@ -180,9 +145,12 @@ async def search_tasks(
     """
     Search for tasks in a workspace.
     """
+    parser = OptFieldsParser(opt_fields)
+    
     # Start with tasks in projects within the workspace
     query = (
         select(Task)
+        .options(*parser.defer_unrequested(Task.notes, Task.html_notes))
         .distinct()
         .join(TaskProject, Task.gid == TaskProject.task_gid)
         .join(Project, TaskProject.project_gid == Project.gid)
@@ -231,7 +199,6 @@ async def search_tasks(
     result = await db.execute(query)
     tasks = result.scalars().all()
     
-    parser = OptFieldsParser(opt_fields)
     task_responses = [parser.filter(t.to_response()) for t in tasks]
     
     paginated = paginate(
@@ -241,10 +208,7 @@ async def search_tasks(
         base_path="/tasks/search",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.get("/{task_gid}")
@@ -347,13 +311,6 @@ async def delete_task(
     if not task:
         raise NotFoundError("Task", task_gid)
     
-    # Update parent's subtask count
-    if task.parent_gid:
-        result = await db.execute(select(Task).where(Task.gid == task.parent_gid))
-        parent = result.scalar_one_or_none()
-        if parent and parent.num_subtasks > 0:
-            parent.num_subtasks -= 1
-    
     await db.delete(task)
     await db.commit()
     
@@ -391,36 +348,33 @@ async def duplicate_task(
         parent_gid=task.parent_gid if "parent" in include else None,
     )
     db.add(new_task)
+    # Association rows have no relationship to order them after the task
     await db.flush()
+    rows = []
     
     # Copy projects
     if "projects" in include:
         result = await db.execute(
             select(TaskProject).where(TaskProject.task_gid == task_gid)
         )
-        for tp in result.scalars().all():
-            new_tp = TaskProject(
-                gid=generate_gid(),
+        rows.extend(
+            TaskProject(
                 task_gid=new_task.gid,
                 project_gid=tp.project_gid,
                 section_gid=tp.section_gid,
             )
-            db.add(new_tp)
+            for tp in result.scalars().all()
+        )
     
     # Copy tags
     if "tags" in include:
         result = await db.execute(
             select(TaskTag).where(TaskTag.task_gid == task_gid)
         )
-        for tt in result.scalars().all():
-            new_tt = TaskTag(
-                gid=generate_gid(),
-                task_gid=new_task.gid,
-                tag_gid=tt.tag_gid,
-            )
-            db.add(new_tt)
-    
-    await db.commit()
+        rows.extend(
+            TaskTag(task_gid=new_task.gid, tag_gid=tt.tag_gid)
+            for tt in result.scalars().all()
+        )
     
     # Return job response
     from app.models.job import Job
@@ -430,7 +384,10 @@ async def duplicate_task(
         status="succeeded",
         new_task_gid=new_task.gid,
     )
-    db.add(job)
+    rows.append(job)
+    
+    # The copies and the job go in with the commit's single flush
+    db.add_all(rows)
     await db.commit()
     
     return wrap_response(job.to_response())
@@ -451,15 +408,13 @@ async def get_subtasks(
     if not result.scalar_one_or_none():
         raise NotFoundError("Task", task_gid)
     
+    parser = OptFieldsParser(opt_fields)
     result = await db.execute(
-        select(Task)
+        Task.select_rows(with_notes=parser.has_field("notes") or parser.has_field("html_notes"))
         .where(Task.parent_gid == task_gid)
-        .order_by(Task.order)
+        .order_by(Task.order, Task.gid)
     )
-    subtasks = result.scalars().all()
-    
-    parser = OptFieldsParser(opt_fields)
-    subtask_responses = [parser.filter(t.to_response()) for t in subtasks]
+    subtask_responses = [parser.filter(task_row_to_response(row)) for row in result.all()]
     
     paginated = paginate(
         subtask_responses,
@@ -468,10 +423,7 @@ async def get_subtasks(
         base_path=f"/tasks/{task_gid}/subtasks",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("/{task_gid}/subtasks")
@@ -513,20 +465,11 @@ async def set_parent(
     request_data = SetParentRequest(**data.get("data", {}))
     new_parent_gid = request_data.parent
     
-    # Update old parent's subtask count
-    if task.parent_gid:
-        result = await db.execute(select(Task).where(Task.gid == task.parent_gid))
-        old_parent = result.scalar_one_or_none()
-        if old_parent and old_parent.num_subtasks > 0:
-            old_parent.num_subtasks -= 1
-    
-    # Update new parent's subtask count
-    result = await db.execute(select(Task).where(Task.gid == new_parent_gid))
-    new_parent = result.scalar_one_or_none()
-    if not new_parent:
+    # Subtask counts are maintained by the tasks_num_subtasks trigger
+    result = await db.execute(select(Task.gid).where(Task.gid == new_parent_gid))
+    if result.scalar_one_or_none() is None:
         raise NotFoundError("Task", new_parent_gid)
     
-    new_parent.num_subtasks += 1
     task.parent_gid = new_parent_gid
     
     await db.commit()
@@ -550,14 +493,15 @@ async def get_dependencies(
     if not result.scalar_one_or_none():
         raise NotFoundError("Task", task_gid)
     
+    parser = OptFieldsParser(opt_fields)
     result = await db.execute(
         select(Task)
+        .options(*parser.defer_unrequested(Task.notes, Task.html_notes))
         .join(TaskDependency, Task.gid == TaskDependency.depends_on_gid)
         .where(TaskDependency.task_gid == task_gid)
     )
     dependencies = result.scalars().all()
     
-    parser = OptFieldsParser(opt_fields)
     dep_responses = [parser.filter(t.to_response()) for t in dependencies]
     
     paginated = paginate(
@@ -567,10 +511,7 @@ async def get_dependencies(
         base_path=f"/tasks/{task_gid}/dependencies",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("/{task_gid}/addDependencies")
@@ -600,7 +541,6 @@ async def add_dependencies(
         )
         if not result.scalar_one_or_none():
             dependency = TaskDependency(
-                gid=generate_gid(),
                 task_gid=task_gid,
                 depends_on_gid=dep_gid,
             )
@@ -669,14 +609,15 @@ async def get_dependents(
     if not result.scalar_one_or_none():
         raise NotFoundError("Task", task_gid)
     
+    parser = OptFieldsParser(opt_fields)
     result = await db.execute(
         select(Task)
+        .options(*parser.defer_unrequested(Task.notes, Task.html_notes))
         .join(TaskDependency, Task.gid == TaskDependency.task_gid)
         .where(TaskDependency.depends_on_gid == task_gid)
     )
     dependents = result.scalars().all()
     
-    parser = OptFieldsParser(opt_fields)
     dep_responses = [parser.filter(t.to_response()) for t in dependents]
     
     paginated = paginate(
@@ -686,10 +627,7 @@ async def get_dependents(
         base_path=f"/tasks/{task_gid}/dependents",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("/{task_gid}/addProject")
@@ -717,7 +655,6 @@ async def add_task_to_project(
     )
     if not result.scalar_one_or_none():
         task_project = TaskProject(
-            gid=generate_gid(),
             task_gid=task_gid,
             project_gid=request_data.project,
             section_gid=request_data.section,
@@ -784,7 +721,6 @@ async def add_tag_to_task(
     )
     if not result.scalar_one_or_none():
         task_tag = TaskTag(
-            gid=generate_gid(),
             task_gid=task_gid,
             tag_gid=request_data.tag,
         )
@@ -843,20 +779,7 @@ async def add_followers_to_task(
     followers_str = data.get("data", {}).get("followers", "")
     follower_gids = [f.strip() for f in followers_str.split(",") if f.strip()]
     
-    for user_gid in follower_gids:
-        result = await db.execute(
-            select(TaskFollower)
-            .where(TaskFollower.task_gid == task_gid)
-            .where(TaskFollower.user_gid == user_gid)
-        )
-        if not result.scalar_one_or_none():
-            follower = TaskFollower(
-                gid=generate_gid(),
-                task_gid=task_gid,
-                user_gid=user_gid,
-            )
-            db.add(follower)
-    
+    await TaskFollower.bulk_add(db, task_gid, follower_gids)
     await db.commit()
     
     return wrap_response(task.to_response())
@@ -912,14 +835,15 @@ async def get_task_stories(
     if not result.scalar_one_or_none():
         raise NotFoundError("Task", task_gid)
     
+    parser = OptFieldsParser(opt_fields)
     result = await db.execute(
         select(Story)
+        .options(*parser.defer_unrequested(Story.text, Story.html_text))
         .where(Story.target_gid == task_gid)
         .order_by(Story.created_at)
     )
     stories = result.scalars().all()
     
-    parser = OptFieldsParser(opt_fields)
     story_responses = [parser.filter(s.to_response()) for s in stories]
     
     paginated = paginate(
@@ -929,10 +853,7 @@ async def get_task_stories(
         base_path=f"/tasks/{task_gid}/stories",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("/{task_gid}/stories")
@@ -1000,7 +921,6 @@ async def add_dependents(
         )
         if not result.scalar_one_or_none():
             dependency = TaskDependency(
-                gid=generate_gid(),
                 task_gid=dep_gid,
                 depends_on_gid=task_gid,
             )
@@ -1073,14 +993,15 @@ async def get_task_projects(
     if not result.scalar_one_or_none():
         raise NotFoundError("Task", task_gid)
     
+    parser = OptFieldsParser(opt_fields)
     result = await db.execute(
         select(Project)
+        .options(*parser.defer_unrequested(Project.notes, Project.html_notes))
         .join(TaskProject, Project.gid == TaskProject.project_gid)
         .where(TaskProject.task_gid == task_gid)
     )
     projects = result.scalars().all()
     
-    parser = OptFieldsParser(opt_fields)
     project_responses = [parser.filter(p.to_response()) for p in projects]
     
     paginated = paginate(
@@ -1090,10 +1011,7 @@ async def get_task_projects(
         base_path=f"/tasks/{task_gid}/projects",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.get("/{task_gid}/tags")
@@ -1113,14 +1031,15 @@ async def get_task_tags(
     if not result.scalar_one_or_none():
         raise NotFoundError("Task", task_gid)
     
+    parser = OptFieldsParser(opt_fields)
     result = await db.execute(
         select(Tag)
+        .options(*parser.defer_unrequested(Tag.notes))
         .join(TaskTag, Tag.gid == TaskTag.tag_gid)
         .where(TaskTag.task_gid == task_gid)
     )
     tags = result.scalars().all()
     
-    parser = OptFieldsParser(opt_fields)
     tag_responses = [parser.filter(t.to_response()) for t in tags]
     
     paginated = paginate(
@@ -1130,10 +1049,7 @@ async def get_task_tags(
         base_path=f"/tasks/{task_gid}/tags",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("/{task_gid}/setSection")
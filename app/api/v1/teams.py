@@ -13,7 +13,7 @@ from app.models.team import Team, TeamMembership
 from app.schemas.team import TeamCreate, TeamUpdate, AddUserToTeamRequest
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -44,20 +44,18 @@ async def get_teams(
     result = await db.execute(query)
     teams = result.scalars().all()
     
-    parser = OptFieldsParser(params.opt_fields)
-    team_responses = [parser.filter(t.to_response()) for t in teams]
-    
     paginated = paginate(
-        team_responses,
+        teams,
         offset=params.offset,
         limit=params.limit,
         base_path="/teams",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    # Serialize only the rows on the requested page
+    parser = OptFieldsParser(params.opt_fields)
+    paginated.data = [parser.filter(t.to_response()) for t in paginated.data]
+    
+    return paginated_response(paginated)
 
 
 @router.post("")
@@ -71,8 +69,7 @@ async def create_team(
     team_data = TeamCreate(**data.get("data", {}))
     
     # Verify workspace exists
-    result = await db.execute(select(Workspace).where(Workspace.gid == team_data.organization))
-    workspace = result.scalar_one_or_none()
+    workspace = await db.get(Workspace, team_data.organization)
     if not workspace:
         raise NotFoundError("Workspace", team_data.organization)
     
@@ -93,16 +90,15 @@ async def create_team(
         visibility=team_data.visibility,
         workspace_gid=team_data.organization,
     )
-    db.add(team)
-    await db.flush()
     
-    # Add creator as admin
+    # Add creator as admin; the unit of work inserts the team first, so both
+    # rows go in with the commit's single flush
     membership = TeamMembership(
         gid=generate_gid(),
         team_gid=team.gid,
         is_admin=True,
     )
-    db.add(membership)
+    db.add_all([team, membership])
     
     await db.commit()
     
@@ -118,8 +114,7 @@ async def get_team(
     """
     Get a team by GID.
     """
-    result = await db.execute(select(Team).where(Team.gid == team_gid))
-    team = result.scalar_one_or_none()
+    team = await db.get(Team, team_gid)
     
     if not team:
         raise NotFoundError("Team", team_gid)
@@ -137,8 +132,7 @@ async def update_team(
     """
     Update a team.
     """
-    result = await db.execute(select(Team).where(Team.gid == team_gid))
-    team = result.scalar_one_or_none()
+    team = await db.get(Team, team_gid)
     
     if not team:
         raise NotFoundError("Team", team_gid)
@@ -178,8 +172,7 @@ async def add_user_to_team(
     """
     Add a user to a team.
     """
-    result = await db.execute(select(Team).where(Team.gid == team_gid))
-    team = result.scalar_one_or_none()
+    team = await db.get(Team, team_gid)
     
     if not team:
         raise NotFoundError("Team", team_gid)
@@ -188,8 +181,7 @@ async def add_user_to_team(
     user_gid = request_data.user
     
     # Verify user exists
-    result = await db.execute(select(User).where(User.gid == user_gid))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_gid)
     if not user:
         raise NotFoundError("User", user_gid)
     
@@ -224,8 +216,7 @@ async def remove_user_from_team(
     """
     Remove a user from a team.
     """
-    result = await db.execute(select(Team).where(Team.gid == team_gid))
-    team = result.scalar_one_or_none()
+    team = await db.get(Team, team_gid)
     
     if not team:
         raise NotFoundError("Team", team_gid)
@@ -256,8 +247,7 @@ async def get_team_users(
     """
     Get all users in a team.
     """
-    result = await db.execute(select(Team).where(Team.gid == team_gid))
-    team = result.scalar_one_or_none()
+    team = await db.get(Team, team_gid)
     if not team:
         raise NotFoundError("Team", team_gid)
     
@@ -280,10 +270,7 @@ async def get_team_users(
         base_path=f"/teams/{team_gid}/users",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 # Team Memberships Router
@@ -346,10 +333,7 @@ async def get_team_memberships(
         base_path="/team_memberships",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @membership_router.put("/{team_membership_gid}")
@@ -9,7 +9,7 @@ from app.core.exceptions import NotFoundError
 from app.models.time_period import TimePeriod
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -62,10 +62,7 @@ async def get_time_periods(
         base_path="/time_periods",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.get("/{time_period_gid}")
@@ -12,7 +12,7 @@ from app.models.task import Task
 from app.models.time_tracking import TimeTrackingEntry
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -48,10 +48,7 @@ async def get_time_tracking_entries(
         base_path="/time_tracking_entries",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
@@ -208,9 +205,6 @@ async def get_time_tracking_entries_for_task(
         base_path=f"/tasks/{task_gid}/time_tracking_entries",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
@@ -40,6 +40,7 @@ async def typeahead_search(
     if resource_type == "task":
         db_query = (
             select(Task)
+            .options(*parser.defer_unrequested(Task.notes, Task.html_notes))
             .join(TaskProject, Task.gid == TaskProject.task_gid)
             .join(Project, TaskProject.project_gid == Project.gid)
             .where(Project.workspace_gid == workspace_gid)
@@ -53,6 +54,7 @@ async def typeahead_search(
     elif resource_type == "project":
         db_query = (
             select(Project)
+            .options(*parser.defer_unrequested(Project.notes, Project.html_notes))
             .where(Project.workspace_gid == workspace_gid)
             .where(Project.name.ilike(search_pattern))
             .limit(count)
@@ -64,6 +66,7 @@ async def typeahead_search(
     elif resource_type == "tag":
         db_query = (
             select(Tag)
+            .options(*parser.defer_unrequested(Tag.notes))
             .where(Tag.workspace_gid == workspace_gid)
             .where(Tag.name.ilike(search_pattern))
             .limit(count)
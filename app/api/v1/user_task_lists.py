@@ -8,10 +8,10 @@ from app.api.deps import get_db, CommonQueryParams
 from app.core.exceptions import NotFoundError
 from app.models.user import User
 from app.models.user_task_list import UserTaskList
-from app.models.task import Task
+from app.models.task import Task, task_row_to_response
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -63,17 +63,15 @@ async def get_user_task_list_tasks(
         raise NotFoundError("UserTaskList", user_task_list_gid)
     
     # Get tasks assigned to this user
+    parser = OptFieldsParser(params.opt_fields)
     query = (
-        select(Task)
+        Task.select_rows(with_notes=parser.has_field("notes") or parser.has_field("html_notes"))
         .where(Task.assignee_gid == task_list.owner_gid)
         .order_by(Task.created_at.desc())
     )
     
     result = await db.execute(query)
-    tasks = result.scalars().all()
-    
-    parser = OptFieldsParser(params.opt_fields)
-    task_responses = [parser.filter(t.to_response()) for t in tasks]
+    task_responses = [parser.filter(task_row_to_response(row)) for row in result.all()]
     
     paginated = paginate(
         task_responses,
@@ -82,9 +80,6 @@ async def get_user_task_list_tasks(
         base_path=f"/user_task_lists/{user_task_list_gid}/tasks",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
@@ -13,7 +13,7 @@ from app.models.user_task_list import UserTaskList
 from app.models.user_favorites import UserFavorite
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response, wrap_list_response
+from app.utils.response import wrap_response, wrap_list_response, paginated_response
 
 
 router = APIRouter()
@@ -64,10 +64,32 @@ async def get_users(
         base_path="/users",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
+
+
+@router.get("/me")
+async def get_current_user(
+    opt_fields: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db),
+) -> Any:
+    """
+    Get the current user (me).
+    
+    Returns the user record for the currently authenticated user.
+    This is a convenience endpoint that returns the same data as /users/{user_gid}
+    but doesn't require knowing the user's GID.
+    """
+    # Get the first active user as a simulation
+    result = await db.execute(
+        select(User).where(User.is_active == True).limit(1)
+    )
+    user = result.scalar_one_or_none()
+    
+    if not user:
+        raise NotFoundError("User", "me")
+    
+    parser = OptFieldsParser(opt_fields)
+    return wrap_response(parser.filter(user.to_response()))
 
 
 @router.get("/{user_gid}")
@@ -79,8 +101,7 @@ async def get_user(
     """
     Get a single user by GID.
     """
-    result = await db.execute(select(User).where(User.gid == user_gid))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_gid)
     
     if not user:
         raise NotFoundError("User", user_gid)
@@ -101,8 +122,7 @@ async def get_user_favorites(
     Get a user's favorites in a workspace.
     """
     # Verify user exists
-    result = await db.execute(select(User).where(User.gid == user_gid))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_gid)
     if not user:
         raise NotFoundError("User", user_gid)
     
@@ -129,10 +149,7 @@ async def get_user_favorites(
         base_path=f"/users/{user_gid}/favorites",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.get("/{user_gid}/user_task_list")
@@ -146,8 +163,7 @@ async def get_user_task_list(
     Get a user's task list (My Tasks) in a workspace.
     """
     # Verify user exists
-    result = await db.execute(select(User).where(User.gid == user_gid))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_gid)
     if not user:
         raise NotFoundError("User", user_gid)
     
@@ -179,8 +195,7 @@ async def get_user_teams(
     from app.models.team import Team, TeamMembership
     
     # Verify user exists
-    result = await db.execute(select(User).where(User.gid == user_gid))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_gid)
     if not user:
         raise NotFoundError("User", user_gid)
     
@@ -205,10 +220,7 @@ async def get_user_teams(
         base_path=f"/users/{user_gid}/teams",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.get("/{user_gid}/workspace_memberships")
@@ -221,8 +233,7 @@ async def get_user_workspace_memberships(
     Get a user's workspace memberships.
     """
     # Verify user exists
-    result = await db.execute(select(User).where(User.gid == user_gid))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_gid)
     if not user:
         raise NotFoundError("User", user_gid)
     
@@ -244,35 +255,7 @@ async def get_user_workspace_memberships(
         base_path=f"/users/{user_gid}/workspace_memberships",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
-
-
-@router.get("/me")
-async def get_current_user(
-    opt_fields: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db),
-) -> Any:
-    """
-    Get the current user (me).
-    
-    Returns the user record for the currently authenticated user.
-    This is a convenience endpoint that returns the same data as /users/{user_gid}
-    but doesn't require knowing the user's GID.
-    """
-    # Get the first active user as a simulation
-    result = await db.execute(
-        select(User).where(User.is_active == True).limit(1)
-    )
-    user = result.scalar_one_or_none()
-    
-    if not user:
-        raise NotFoundError("User", "me")
-    
-    parser = OptFieldsParser(opt_fields)
-    return wrap_response(parser.filter(user.to_response()))
+    return paginated_response(paginated)
 
 
 @router.get("/{user_gid}/team_memberships")
@@ -290,8 +273,7 @@ async def get_user_team_memberships(
     from app.models.team import Team, TeamMembership
     
     # Verify user exists
-    result = await db.execute(select(User).where(User.gid == user_gid))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_gid)
     if not user:
         raise NotFoundError("User", user_gid)
     
@@ -316,8 +298,5 @@ async def get_user_team_memberships(
         base_path=f"/users/{user_gid}/team_memberships",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
@@ -4,6 +4,7 @@ import json
 from fastapi import APIRouter, Depends, Query, Body, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.orm import defer
 
 from app.api.deps import get_db, CommonQueryParams
 from app.core.exceptions import NotFoundError
@@ -12,7 +13,7 @@ from app.models.webhook import Webhook
 from app.schemas.webhook import WebhookCreate
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -29,7 +30,13 @@ async def get_webhooks(
     Get webhooks in a workspace.
     """
     # For simplicity, we'll get webhooks created by the user
-    query = select(Webhook)
+    parser = OptFieldsParser(params.opt_fields)
+    query = select(Webhook).options(
+        # Never part of a response
+        defer(Webhook.secret),
+        defer(Webhook.filters),
+        *parser.defer_unrequested(Webhook.last_failure_content),
+    )
     
     if resource:
         query = query.where(Webhook.resource_gid == resource)
@@ -37,7 +44,6 @@ async def get_webhooks(
     result = await db.execute(query)
     webhooks = result.scalars().all()
     
-    parser = OptFieldsParser(params.opt_fields)
     webhook_responses = [parser.filter(w.to_response()) for w in webhooks]
     
     paginated = paginate(
@@ -47,10 +53,7 @@ async def get_webhooks(
         base_path="/webhooks",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
 
 
 @router.post("")
@@ -101,8 +104,7 @@ async def get_webhook(
     """
     Get a webhook by GID.
     """
-    result = await db.execute(select(Webhook).where(Webhook.gid == webhook_gid))
-    webhook = result.scalar_one_or_none()
+    webhook = await db.get(Webhook, webhook_gid)
     
     if not webhook:
         raise NotFoundError("Webhook", webhook_gid)
@@ -120,8 +122,7 @@ async def update_webhook(
     """
     Update a webhook.
     """
-    result = await db.execute(select(Webhook).where(Webhook.gid == webhook_gid))
-    webhook = result.scalar_one_or_none()
+    webhook = await db.get(Webhook, webhook_gid)
     
     if not webhook:
         raise NotFoundError("Webhook", webhook_gid)
@@ -145,8 +146,7 @@ async def delete_webhook(
     """
     Delete a webhook.
     """
-    result = await db.execute(select(Webhook).where(Webhook.gid == webhook_gid))
-    webhook = result.scalar_one_or_none()
+    webhook = await db.get(Webhook, webhook_gid)
     
     if not webhook:
         raise NotFoundError("Webhook", webhook_gid)
@@ -25,7 +25,7 @@ from app.schemas.workspace import (
 )
 from app.utils.pagination import paginate
 from app.utils.filters import OptFieldsParser
-from app.utils.response import wrap_response
+from app.utils.response import wrap_response, paginated_response
 
 
 router = APIRouter()
@@ -51,20 +51,18 @@ async def get_workspaces(
     result = await db.execute(query)
     workspaces = result.scalars().all()
     
-    parser = OptFieldsParser(params.opt_fields)
-    workspace_responses = [parser.filter(w.to_response()) for w in workspaces]
-    
     paginated = paginate(
-        workspace_responses,
+        workspaces,
         offset=params.offset,
         limit=params.limit,
         base_path="/workspaces",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    # Serialize only the rows on the requested page
+    parser = OptFieldsParser(params.opt_fields)
+    paginated.data = [parser.filter(w.to_response()) for w in paginated.data]
+    
+    return paginated_response(paginated)
 
 
 @router.get("/{workspace_gid}")
@@ -78,8 +76,7 @@ async def get_workspace(
     
     Returns the full workspace record for a single workspace.
     """
-    result = await db.execute(select(Workspace).where(Workspace.gid == workspace_gid))
-    workspace = result.scalar_one_or_none()
+    workspace = await db.get(Workspace, workspace_gid)
     
     if not workspace:
         raise NotFoundError("Workspace", workspace_gid)
@@ -101,8 +98,7 @@ async def update_workspace(
     the URL for that workspace. Only the fields provided in the data block
     will be updated; any unspecified fields will remain unchanged.
     """
-    result = await db.execute(select(Workspace).where(Workspace.gid == workspace_gid))
-    workspace = result.scalar_one_or_none()
+    workspace = await db.get(Workspace, workspace_gid)
     
     if not workspace:
         raise NotFoundError("Workspace", workspace_gid)
@@ -130,8 +126,7 @@ async def add_user_for_workspace(
     Add a user to a workspace or organization. The user can be referenced
     by their globally unique user ID or their email address.
     """
-    result = await db.execute(select(Workspace).where(Workspace.gid == workspace_gid))
-    workspace = result.scalar_one_or_none()
+    workspace = await db.get(Workspace, workspace_gid)
     
     if not workspace:
         raise NotFoundError("Workspace", workspace_gid)
@@ -140,8 +135,7 @@ async def add_user_for_workspace(
     user_gid = request_data.user
     
     # Verify user exists
-    result = await db.execute(select(User).where(User.gid == user_gid))
-    user = result.scalar_one_or_none()
+    user = await db.get(User, user_gid)
     if not user:
         raise NotFoundError("User", user_gid)
     
@@ -194,8 +188,7 @@ async def remove_user_for_workspace(
     Remove a user from a workspace or organization. The user making this
     call must be an admin in the workspace.
     """
-    result = await db.execute(select(Workspace).where(Workspace.gid == workspace_gid))
-    workspace = result.scalar_one_or_none()
+    workspace = await db.get(Workspace, workspace_gid)
     
     if not workspace:
         raise NotFoundError("Workspace", workspace_gid)
@@ -230,8 +223,7 @@ async def get_workspace_events(
     Returns the full record for all events that have occurred since the
     sync token was created.
     """
-    result = await db.execute(select(Workspace).where(Workspace.gid == workspace_gid))
-    workspace = result.scalar_one_or_none()
+    workspace = await db.get(Workspace, workspace_gid)
     
     if not workspace:
         raise NotFoundError("Workspace", workspace_gid)
@@ -318,7 +310,4 @@ async def get_workspace_memberships_for_workspace(
         base_path=f"/workspaces/{workspace_gid}/workspace_memberships",
     )
     
-    return {
-        "data": paginated.data,
-        "next_page": paginated.next_page.model_dump() if paginated.next_page else None,
-    }
+    return paginated_response(paginated)
@@ -11,6 +11,10 @@ class Settings(BaseSettings):
     API_V1_PREFIX: str = "/api/1.0"
     PROJECT_NAME: str = "Asana Backend Replica"
     
+    # Store event_records as a compressed TimescaleDB hypertable instead of
+    # native monthly partitions (requires the timescaledb extension)
+    TIMESCALEDB_ENABLED: bool = False
+    
     # File uploads
     UPLOAD_DIR: str = "uploads"
     MAX_UPLOAD_SIZE: int = 100 * 1024 * 1024  # 100MB
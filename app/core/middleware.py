@@ -0,0 +1,103 @@
+import time
+from typing import List, Optional, Tuple
+
+import orjson
+from sqlalchemy.exc import DBAPIError, StatementError
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.exceptions import AsanaAPIException, RateLimitError, ValidationError
+
+
+SERVER_ERROR_BODY = orjson.dumps({
+    "errors": [
+        {
+            "message": "Server Error",
+            "help": "An unexpected error occurred. Please try again later. If the problem persists, contact support.",
+            "phrase": "server_error",
+        }
+    ]
+})
+
+
+def _as_api_exception(exc: Exception) -> Optional[AsanaAPIException]:
+    """The Asana error to render for ``exc``, or None if it is a server error."""
+    if isinstance(exc, AsanaAPIException):
+        return exc
+    # A column type refused a request value while binding it (a malformed
+    # GID, an unknown enum name); nothing reached the database
+    if (
+        isinstance(exc, StatementError)
+        and not isinstance(exc, DBAPIError)
+        and isinstance(exc.orig, ValueError)
+    ):
+        return ValidationError(str(exc.orig))
+    return None
+
+
+class ErrorAndTimingMiddleware:
+    """
+    ASGI middleware that adds the X-Process-Time header and renders
+    Asana-style error responses.
+    
+    AsanaAPIException subclasses are matched with a single except clause
+    instead of going through the exception handler registry, and request
+    values rejected by a column type become a 400; any other exception
+    becomes a 500 response and is re-raised so it is still logged.
+    """
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start_time = time.perf_counter()
+        response_started = False
+        
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", str(time.perf_counter() - start_time))
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            if response_started:
+                raise
+            api_exc = _as_api_exception(exc)
+            if api_exc is None:
+                await self._send_json(send_wrapper, 500, SERVER_ERROR_BODY)
+                raise
+            headers = []
+            if isinstance(api_exc, RateLimitError):
+                headers.append((b"retry-after", str(api_exc.retry_after).encode()))
+            body = orjson.dumps({
+                "errors": [
+                    {
+                        "message": api_exc.message,
+                        "help": api_exc.help_text,
+                        "phrase": api_exc.phrase,
+                    }
+                ]
+            })
+            await self._send_json(send_wrapper, api_exc.status_code, body, headers)
+    
+    @staticmethod
+    async def _send_json(send: Send, status_code: int, body: bytes, headers: Optional[List[Tuple[bytes, bytes]]] = None) -> None:
+        """Send a complete JSON response."""
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                *(headers or []),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
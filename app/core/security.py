@@ -1,9 +1,15 @@
+import os
 import uuid
 
 
 def generate_gid() -> str:
-    """Generate a globally unique identifier (GID) similar to Asana's format."""
-    return str(uuid.uuid4()).replace("-", "")[:16]
+    """
+    Generate a globally unique identifier (GID) similar to Asana's format.
+    
+    Eight random bytes as 16 hex characters, which the GID column type packs
+    straight back into those 8 bytes.
+    """
+    return os.urandom(8).hex()
 
 
 def generate_webhook_secret() -> str:
@@ -0,0 +1,13 @@
+from datetime import date, datetime
+from typing import Optional, Union
+
+
+def iso_utc(value: Optional[Union[date, datetime]]) -> Optional[str]:
+    """Render a date or timestamp in ISO 8601 form, or None if unset.
+    
+    Stored timestamps load as aware UTC datetimes (see UTCDateTime), so
+    they already render with their ``+00:00`` offset.
+    """
+    if value is None:
+        return None
+    return value.isoformat()
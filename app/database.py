@@ -1,9 +1,15 @@
+import asyncio
+import logging
+from datetime import date
+
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import MetaData
+from sqlalchemy import Connection, MetaData, text
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
 # Naming convention for constraints
 convention = {
     "ix": "ix_%(column_0_label)s",
@@ -50,9 +56,189 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+def create_monthly_partitions(connection: Connection, months_ahead: int = 2) -> None:
+    """Create monthly partitions for tables range-partitioned on created_at.
+    
+    Partitions are created for the current month plus ``months_ahead`` months,
+    along with a DEFAULT partition that catches rows outside those ranges.
+    Runs at startup and daily from ``maintain_partitions``.
+    
+    Rows for a month can already sit in the DEFAULT partition when its own
+    partition is created (e.g. the process outlived the months created at
+    startup), and Postgres refuses to add a partition whose range the default
+    partition holds rows for. Missing partitions are therefore built detached,
+    filled with their month's rows from the default partition, then attached.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    
+    today = date.today()
+    for table in Base.metadata.sorted_tables:
+        if not table.info.get("partition_by_month"):
+            continue
+        
+        default = f"{table.name}_default"
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {default} PARTITION OF {table.name} DEFAULT"
+        ))
+        
+        start = date(today.year, today.month, 1)
+        for _ in range(months_ahead + 1):
+            end = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+            partition = f"{table.name}_{start:%Y_%m}"
+            exists = connection.execute(
+                text("SELECT to_regclass(:name)"), {"name": partition}
+            ).scalar()
+            if exists is None:
+                connection.execute(text(
+                    f"CREATE TABLE {partition} (LIKE {table.name} INCLUDING DEFAULTS)"
+                ))
+                connection.execute(
+                    text(
+                        f"WITH moved AS (DELETE FROM {default} "
+                        f"WHERE created_at >= :start AND created_at < :end RETURNING *) "
+                        f"INSERT INTO {partition} SELECT * FROM moved"
+                    ),
+                    {"start": start, "end": end},
+                )
+                connection.execute(text(
+                    f"ALTER TABLE {table.name} ATTACH PARTITION {partition} "
+                    f"FOR VALUES FROM ('{start}') TO ('{end}')"
+                ))
+            start = end
+
+
+# SQLite has no trigger functions or TG_OP, so each event gets its own trigger
+_SQLITE_SUBTASK_COUNT_TRIGGERS = {
+    "tasks_num_subtasks_insert": (
+        "AFTER INSERT ON tasks WHEN NEW.parent_gid IS NOT NULL BEGIN "
+        "UPDATE tasks SET num_subtasks = num_subtasks + 1 WHERE gid = NEW.parent_gid; "
+        "END"
+    ),
+    "tasks_num_subtasks_delete": (
+        "AFTER DELETE ON tasks WHEN OLD.parent_gid IS NOT NULL BEGIN "
+        "UPDATE tasks SET num_subtasks = num_subtasks - 1 "
+        "WHERE gid = OLD.parent_gid AND num_subtasks > 0; "
+        "END"
+    ),
+    "tasks_num_subtasks_update": (
+        "AFTER UPDATE OF parent_gid ON tasks WHEN OLD.parent_gid IS NOT NEW.parent_gid BEGIN "
+        "UPDATE tasks SET num_subtasks = num_subtasks - 1 "
+        "WHERE gid = OLD.parent_gid AND num_subtasks > 0; "
+        "UPDATE tasks SET num_subtasks = num_subtasks + 1 WHERE gid = NEW.parent_gid; "
+        "END"
+    ),
+}
+
+
+def create_subtask_count_trigger(connection: Connection) -> None:
+    """Keep tasks.num_subtasks in sync with subtask inserts, deletes and re-parenting.
+    
+    The counter is maintained in the same statement as the subtask change,
+    so routes never read and write the parent row to adjust it. Installed
+    whenever the tasks table is created (see app.models.task); PostgreSQL
+    gets a plpgsql trigger, SQLite an equivalent set of triggers.
+    """
+    if connection.dialect.name == "sqlite":
+        for name, definition in _SQLITE_SUBTASK_COUNT_TRIGGERS.items():
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+            connection.execute(text(f"CREATE TRIGGER {name} {definition}"))
+        return
+    if connection.dialect.name != "postgresql":
+        raise NotImplementedError(
+            f"No tasks.num_subtasks trigger for the {connection.dialect.name} dialect"
+        )
+    
+    connection.execute(text(
+        "CREATE OR REPLACE FUNCTION bump_num_subtasks() RETURNS trigger AS $$\n"
+        "BEGIN\n"
+        "    IF TG_OP = 'UPDATE' AND OLD.parent_gid IS NOT DISTINCT FROM NEW.parent_gid THEN\n"
+        "        RETURN NULL;\n"
+        "    END IF;\n"
+        "    IF TG_OP <> 'INSERT' AND OLD.parent_gid IS NOT NULL THEN\n"
+        "        UPDATE tasks SET num_subtasks = num_subtasks - 1\n"
+        "        WHERE gid = OLD.parent_gid AND num_subtasks > 0;\n"
+        "    END IF;\n"
+        "    IF TG_OP <> 'DELETE' AND NEW.parent_gid IS NOT NULL THEN\n"
+        "        UPDATE tasks SET num_subtasks = num_subtasks + 1 WHERE gid = NEW.parent_gid;\n"
+        "    END IF;\n"
+        "    RETURN NULL;\n"
+        "END;\n"
+        "$$ LANGUAGE plpgsql"
+    ))
+    connection.execute(text("DROP TRIGGER IF EXISTS tasks_num_subtasks ON tasks"))
+    connection.execute(text(
+        "CREATE TRIGGER tasks_num_subtasks "
+        "AFTER INSERT OR DELETE OR UPDATE OF parent_gid ON tasks "
+        "FOR EACH ROW EXECUTE FUNCTION bump_num_subtasks()"
+    ))
+
+
+def create_event_hypertable(connection: Connection) -> None:
+    """Convert event_records into a compressed TimescaleDB hypertable.
+    
+    Raw chunks are compressed after a week, segmented by resource, and an
+    hourly continuous aggregate serves per-resource event counts without
+    scanning raw rows.
+    """
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb"))
+    connection.execute(text(
+        "SELECT create_hypertable('event_records', 'created_at', "
+        "chunk_time_interval => INTERVAL '1 day', if_not_exists => TRUE, migrate_data => TRUE)"
+    ))
+    
+    compressed = connection.execute(text(
+        "SELECT compression_enabled FROM timescaledb_information.hypertables "
+        "WHERE hypertable_name = 'event_records'"
+    )).scalar()
+    if not compressed:
+        connection.execute(text(
+            "ALTER TABLE event_records SET (timescaledb.compress, "
+            "timescaledb.compress_segmentby = 'resource_gid', "
+            "timescaledb.compress_orderby = 'created_at DESC')"
+        ))
+    connection.execute(text(
+        "SELECT add_compression_policy('event_records', INTERVAL '7 days', if_not_exists => TRUE)"
+    ))
+    
+    connection.execute(text(
+        "CREATE MATERIALIZED VIEW IF NOT EXISTS event_records_hourly "
+        "WITH (timescaledb.continuous) AS "
+        "SELECT resource_gid, action, time_bucket(INTERVAL '1 hour', created_at) AS bucket, "
+        "count(*) AS num_events "
+        "FROM event_records GROUP BY resource_gid, action, bucket "
+        "WITH NO DATA"
+    ))
+    connection.execute(text(
+        "SELECT add_continuous_aggregate_policy('event_records_hourly', "
+        "start_offset => INTERVAL '3 days', end_offset => INTERVAL '1 hour', "
+        "schedule_interval => INTERVAL '1 hour', if_not_exists => TRUE)"
+    ))
+
+
+async def maintain_partitions(interval: float = 24 * 60 * 60) -> None:
+    """Keep monthly partitions created ahead of time while the process runs.
+    
+    A failed run is retried at the next interval; rows still land in the
+    DEFAULT partition meanwhile and are moved once their partition exists.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(create_monthly_partitions)
+        except Exception:
+            logger.exception("Creating monthly partitions failed")
+
+
 async def init_db():
     """Initialize database tables."""
+    import app.models._all  # noqa: F401 - register every table on the metadata
+    
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(create_monthly_partitions)
+        if settings.TIMESCALEDB_ENABLED:
+            await conn.run_sync(create_event_hypertable)
 
 
@@ -1,14 +1,15 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError as PydanticValidationError
-import time
 
 from app.config import settings
-from app.database import init_db
-from app.core.exceptions import AsanaAPIException, RateLimitError
+from app.database import init_db, maintain_partitions
+from app.core.middleware import ErrorAndTimingMiddleware
+from app.utils.response import ORJSONResponse
 from app.api.v1 import router as api_v1_router
 
 
@@ -17,9 +18,12 @@ async def lifespan(app: FastAPI):
     """Application lifespan events."""
     # Startup
     await init_db()
+    partitions = asyncio.create_task(maintain_partitions())
     yield
     # Shutdown
-    pass
+    partitions.cancel()
+    with suppress(asyncio.CancelledError):
+        await partitions
 
 
 app = FastAPI(
@@ -29,8 +33,12 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
+# Timing and Asana error rendering (innermost, so CORS headers still apply)
+app.add_middleware(ErrorAndTimingMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -41,51 +49,6 @@ app.add_middleware(
 )
 
 
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """Add X-Process-Time header to responses."""
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
-
-
-@app.exception_handler(RateLimitError)
-async def rate_limit_exception_handler(request: Request, exc: RateLimitError):
-    """Handle rate limit exceptions with Retry-After header."""
-    return JSONResponse(
-        status_code=exc.status_code,
-        headers={"Retry-After": str(exc.retry_after)},
-        content={
-            "errors": [
-                {
-                    "message": exc.message,
-                    "help": exc.help_text,
-                    "phrase": exc.phrase,
-                }
-            ]
-        },
-    )
-
-
-@app.exception_handler(AsanaAPIException)
-async def asana_exception_handler(request: Request, exc: AsanaAPIException):
-    """Handle Asana-style API exceptions."""
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "errors": [
-                {
-                    "message": exc.message,
-                    "help": exc.help_text,
-                    "phrase": exc.phrase,
-                }
-            ]
-        },
-    )
-
-
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle FastAPI/Pydantic validation errors in Asana format."""
@@ -145,23 +108,6 @@ async def pydantic_validation_exception_handler(request: Request, exc: PydanticV
     )
 
 
-@app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception):
-    """Handle general exceptions."""
-    return JSONResponse(
-        status_code=500,
-        content={
-            "errors": [
-                {
-                    "message": "Server Error",
-                    "help": "An unexpected error occurred. Please try again later. If the problem persists, contact support.",
-                    "phrase": "server_error",
-                }
-            ]
-        },
-    )
-
-
 # Include API routers
 app.include_router(api_v1_router, prefix=settings.API_V1_PREFIX)
 
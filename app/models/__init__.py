@@ -1,43 +1,65 @@
-# Models module - Import all models here for Alembic to discover them
-from app.models.user import User
-from app.models.workspace import Workspace, WorkspaceMembership
-from app.models.team import Team, TeamMembership
-from app.models.project import (
-    Project, 
-    ProjectMembership, 
-    ProjectStatus, 
-    ProjectBrief,
-    ProjectTemplate,
-)
-from app.models.section import Section
-from app.models.task import (
-    Task, 
-    TaskProject, 
-    TaskTag, 
-    TaskDependency, 
-    TaskFollower,
-    TaskTemplate,
-)
-from app.models.story import Story
-from app.models.attachment import Attachment
-from app.models.tag import Tag
-from app.models.custom_field import (
-    CustomField, 
-    CustomFieldEnumOption,
-    CustomFieldSetting,
-    TaskCustomFieldValue,
-)
-from app.models.portfolio import Portfolio, PortfolioMembership, PortfolioItem
-from app.models.goal import Goal, GoalRelationship, StatusUpdate
-from app.models.webhook import Webhook
-from app.models.job import Job
-from app.models.user_task_list import UserTaskList
-from app.models.audit_log import AuditLogEvent
-from app.models.organization_export import OrganizationExport
-from app.models.time_period import TimePeriod
-from app.models.time_tracking import TimeTrackingEntry
-from app.models.event import EventRecord
-from app.models.user_favorites import UserFavorite
+# Models module - model classes are imported lazily on first access.
+# Alembic and init_db import app.models._all to register every table.
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
+
+_lazy = {
+    "User": "app.models.user",
+    "Workspace": "app.models.workspace",
+    "WorkspaceMembership": "app.models.workspace",
+    "Team": "app.models.team",
+    "TeamMembership": "app.models.team",
+    "Project": "app.models.project",
+    "ProjectMembership": "app.models.project",
+    "ProjectStatus": "app.models.project",
+    "ProjectBrief": "app.models.project",
+    "ProjectTemplate": "app.models.project",
+    "Section": "app.models.section",
+    "Task": "app.models.task",
+    "TaskProject": "app.models.task",
+    "TaskTag": "app.models.task",
+    "TaskDependency": "app.models.task",
+    "TaskFollower": "app.models.task",
+    "TaskTemplate": "app.models.task",
+    "Story": "app.models.story",
+    "Attachment": "app.models.attachment",
+    "Tag": "app.models.tag",
+    "CustomField": "app.models.custom_field",
+    "CustomFieldEnumOption": "app.models.custom_field",
+    "CustomFieldSetting": "app.models.custom_field",
+    "TaskCustomFieldValue": "app.models.custom_field",
+    "Portfolio": "app.models.portfolio",
+    "PortfolioMembership": "app.models.portfolio",
+    "portfolio_items": "app.models.portfolio",
+    "Goal": "app.models.goal",
+    "GoalRelationship": "app.models.goal",
+    "StatusUpdate": "app.models.goal",
+    "Webhook": "app.models.webhook",
+    "Job": "app.models.job",
+    "UserTaskList": "app.models.user_task_list",
+    "AuditLogEvent": "app.models.audit_log",
+    "OrganizationExport": "app.models.organization_export",
+    "TimePeriod": "app.models.time_period",
+    "TimeTrackingEntry": "app.models.time_tracking",
+    "EventRecord": "app.models.event",
+    "UserFavorite": "app.models.user_favorites",
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy:
+        module = __import__(_lazy[name], fromlist=[name])
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@event.listens_for(Mapper, "before_configured")
+def _import_all_models() -> None:
+    """Load every model before mappers resolve string-based relationships."""
+    import app.models._all  # noqa: F401
+
 
 __all__ = [
     "User",
@@ -66,7 +88,7 @@ __all__ = [
     "TaskCustomFieldValue",
     "Portfolio",
     "PortfolioMembership",
-    "PortfolioItem",
+    "portfolio_items",
     "Goal",
     "GoalRelationship",
     "StatusUpdate",
@@ -0,0 +1,41 @@
+# Import every model module so the metadata and mapper registry are complete.
+# Used by Alembic, init_db and mapper configuration.
+from app.models.user import User
+from app.models.workspace import Workspace, WorkspaceMembership
+from app.models.team import Team, TeamMembership
+from app.models.project import (
+    Project, 
+    ProjectMembership, 
+    ProjectStatus, 
+    ProjectBrief,
+    ProjectTemplate,
+)
+from app.models.section import Section
+from app.models.task import (
+    Task, 
+    TaskProject, 
+    TaskTag, 
+    TaskDependency, 
+    TaskFollower,
+    TaskTemplate,
+)
+from app.models.story import Story
+from app.models.attachment import Attachment
+from app.models.tag import Tag
+from app.models.custom_field import (
+    CustomField, 
+    CustomFieldEnumOption,
+    CustomFieldSetting,
+    TaskCustomFieldValue,
+)
+from app.models.portfolio import Portfolio, PortfolioMembership, portfolio_items
+from app.models.goal import Goal, GoalRelationship, StatusUpdate
+from app.models.webhook import Webhook
+from app.models.job import Job
+from app.models.user_task_list import UserTaskList
+from app.models.audit_log import AuditLogEvent
+from app.models.organization_export import OrganizationExport
+from app.models.time_period import TimePeriod
+from app.models.time_tracking import TimeTrackingEntry
+from app.models.event import EventRecord
+from app.models.user_favorites import UserFavorite
@@ -1,14 +1,26 @@
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING, ClassVar
+import orjson
 from sqlalchemy import String, ForeignKey, Text, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.timefmt import iso_utc
 from app.models.base import AsanaBase
+from app.models.types import GID
+from app.models.serializers import gid_ref
 
 if TYPE_CHECKING:
     from app.models.task import Task
     from app.models.user import User
 
 
+# Constant parts of the attachment JSON are encoded once; only values are
+# spliced in per row (each value is encoded by orjson so it stays escaped)
+_RESPONSE_JSON_TEMPLATE = (
+    b'{"gid":%b,"resource_type":"attachment","resource_subtype":%b,"name":%b,'
+    b'"host":%b,"created_at":%b,"parent":{"gid":%b,"resource_type":"task"}'
+)
+
+
 class Attachment(AsanaBase):
     """Attachment model for files attached to tasks."""
     __tablename__ = "attachments"
@@ -34,14 +46,14 @@ class Attachment(AsanaBase):
     
     # Foreign keys
     parent_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("tasks.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     
     created_by_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
@@ -50,9 +62,7 @@ class Attachment(AsanaBase):
     parent_task: Mapped["Task"] = relationship("Task", back_populates="attachments")
     created_by: Mapped[Optional["User"]] = relationship("User")
     
-    @property
-    def resource_type(self) -> str:
-        return "attachment"
+    resource_type: ClassVar[str] = "attachment"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -62,8 +72,8 @@ class Attachment(AsanaBase):
             "resource_subtype": self.resource_subtype,
             "name": self.name,
             "host": self.host,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "parent": {"gid": self.parent_gid, "resource_type": "task"},
+            "created_at": iso_utc(self.created_at),
+            "parent": gid_ref(self.parent_gid, "task"),
         }
         
         if self.download_url:
@@ -78,5 +88,33 @@ class Attachment(AsanaBase):
             response["connected_to_app"] = self.connected_to_app
             
         return response
+    
+    def to_response_json(self) -> bytes:
+        """Convert to API response format, encoded as JSON bytes."""
+        dumps = orjson.dumps
+        parts = [
+            _RESPONSE_JSON_TEMPLATE % (
+                dumps(self.gid),
+                dumps(self.resource_subtype),
+                dumps(self.name),
+                dumps(self.host),
+                dumps(iso_utc(self.created_at)),
+                dumps(self.parent_gid),
+            )
+        ]
+        
+        if self.download_url:
+            parts.append(b',"download_url":' + dumps(self.download_url))
+        if self.view_url:
+            parts.append(b',"view_url":' + dumps(self.view_url))
+        if self.permanent_url:
+            parts.append(b',"permanent_url":' + dumps(self.permanent_url))
+        if self.size is not None:
+            parts.append(b',"size":' + dumps(self.size))
+        if self.connected_to_app:
+            parts.append(b',"connected_to_app":true')
+        
+        parts.append(b"}")
+        return b"".join(parts)
 
 
@@ -1,23 +1,36 @@
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, ForeignKey, Text
+from sqlalchemy import String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import AsanaBase
+from app.core.timefmt import iso_utc
+from app.models.base import AsanaBase, MonthlyPartitionMixin
+from app.models.types import MsgPackType
 
 if TYPE_CHECKING:
     from app.models.user import User
     from app.models.workspace import Workspace
 
 
-class AuditLogEvent(AsanaBase):
+class AuditLogEvent(MonthlyPartitionMixin, AsanaBase):
     """Audit log event for enterprise features."""
     __tablename__ = "audit_log_events"
+    __mapper_args__ = {"eager_defaults": True, "confirm_deleted_rows": False}
+    __table_args__ = (
+        # Serve "recent events in a workspace" listings, optionally narrowed
+        # by category or type, straight from the index in created_at order
+        Index("ix_audit_log_events_context_category_created", "context_gid", "event_category", "created_at"),
+        Index("ix_audit_log_events_context_type_created", "context_gid", "event_type", "created_at"),
+        {
+            "postgresql_partition_by": "RANGE (created_at)",
+            "info": {"partition_by_month": True},
+        },
+    )
     
     # Event type (e.g., task_created, task_updated, login_success)
-    event_type: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
     
     # Event category (e.g., logins, task_actions)
-    event_category: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    event_category: Mapped[str] = mapped_column(String(100), nullable=False)
     
     # Actor (who performed the action)
     actor_type: Mapped[str] = mapped_column(String(50), nullable=False)  # user, app, asana
@@ -31,10 +44,10 @@ class AuditLogEvent(AsanaBase):
     
     # Context (workspace/organization)
     context_type: Mapped[str] = mapped_column(String(50), nullable=False)  # workspace, organization
-    context_gid: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    context_gid: Mapped[str] = mapped_column(String(32), nullable=False)
     
-    # Details (JSON stored as text)
-    details: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Details (MessagePack stored as binary)
+    details: Mapped[Optional[dict]] = mapped_column(MsgPackType, nullable=True)
     
     # Client info
     client_ip: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
@@ -59,7 +72,7 @@ class AuditLogEvent(AsanaBase):
                 "context_type": self.context_type,
                 "gid": self.context_gid,
             },
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": iso_utc(self.created_at),
         }
         
         if self.resource_type:
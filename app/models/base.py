@@ -1,23 +1,50 @@
 from datetime import datetime
+from functools import wraps
 from typing import Any
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import event
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import DateTime
 
 from app.database import Base
 from app.core.security import generate_gid
+from app.models.types import GID, UTCDateTime
+
+
+class _UTCNow(FunctionElement):
+    """The current time as a naive UTC timestamp."""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(_UTCNow)
+def _compile_utc_now(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already naive UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(_UTCNow, "postgresql")
+def _compile_utc_now_postgresql(element, compiler, **kw):
+    return "timezone('utc', now())"
+
+
+def utc_now():
+    """SQL expression for the current time as naive UTC."""
+    return _UTCNow()
 
 
 class TimestampMixin:
-    """Mixin for created_at and modified_at timestamps."""
+    """Mixin for created_at and modified_at timestamps (stored as naive UTC, loaded as aware UTC)."""
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
+        UTCDateTime,
+        server_default=utc_now(),
         nullable=False,
     )
     modified_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        server_default=func.now(),
-        onupdate=func.now(),
+        UTCDateTime,
+        server_default=utc_now(),
+        onupdate=utc_now(),
         nullable=False,
     )
 
@@ -25,13 +52,71 @@ class TimestampMixin:
 class GIDMixin:
     """Mixin for GID (Global ID) field."""
     gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         primary_key=True,
         default=generate_gid,
         index=True,
     )
 
 
+class MonthlyPartitionMixin:
+    """Mixin for append-only tables range-partitioned by created_at month.
+    
+    Postgres requires the partition key to be part of the primary key, so
+    created_at joins gid in a composite primary key. Tables using this mixin
+    declare ``postgresql_partition_by`` and the ``partition_by_month`` info
+    flag in ``__table_args__``; partitions are created by ``init_db``.
+    """
+    created_at: Mapped[datetime] = mapped_column(
+        UTCDateTime,
+        server_default=utc_now(),
+        primary_key=True,
+        nullable=False,
+    )
+
+
+class ResponseCacheMixin:
+    """Mixin memoizing ``to_response`` on the instance until its row changes.
+    
+    Instances belong to the request's session, so a cached response never
+    outlives the request. Flushed updates and deletes, refreshes and expiry
+    drop the cached dict; callers must treat the returned dict as read-only.
+    Subclasses caching further per-instance values (e.g. reference dicts)
+    list them in ``_response_cache_attrs`` to have them dropped as well.
+    """
+    _response_cache = None
+    _response_cache_attrs = ("_response_cache",)
+    
+    def __init_subclass__(cls, **kwargs):
+        to_response = cls.__dict__.get("to_response")
+        if to_response is not None:
+            cls.to_response = _memoize_response(to_response)
+        super().__init_subclass__(**kwargs)
+
+
+def _memoize_response(to_response):
+    @wraps(to_response)
+    def cached_to_response(self) -> dict:
+        response = self._response_cache
+        if response is None:
+            response = self._response_cache = to_response(self)
+        return response
+    return cached_to_response
+
+
+@event.listens_for(ResponseCacheMixin, "refresh", propagate=True)
+@event.listens_for(ResponseCacheMixin, "expire", propagate=True)
+def _clear_response_cache(target, *args) -> None:
+    for name in target._response_cache_attrs:
+        target.__dict__.pop(name, None)
+
+
+@event.listens_for(ResponseCacheMixin, "after_update", propagate=True)
+@event.listens_for(ResponseCacheMixin, "after_delete", propagate=True)
+def _clear_response_cache_after_flush(mapper, connection, target) -> None:
+    _clear_response_cache(target)
+
+
 class AsanaBase(Base, GIDMixin, TimestampMixin):
     """Base class for all Asana-like models."""
     __abstract__ = True
@@ -1,8 +1,10 @@
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, TYPE_CHECKING, ClassVar
 from sqlalchemy import String, Boolean, ForeignKey, Text, Integer, Float
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import AsanaBase
+from app.models.types import GID
+from app.models.serializers import gid_ref
 
 if TYPE_CHECKING:
     from app.models.workspace import Workspace
@@ -50,7 +52,7 @@ class CustomField(AsanaBase):
     
     # Foreign keys
     workspace_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("workspaces.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -58,7 +60,7 @@ class CustomField(AsanaBase):
     
     # Created by user
     created_by_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
@@ -79,9 +81,7 @@ class CustomField(AsanaBase):
         cascade="all, delete-orphan",
     )
     
-    @property
-    def resource_type(self) -> str:
-        return "custom_field"
+    resource_type: ClassVar[str] = "custom_field"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -120,7 +120,7 @@ class CustomFieldEnumOption(AsanaBase):
     
     # Foreign keys
     custom_field_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("custom_fields.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -129,9 +129,7 @@ class CustomFieldEnumOption(AsanaBase):
     # Relationships
     custom_field: Mapped["CustomField"] = relationship("CustomField", back_populates="enum_options")
     
-    @property
-    def resource_type(self) -> str:
-        return "enum_option"
+    resource_type: ClassVar[str] = "enum_option"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -152,13 +150,13 @@ class CustomFieldSetting(AsanaBase):
     
     # Foreign keys
     custom_field_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("custom_fields.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     project_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("projects.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -168,17 +166,15 @@ class CustomFieldSetting(AsanaBase):
     custom_field: Mapped["CustomField"] = relationship("CustomField", back_populates="settings")
     project: Mapped["Project"] = relationship("Project", back_populates="custom_field_settings")
     
-    @property
-    def resource_type(self) -> str:
-        return "custom_field_setting"
+    resource_type: ClassVar[str] = "custom_field_setting"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
         return {
             "gid": self.gid,
             "resource_type": self.resource_type,
-            "custom_field": {"gid": self.custom_field_gid, "resource_type": "custom_field"},
-            "project": {"gid": self.project_gid, "resource_type": "project"},
+            "custom_field": gid_ref(self.custom_field_gid, "custom_field"),
+            "project": gid_ref(self.project_gid, "project"),
             "is_important": self.is_important,
         }
 
@@ -201,13 +197,13 @@ class TaskCustomFieldValue(AsanaBase):
     
     # Foreign keys
     task_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("tasks.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     custom_field_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("custom_fields.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -215,7 +211,7 @@ class TaskCustomFieldValue(AsanaBase):
     
     # Enum value (for enum fields)
     enum_value_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("custom_field_enum_options.gid", ondelete="SET NULL"),
         nullable=True,
     )
@@ -231,9 +227,7 @@ class TaskCustomFieldValue(AsanaBase):
     custom_field: Mapped["CustomField"] = relationship("CustomField")
     enum_value: Mapped[Optional["CustomFieldEnumOption"]] = relationship("CustomFieldEnumOption")
     
-    @property
-    def resource_type(self) -> str:
-        return "custom_field_value"
+    resource_type: ClassVar[str] = "custom_field_value"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -251,7 +245,7 @@ class TaskCustomFieldValue(AsanaBase):
         if self.display_value is not None:
             response["display_value"] = self.display_value
         if self.enum_value_gid:
-            response["enum_value"] = {"gid": self.enum_value_gid, "resource_type": "enum_option"}
+            response["enum_value"] = gid_ref(self.enum_value_gid, "enum_option")
         if self.multi_enum_values:
             gids = self.multi_enum_values.split(",")
             response["multi_enum_values"] = [{"gid": gid, "resource_type": "enum_option"} for gid in gids if gid]
@@ -1,16 +1,29 @@
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, ForeignKey, Text
+from sqlalchemy import String, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import AsanaBase
+from app.config import settings
+from app.core.timefmt import iso_utc
+from app.models.base import AsanaBase, MonthlyPartitionMixin
+from app.models.types import GID, MsgPackType
+from app.models.serializers import gid_ref
 
 if TYPE_CHECKING:
     from app.models.user import User
 
 
-class EventRecord(AsanaBase):
+class EventRecord(MonthlyPartitionMixin, AsanaBase):
     """Event record for the Events API."""
     __tablename__ = "event_records"
+    __mapper_args__ = {"eager_defaults": True, "confirm_deleted_rows": False}
+    __table_args__ = (
+        {}
+        if settings.TIMESCALEDB_ENABLED
+        else {
+            "postgresql_partition_by": "RANGE (created_at)",
+            "info": {"partition_by_month": True},
+        }
+    )
     
     # Resource that changed
     resource_gid: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
@@ -25,13 +38,13 @@ class EventRecord(AsanaBase):
     
     # User who made the change
     user_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
     
-    # Change details (JSON stored as text)
-    change: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Change details (MessagePack stored as binary)
+    change: Mapped[Optional[dict]] = mapped_column(MsgPackType, nullable=True)
     
     # Relationships
     user: Mapped[Optional["User"]] = relationship("User")
@@ -45,13 +58,13 @@ class EventRecord(AsanaBase):
         response = {
             "resource": {"gid": self.resource_gid, "resource_type": self.resource_type},
             "action": self.action,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": iso_utc(self.created_at),
         }
         
         if self.parent_gid:
             response["parent"] = {"gid": self.parent_gid, "resource_type": self.parent_type}
         if self.user_gid:
-            response["user"] = {"gid": self.user_gid, "resource_type": "user"}
+            response["user"] = gid_ref(self.user_gid, "user")
             
         return response
 
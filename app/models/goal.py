@@ -1,9 +1,15 @@
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, Sequence, TYPE_CHECKING, ClassVar
 from datetime import date
-from sqlalchemy import String, Boolean, ForeignKey, Text, Date, Integer, Float
+from functools import cached_property
+from sqlalchemy import JSON, String, Boolean, ForeignKey, Text, Date, Integer, Float, Index, Row, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import AsanaBase
+from app.core.timefmt import iso_utc
+from app.models.base import AsanaBase, ResponseCacheMixin
+from app.models.serializers import Deferred, Iso, Ref, compile_json_writer, compile_response, gid_ref
+from app.models.types import GID, SmallEnum
 
 if TYPE_CHECKING:
     from app.models.workspace import Workspace
@@ -12,20 +18,56 @@ if TYPE_CHECKING:
     from app.models.time_period import TimePeriod
 
 
-class Goal(AsanaBase):
+# Stored as SMALLINT codes: only ever append to these
+STATUS_TYPES = ("on_track", "at_risk", "off_track", "on_hold", "complete")
+GOAL_MEMBERSHIP_ROLES = ("member", "follower", "commenter", "editor")
+
+METRIC_TYPES = ("number", "percent", "currency")
+
+# Deferred group of the large text columns; queries whose responses include
+# them apply undefer_group(BODY_GROUP), otherwise they serialize as None
+BODY_GROUP = "body"
+
+# Goal response keys, shared by Goal.to_response, goal_row_to_response and write_goal_json
+GOAL_RESPONSE_FIELDS = {
+    "name": "name",
+    "notes": "notes",
+    "html_notes": "html_notes",
+    "status": "status",
+    "is_workspace_level": "is_workspace_level",
+    "liked": "liked",
+    "num_likes": "num_likes",
+    "workspace": Ref("workspace_gid", "workspace"),
+}
+# Optional keys are only emitted when set
+GOAL_OPTIONAL_RESPONSE_FIELDS = {
+    "due_on": Iso("due_on"),
+    "start_on": Iso("start_on"),
+    "owner": Ref("owner_gid", "user"),
+    "team": Ref("team_gid", "team"),
+    "time_period": Ref("time_period_gid", "time_period"),
+    "metric": "metric",
+}
+
+
+class Goal(ResponseCacheMixin, AsanaBase):
     """Goal model for tracking objectives."""
     __tablename__ = "goals"
+    __table_args__ = (
+        # Workspace goal listings are ordered by name
+        Index("ix_goals_workspace_name", "workspace_gid", "name"),
+    )
     
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    html_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group=BODY_GROUP)
+    html_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group=BODY_GROUP)
     
     # Due date
     due_on: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     start_on: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     
     # Status
-    status: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # on_track, at_risk, off_track
+    status: Mapped[Optional[str]] = mapped_column(SmallEnum(*STATUS_TYPES), nullable=True)
     
     # Is workspace level goal
     is_workspace_level: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -34,37 +76,35 @@ class Goal(AsanaBase):
     liked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     num_likes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     
-    # Metric - target/current values
-    metric_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # number, percent, currency
-    metric_unit: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    metric_precision: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    metric_currency_code: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
-    metric_initial_number_value: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
-    metric_target_number_value: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
-    metric_current_number_value: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    # Metric - target/current values, stored in API response form
+    # (metric_type, unit, precision, currency_code and the three number values);
+    # JSONB on PostgreSQL, JSON elsewhere
+    metric: Mapped[Optional[dict]] = mapped_column(
+        JSON().with_variant(JSONB, "postgresql"),
+        nullable=True,
+    )
     
     # Foreign keys
     workspace_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("workspaces.gid", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     
     owner_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
     
     team_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("teams.gid", ondelete="SET NULL"),
         nullable=True,
     )
     
     time_period_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("time_periods.gid", ondelete="SET NULL"),
         nullable=True,
     )
@@ -75,11 +115,13 @@ class Goal(AsanaBase):
     team: Mapped[Optional["Team"]] = relationship("Team")
     time_period: Mapped[Optional["TimePeriod"]] = relationship("TimePeriod")
     
+    # Collections never lazy load: select them with selectinload
     relationships_from: Mapped[List["GoalRelationship"]] = relationship(
         "GoalRelationship",
         foreign_keys="GoalRelationship.supporting_goal_gid",
         back_populates="supporting_goal",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     
     relationships_to: Mapped[List["GoalRelationship"]] = relationship(
@@ -87,77 +129,150 @@ class Goal(AsanaBase):
         foreign_keys="GoalRelationship.supported_goal_gid",
         back_populates="supported_goal",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     
     status_updates: Mapped[List["StatusUpdate"]] = relationship(
         "StatusUpdate",
         back_populates="goal",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     
-    @property
-    def resource_type(self) -> str:
-        return "goal"
+    resource_type: ClassVar[str] = "goal"
     
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        response = {
-            "gid": self.gid,
-            "resource_type": self.resource_type,
-            "name": self.name,
-            "notes": self.notes,
-            "html_notes": self.html_notes,
-            "status": self.status,
-            "is_workspace_level": self.is_workspace_level,
-            "liked": self.liked,
-            "num_likes": self.num_likes,
-            "workspace": {"gid": self.workspace_gid, "resource_type": "workspace"},
-        }
+    _response_cache_attrs = ResponseCacheMixin._response_cache_attrs + (
+        "_workspace_ref",
+        "_owner_ref",
+        "_team_ref",
+        "_time_period_ref",
+        "_due_on_iso",
+        "_start_on_iso",
+    )
+    
+    @cached_property
+    def _due_on_iso(self) -> Optional[str]:
+        return self.due_on.isoformat() if self.due_on else None
+    
+    @cached_property
+    def _start_on_iso(self) -> Optional[str]:
+        return self.start_on.isoformat() if self.start_on else None
+    
+    # Reference dicts are built once per row version and shared between responses
+    @cached_property
+    def _workspace_ref(self) -> dict:
+        return gid_ref(self.workspace_gid, "workspace")
+    
+    @cached_property
+    def _owner_ref(self) -> Optional[dict]:
+        if not self.owner_gid:
+            return None
+        return gid_ref(self.owner_gid, "user")
+    
+    @cached_property
+    def _team_ref(self) -> Optional[dict]:
+        if not self.team_gid:
+            return None
+        return gid_ref(self.team_gid, "team")
+    
+    @cached_property
+    def _time_period_ref(self) -> Optional[dict]:
+        if not self.time_period_gid:
+            return None
+        return gid_ref(self.time_period_gid, "time_period")
+    
+    # Same keys as GOAL_RESPONSE_FIELDS, read from the cached properties above
+    to_response = compile_response(
+        "goal",
+        {
+            **GOAL_RESPONSE_FIELDS,
+            # Deferred unless undefer_group(BODY_GROUP): read without triggering a load
+            "notes": Deferred("notes"),
+            "html_notes": Deferred("html_notes"),
+            "workspace": "_workspace_ref",
+        },
+        {
+            **GOAL_OPTIONAL_RESPONSE_FIELDS,
+            "due_on": "_due_on_iso",
+            "start_on": "_start_on_iso",
+            "owner": "_owner_ref",
+            "team": "_team_ref",
+            "time_period": "_time_period_ref",
+        },
+    )
+    
+    @classmethod
+    async def list_rows(
+        cls,
+        db: AsyncSession,
+        workspace_gid: str,
+        team_gid: Optional[str] = None,
+        is_workspace_level: Optional[bool] = None,
+        time_period_gids: Optional[List[str]] = None,
+    ) -> Sequence[Row]:
+        """
+        Select just the columns a goal response needs, ordered by name.
         
-        if self.due_on:
-            response["due_on"] = self.due_on.isoformat()
-        if self.start_on:
-            response["start_on"] = self.start_on.isoformat()
-        if self.owner_gid:
-            response["owner"] = {"gid": self.owner_gid, "resource_type": "user"}
-        if self.team_gid:
-            response["team"] = {"gid": self.team_gid, "resource_type": "team"}
-        if self.time_period_gid:
-            response["time_period"] = {"gid": self.time_period_gid, "resource_type": "time_period"}
-            
-        if self.metric_type:
-            response["metric"] = {
-                "metric_type": self.metric_type,
-                "unit": self.metric_unit,
-                "precision": self.metric_precision,
-                "currency_code": self.metric_currency_code,
-                "initial_number_value": self.metric_initial_number_value,
-                "target_number_value": self.metric_target_number_value,
-                "current_number_value": self.metric_current_number_value,
-            }
-            
-        return response
+        Rows skip ORM instance construction and identity-map bookkeeping;
+        serialize them with ``goal_row_to_response`` or ``write_goal_json``.
+        """
+        query = (
+            select(*[getattr(cls, column) for column in GOAL_LIST_COLUMNS])
+            .where(cls.workspace_gid == workspace_gid)
+        )
+        if team_gid:
+            query = query.where(cls.team_gid == team_gid)
+        if is_workspace_level is not None:
+            query = query.where(cls.is_workspace_level == is_workspace_level)
+        if time_period_gids:
+            query = query.where(cls.time_period_gid.in_(time_period_gids))
+        
+        result = await db.execute(query.order_by(cls.name))
+        return result.all()
+
+
+# Columns of Goal.list_rows rows, read by name in goal_row_to_response and write_goal_json
+GOAL_LIST_COLUMNS = (
+    "gid", "name", "notes", "html_notes", "status", "is_workspace_level",
+    "liked", "num_likes", "workspace_gid", "due_on", "start_on", "owner_gid",
+    "team_gid", "time_period_gid", "metric",
+)
+
+
+# Rows from Goal.list_rows expose the same attribute names as Goal itself
+goal_row_to_response = compile_response(
+    "goal", GOAL_RESPONSE_FIELDS, GOAL_OPTIONAL_RESPONSE_FIELDS,
+)
+
+
+# Encodes list rows straight into the response buffer, skipping the per-row dict
+write_goal_json = compile_json_writer(
+    "goal", GOAL_RESPONSE_FIELDS, GOAL_OPTIONAL_RESPONSE_FIELDS,
+)
 
 
 class GoalRelationship(AsanaBase):
     """Relationship between goals (supporting/supported)."""
     __tablename__ = "goal_relationships"
+    __table_args__ = (
+        # Supporting-goal lookups under a supported goal
+        Index("ix_goal_relationships_supported_supporting", "supported_goal_gid", "supporting_goal_gid"),
+    )
     
     # Contribution weight (0-1)
     contribution_weight: Mapped[float] = mapped_column(Float, default=1.0, nullable=False)
     
     # Foreign keys
     supporting_goal_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("goals.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     supported_goal_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("goals.gid", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     
     # Relationships
@@ -172,17 +287,15 @@ class GoalRelationship(AsanaBase):
         back_populates="relationships_to",
     )
     
-    @property
-    def resource_type(self) -> str:
-        return "goal_relationship"
+    resource_type: ClassVar[str] = "goal_relationship"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
         return {
             "gid": self.gid,
             "resource_type": self.resource_type,
-            "supporting_goal": {"gid": self.supporting_goal_gid, "resource_type": "goal"},
-            "supported_goal": {"gid": self.supported_goal_gid, "resource_type": "goal"},
+            "supporting_goal": gid_ref(self.supporting_goal_gid, "goal"),
+            "supported_goal": gid_ref(self.supported_goal_gid, "goal"),
             "contribution_weight": self.contribution_weight,
         }
 
@@ -192,18 +305,18 @@ class GoalMembership(AsanaBase):
     __tablename__ = "goal_memberships"
     
     # Role (owner, member)
-    role: Mapped[str] = mapped_column(String(50), default="member", nullable=False)
+    role: Mapped[str] = mapped_column(SmallEnum(*GOAL_MEMBERSHIP_ROLES), default="member", nullable=False)
     
     # Foreign keys
     goal_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("goals.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     
     member_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -213,45 +326,46 @@ class GoalMembership(AsanaBase):
     goal: Mapped["Goal"] = relationship("Goal")
     member: Mapped["User"] = relationship("User")
     
-    @property
-    def resource_type(self) -> str:
-        return "goal_membership"
+    resource_type: ClassVar[str] = "goal_membership"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
         return {
             "gid": self.gid,
             "resource_type": self.resource_type,
-            "goal": {"gid": self.goal_gid, "resource_type": "goal"},
-            "member": {"gid": self.member_gid, "resource_type": "user"},
+            "goal": gid_ref(self.goal_gid, "goal"),
+            "member": gid_ref(self.member_gid, "user"),
             "role": self.role,
         }
 
 
-class StatusUpdate(AsanaBase):
+class StatusUpdate(ResponseCacheMixin, AsanaBase):
     """Status update for goals and portfolios."""
     __tablename__ = "status_updates"
+    __table_args__ = (
+        # Status updates for a goal are listed newest first
+        Index("ix_status_updates_goal_created", "goal_gid", "created_at"),
+    )
     
     title: Mapped[str] = mapped_column(String(255), nullable=False)
-    text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    html_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    text: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group=BODY_GROUP)
+    html_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, deferred_group=BODY_GROUP)
     
     # Status type (on_track, at_risk, off_track, on_hold, complete)
-    status_type: Mapped[str] = mapped_column(String(50), default="on_track", nullable=False)
+    status_type: Mapped[str] = mapped_column(SmallEnum(*STATUS_TYPES), default="on_track", nullable=False)
     
     # Resource subtype
     resource_subtype: Mapped[str] = mapped_column(String(50), default="status_update", nullable=False)
     
     # Foreign keys
     goal_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("goals.gid", ondelete="CASCADE"),
         nullable=True,
-        index=True,
     )
     
     author_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
@@ -260,9 +374,13 @@ class StatusUpdate(AsanaBase):
     goal: Mapped[Optional["Goal"]] = relationship("Goal", back_populates="status_updates")
     author: Mapped[Optional["User"]] = relationship("User")
     
-    @property
-    def resource_type(self) -> str:
-        return "status_update"
+    resource_type: ClassVar[str] = "status_update"
+    
+    _response_cache_attrs = ResponseCacheMixin._response_cache_attrs + ("_created_at_iso",)
+    
+    @cached_property
+    def _created_at_iso(self) -> Optional[str]:
+        return iso_utc(self.created_at)
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -271,16 +389,17 @@ class StatusUpdate(AsanaBase):
             "resource_type": self.resource_type,
             "resource_subtype": self.resource_subtype,
             "title": self.title,
-            "text": self.text,
-            "html_text": self.html_text,
+            # Deferred columns: read without triggering a load
+            "text": self.__dict__.get("text"),
+            "html_text": self.__dict__.get("html_text"),
             "status_type": self.status_type,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self._created_at_iso,
         }
         
         if self.goal_gid:
-            response["parent"] = {"gid": self.goal_gid, "resource_type": "goal"}
+            response["parent"] = gid_ref(self.goal_gid, "goal")
         if self.author_gid:
-            response["author"] = {"gid": self.author_gid, "resource_type": "user"}
+            response["author"] = gid_ref(self.author_gid, "user")
             
         return response
 
@@ -1,8 +1,10 @@
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING, ClassVar
 from sqlalchemy import String, ForeignKey, Text, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import AsanaBase
+from app.models.types import GID, SmallEnum
+from app.models.serializers import gid_ref
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -15,19 +17,23 @@ class Job(AsanaBase):
     # Resource subtype
     resource_subtype: Mapped[str] = mapped_column(String(50), nullable=False)
     
-    # Status (not_started, in_progress, succeeded, failed)
-    status: Mapped[str] = mapped_column(String(50), default="not_started", nullable=False)
+    # Status (stored as SMALLINT codes: only ever append)
+    status: Mapped[str] = mapped_column(
+        SmallEnum("not_started", "in_progress", "succeeded", "failed"),
+        default="not_started",
+        nullable=False,
+    )
     
     # New project/task GID if applicable
-    new_project_gid: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
-    new_task_gid: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+    new_project_gid: Mapped[Optional[str]] = mapped_column(GID, nullable=True)
+    new_task_gid: Mapped[Optional[str]] = mapped_column(GID, nullable=True)
     
     # New project template GID if applicable
-    new_project_template_gid: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+    new_project_template_gid: Mapped[Optional[str]] = mapped_column(GID, nullable=True)
     
     # Created by user
     created_by_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
@@ -35,9 +41,7 @@ class Job(AsanaBase):
     # Relationships
     created_by: Mapped[Optional["User"]] = relationship("User")
     
-    @property
-    def resource_type(self) -> str:
-        return "job"
+    resource_type: ClassVar[str] = "job"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -49,9 +53,9 @@ class Job(AsanaBase):
         }
         
         if self.new_project_gid:
-            response["new_project"] = {"gid": self.new_project_gid, "resource_type": "project"}
+            response["new_project"] = gid_ref(self.new_project_gid, "project")
         if self.new_task_gid:
-            response["new_task"] = {"gid": self.new_task_gid, "resource_type": "task"}
+            response["new_task"] = gid_ref(self.new_task_gid, "task")
         if self.new_project_template_gid:
             response["new_project_template"] = {
                 "gid": self.new_project_template_gid,
@@ -1,8 +1,11 @@
-from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, ForeignKey, Text
+from typing import Optional, TYPE_CHECKING, ClassVar
+from sqlalchemy import ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.timefmt import iso_utc
 from app.models.base import AsanaBase
+from app.models.types import GID, SmallEnum
+from app.models.serializers import gid_ref
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -13,15 +16,19 @@ class OrganizationExport(AsanaBase):
     """Organization export job for data export."""
     __tablename__ = "organization_exports"
     
-    # State (pending, started, finished, error)
-    state: Mapped[str] = mapped_column(String(50), default="pending", nullable=False)
+    # State (stored as SMALLINT codes: only ever append)
+    state: Mapped[str] = mapped_column(
+        SmallEnum("pending", "started", "finished", "error"),
+        default="pending",
+        nullable=False,
+    )
     
     # Download URL when finished
     download_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Organization/workspace GID
     organization_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("workspaces.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -29,7 +36,7 @@ class OrganizationExport(AsanaBase):
     
     # Created by user
     created_by_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
@@ -38,9 +45,7 @@ class OrganizationExport(AsanaBase):
     organization: Mapped["Workspace"] = relationship("Workspace")
     created_by: Mapped[Optional["User"]] = relationship("User")
     
-    @property
-    def resource_type(self) -> str:
-        return "organization_export"
+    resource_type: ClassVar[str] = "organization_export"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -48,8 +53,8 @@ class OrganizationExport(AsanaBase):
             "gid": self.gid,
             "resource_type": self.resource_type,
             "state": self.state,
-            "organization": {"gid": self.organization_gid, "resource_type": "workspace"},
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "organization": gid_ref(self.organization_gid, "workspace"),
+            "created_at": iso_utc(self.created_at),
         }
         
         if self.download_url:
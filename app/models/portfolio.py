@@ -1,8 +1,12 @@
-from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, Boolean, ForeignKey, Text, Integer
+from typing import Optional, List, TYPE_CHECKING, ClassVar
+from sqlalchemy import Column, String, Boolean, ForeignKey, Text, Integer, Index, Table
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import AsanaBase
+from app.core.timefmt import iso_utc
+from app.database import Base
+from app.models.base import AsanaBase, ResponseCacheMixin, utc_now
+from app.models.types import GID, SmallEnum, UTCDateTime
+from app.models.serializers import gid_ref
 
 if TYPE_CHECKING:
     from app.models.workspace import Workspace
@@ -10,9 +14,16 @@ if TYPE_CHECKING:
     from app.models.project import Project
 
 
-class Portfolio(AsanaBase):
+# Stored as SMALLINT codes: only ever append
+PORTFOLIO_ACCESS_LEVELS = ("admin", "editor", "viewer")
+
+class Portfolio(ResponseCacheMixin, AsanaBase):
     """Portfolio model for grouping projects."""
     __tablename__ = "portfolios"
+    __table_args__ = (
+        # Workspace portfolio listings are ordered by name
+        Index("ix_portfolios_workspace_name", "workspace_gid", "name"),
+    )
     
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     
@@ -24,40 +35,43 @@ class Portfolio(AsanaBase):
     
     # Foreign keys
     workspace_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("workspaces.gid", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     
     owner_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
     
     # Current status update
-    current_status_update_gid: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
+    current_status_update_gid: Mapped[Optional[str]] = mapped_column(GID, nullable=True)
     
     # Relationships
     workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="portfolios")
     owner: Mapped[Optional["User"]] = relationship("User", foreign_keys=[owner_gid])
     
+    # Collections never lazy load: select them with selectinload
     memberships: Mapped[List["PortfolioMembership"]] = relationship(
         "PortfolioMembership",
         back_populates="portfolio",
         cascade="all, delete-orphan",
+        lazy="raise_on_sql",
     )
     
-    items: Mapped[List["PortfolioItem"]] = relationship(
-        "PortfolioItem",
-        back_populates="portfolio",
-        cascade="all, delete-orphan",
+    # Read-only: items are added and removed with Core statements on
+    # portfolio_items so that their order is set explicitly
+    items: Mapped[List["Project"]] = relationship(
+        "Project",
+        secondary=lambda: portfolio_items,
+        order_by=lambda: portfolio_items.c.order,
+        viewonly=True,
+        lazy="raise_on_sql",
     )
     
-    @property
-    def resource_type(self) -> str:
-        return "portfolio"
+    resource_type: ClassVar[str] = "portfolio"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -67,12 +81,12 @@ class Portfolio(AsanaBase):
             "name": self.name,
             "color": self.color,
             "public": self.public,
-            "workspace": {"gid": self.workspace_gid, "resource_type": "workspace"},
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "workspace": gid_ref(self.workspace_gid, "workspace"),
+            "created_at": iso_utc(self.created_at),
         }
         
         if self.owner_gid:
-            response["owner"] = {"gid": self.owner_gid, "resource_type": "user"}
+            response["owner"] = gid_ref(self.owner_gid, "user")
             
         return response
 
@@ -83,67 +97,69 @@ class PortfolioMembership(AsanaBase):
     
     # Foreign keys
     portfolio_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("portfolios.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     user_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     
     # Access level
-    access_level: Mapped[str] = mapped_column(String(50), default="editor", nullable=False)
+    access_level: Mapped[str] = mapped_column(
+        SmallEnum(*PORTFOLIO_ACCESS_LEVELS),
+        default="editor",
+        nullable=False,
+    )
     
     # Relationships
     portfolio: Mapped["Portfolio"] = relationship("Portfolio", back_populates="memberships")
     user: Mapped["User"] = relationship("User")
     
-    @property
-    def resource_type(self) -> str:
-        return "portfolio_membership"
+    resource_type: ClassVar[str] = "portfolio_membership"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
         return {
             "gid": self.gid,
             "resource_type": self.resource_type,
-            "portfolio": {"gid": self.portfolio_gid, "resource_type": "portfolio"},
-            "user": {"gid": self.user_gid, "resource_type": "user"},
+            "portfolio": gid_ref(self.portfolio_gid, "portfolio"),
+            "user": gid_ref(self.user_gid, "user"),
             "access_level": self.access_level,
         }
 
 
-class PortfolioItem(AsanaBase):
-    """Projects in a portfolio."""
-    __tablename__ = "portfolio_items"
-    
-    # Order
-    order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    
-    # Foreign keys
-    portfolio_gid: Mapped[str] = mapped_column(
-        String(32),
+# Projects in a portfolio. Items are never serialized on their own, so they
+# are a plain association table rather than a mapped class
+portfolio_items = Table(
+    "portfolio_items",
+    Base.metadata,
+    Column(
+        "portfolio_gid",
+        GID,
         ForeignKey("portfolios.gid", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
-    )
-    project_gid: Mapped[str] = mapped_column(
-        String(32),
+        primary_key=True,
+    ),
+    Column(
+        "project_gid",
+        GID,
         ForeignKey("projects.gid", ondelete="CASCADE"),
-        nullable=False,
+        primary_key=True,
         index=True,
-    )
-    
-    # Relationships
-    portfolio: Mapped["Portfolio"] = relationship("Portfolio", back_populates="items")
-    project: Mapped["Project"] = relationship("Project")
-    
-    @property
-    def resource_type(self) -> str:
-        return "portfolio_item"
-
+    ),
+    Column("order", Integer, default=0, nullable=False),
+    Column(
+        "modified_at",
+        UTCDateTime,
+        server_default=utc_now(),
+        onupdate=utc_now(),
+        nullable=False,
+    ),
+    # Portfolio items are listed (and appended) in order
+    Index("ix_portfolio_items_portfolio_order", "portfolio_gid", "order"),
+)
 
@@ -1,9 +1,13 @@
-from typing import Optional, List, TYPE_CHECKING
+from typing import Iterable, Optional, List, TYPE_CHECKING, ClassVar
 from datetime import date, datetime
-from sqlalchemy import String, Boolean, ForeignKey, Text, Date, DateTime
+from sqlalchemy import String, Boolean, ForeignKey, Text, Date, DateTime, Index, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.security import generate_gid
 from app.models.base import AsanaBase
+from app.models.types import GID, SmallEnum
+from app.models.serializers import Deferred, Ref, compile_response, gid_ref
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -14,9 +18,18 @@ if TYPE_CHECKING:
     from app.models.custom_field import CustomFieldSetting
 
 
+# Stored as SMALLINT codes: only ever append
+PROJECT_VIEWS = ("list", "board", "calendar", "timeline")
+PRIVACY_SETTINGS = ("public_to_workspace", "private_to_team", "private")
+
+
 class Project(AsanaBase):
     """Project model representing an Asana project."""
     __tablename__ = "projects"
+    __table_args__ = (
+        # Workspace project listings filter on archived and are ordered newest first
+        Index("ix_projects_workspace_archived_created", "workspace_gid", "archived", "created_at"),
+    )
     
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -34,7 +47,7 @@ class Project(AsanaBase):
     color: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     
     # Layout (list, board, calendar, timeline)
-    default_view: Mapped[str] = mapped_column(String(50), default="list", nullable=False)
+    default_view: Mapped[str] = mapped_column(SmallEnum(*PROJECT_VIEWS), default="list", nullable=False)
     
     # Due dates
     due_on: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
@@ -47,14 +60,14 @@ class Project(AsanaBase):
     
     # Owner
     owner_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
     
     # Current status text
     current_status_update_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         nullable=True,
     )
     
@@ -62,98 +75,102 @@ class Project(AsanaBase):
     icon: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     
     # Privacy setting
-    privacy_setting: Mapped[str] = mapped_column(String(50), default="public_to_workspace", nullable=False)
+    privacy_setting: Mapped[str] = mapped_column(
+        SmallEnum(*PRIVACY_SETTINGS),
+        default="public_to_workspace",
+        nullable=False,
+    )
     
     # Foreign keys
     workspace_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("workspaces.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     team_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("teams.gid", ondelete="SET NULL"),
         nullable=True,
         index=True,
     )
     
-    # Relationships
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="projects")
-    team: Mapped[Optional["Team"]] = relationship("Team", back_populates="projects")
-    owner: Mapped[Optional["User"]] = relationship("User", foreign_keys=[owner_gid])
+    # Relationships never lazy load: select them with selectinload when a route needs them.
+    # Child rows are removed by the foreign keys' ON DELETE CASCADE (passive_deletes)
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="projects", lazy="raise_on_sql")
+    team: Mapped[Optional["Team"]] = relationship("Team", back_populates="projects", lazy="raise_on_sql")
+    owner: Mapped[Optional["User"]] = relationship("User", foreign_keys=[owner_gid], lazy="raise_on_sql")
     
     sections: Mapped[List["Section"]] = relationship(
         "Section",
         back_populates="project",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="Section.order",
+        lazy="raise_on_sql",
     )
     
     memberships: Mapped[List["ProjectMembership"]] = relationship(
         "ProjectMembership",
-        back_populates="project",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     statuses: Mapped[List["ProjectStatus"]] = relationship(
         "ProjectStatus",
         back_populates="project",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="ProjectStatus.created_at.desc()",
+        lazy="raise_on_sql",
     )
     
     briefs: Mapped[List["ProjectBrief"]] = relationship(
         "ProjectBrief",
         back_populates="project",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     custom_field_settings: Mapped[List["CustomFieldSetting"]] = relationship(
         "CustomFieldSetting",
         back_populates="project",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
-    @property
-    def resource_type(self) -> str:
-        return "project"
-    
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        response = {
-            "gid": self.gid,
-            "resource_type": self.resource_type,
-            "name": self.name,
-            "notes": self.notes,
-            "html_notes": self.html_notes,
-            "archived": self.archived,
-            "public": self.public,
-            "color": self.color,
-            "default_view": self.default_view,
-            "completed": self.completed,
-            "privacy_setting": self.privacy_setting,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "modified_at": self.modified_at.isoformat() if self.modified_at else None,
-            "workspace": {"gid": self.workspace_gid, "resource_type": "workspace"},
-        }
-        
-        if self.due_on:
-            response["due_on"] = self.due_on.isoformat()
-        if self.due_at:
-            response["due_at"] = self.due_at.isoformat()
-        if self.start_on:
-            response["start_on"] = self.start_on.isoformat()
-        if self.completed_at:
-            response["completed_at"] = self.completed_at.isoformat()
-        if self.owner_gid:
-            response["owner"] = {"gid": self.owner_gid, "resource_type": "user"}
-        if self.team_gid:
-            response["team"] = {"gid": self.team_gid, "resource_type": "team"}
-        if self.icon:
-            response["icon"] = self.icon
-            
-        return response
+    resource_type: ClassVar[str] = "project"
+    
+    to_response = compile_response(
+        "project",
+        required={
+            "name": "name",
+            # Deferred by list endpoints unless requested: read without loading
+            "notes": Deferred("notes"),
+            "html_notes": Deferred("html_notes"),
+            "archived": "archived",
+            "public": "public",
+            "color": "color",
+            "default_view": "default_view",
+            "completed": "completed",
+            "privacy_setting": "privacy_setting",
+            "created_at": "created_at",
+            "modified_at": "modified_at",
+            "workspace": Ref("workspace_gid", "workspace"),
+        },
+        optional={
+            "due_on": "due_on",
+            "due_at": "due_at",
+            "start_on": "start_on",
+            "completed_at": "completed_at",
+            "owner": Ref("owner_gid", "user"),
+            "team": Ref("team_gid", "team"),
+            "icon": "icon",
+        },
+    )
 
 
 class ProjectMembership(AsanaBase):
@@ -161,13 +178,13 @@ class ProjectMembership(AsanaBase):
     __tablename__ = "project_memberships"
     
     user_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     project_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("projects.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -179,21 +196,48 @@ class ProjectMembership(AsanaBase):
     # Write access
     write_access: Mapped[str] = mapped_column(String(50), default="full_write", nullable=False)
     
-    # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="project_memberships")
-    project: Mapped["Project"] = relationship("Project", back_populates="memberships")
-    
-    @property
-    def resource_type(self) -> str:
-        return "project_membership"
+    @classmethod
+    async def bulk_add(
+        cls,
+        db: AsyncSession,
+        project_gid: str,
+        user_gids: Iterable[str],
+        access_level: str = "editor",
+        write_access: str = "full_write",
+    ) -> None:
+        """Add every user who is not yet a member with one SELECT and one INSERT."""
+        user_gids = list(dict.fromkeys(user_gids))
+        if not user_gids:
+            return
+        result = await db.execute(
+            select(cls.user_gid)
+            .where(cls.project_gid == project_gid)
+            .where(cls.user_gid.in_(user_gids))
+        )
+        existing = set(result.scalars().all())
+        rows = [
+            {
+                "gid": generate_gid(),
+                "user_gid": user_gid,
+                "project_gid": project_gid,
+                "access_level": access_level,
+                "write_access": write_access,
+            }
+            for user_gid in user_gids
+            if user_gid not in existing
+        ]
+        if rows:
+            await db.execute(insert(cls).values(rows))
+    
+    resource_type: ClassVar[str] = "project_membership"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
         return {
             "gid": self.gid,
             "resource_type": self.resource_type,
-            "user": {"gid": self.user_gid, "resource_type": "user"},
-            "project": {"gid": self.project_gid, "resource_type": "project"},
+            "user": gid_ref(self.user_gid, "user"),
+            "project": gid_ref(self.project_gid, "project"),
             "access_level": self.access_level,
             "write_access": self.write_access,
         }
@@ -202,6 +246,10 @@ class ProjectMembership(AsanaBase):
 class ProjectStatus(AsanaBase):
     """Project status update."""
     __tablename__ = "project_statuses"
+    __table_args__ = (
+        # Status updates for a project are listed newest first
+        Index("ix_project_statuses_project_created", "project_gid", "created_at"),
+    )
     
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
@@ -212,24 +260,23 @@ class ProjectStatus(AsanaBase):
     
     # Foreign keys
     project_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("projects.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
-    author_gid: Mapped[str] = mapped_column(
-        String(32),
+    author_gid: Mapped[Optional[str]] = mapped_column(
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
     
     # Relationships
     project: Mapped["Project"] = relationship("Project", back_populates="statuses")
     author: Mapped[Optional["User"]] = relationship("User", foreign_keys=[author_gid])
     
-    @property
-    def resource_type(self) -> str:
-        return "project_status"
+    resource_type: ClassVar[str] = "project_status"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -237,13 +284,13 @@ class ProjectStatus(AsanaBase):
             "gid": self.gid,
             "resource_type": self.resource_type,
             "title": self.title,
-            "text": self.text,
-            "html_text": self.html_text,
+            "text": self.__dict__.get("text"),
+            "html_text": self.__dict__.get("html_text"),
             "color": self.color,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "created_at": self.created_at,
         }
         if self.author_gid:
-            response["author"] = {"gid": self.author_gid, "resource_type": "user"}
+            response["author"] = gid_ref(self.author_gid, "user")
         return response
 
 
@@ -257,7 +304,7 @@ class ProjectBrief(AsanaBase):
     
     # Foreign keys
     project_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("projects.gid", ondelete="CASCADE"),
         nullable=False,
         unique=True,
@@ -267,9 +314,7 @@ class ProjectBrief(AsanaBase):
     # Relationships
     project: Mapped["Project"] = relationship("Project", back_populates="briefs")
     
-    @property
-    def resource_type(self) -> str:
-        return "project_brief"
+    resource_type: ClassVar[str] = "project_brief"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -279,7 +324,7 @@ class ProjectBrief(AsanaBase):
             "title": self.title,
             "text": self.text,
             "html_text": self.html_text,
-            "project": {"gid": self.project_gid, "resource_type": "project"},
+            "project": gid_ref(self.project_gid, "project"),
         }
 
 
@@ -298,25 +343,24 @@ class ProjectTemplate(AsanaBase):
     color: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     
     # Template data (JSON stored as text)
-    template_data: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Never serialized, so never loaded unless asked for
+    template_data: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
     
     # Foreign keys
     team_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("teams.gid", ondelete="CASCADE"),
         nullable=True,
         index=True,
     )
     
     owner_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
     
-    @property
-    def resource_type(self) -> str:
-        return "project_template"
+    resource_type: ClassVar[str] = "project_template"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -324,15 +368,16 @@ class ProjectTemplate(AsanaBase):
             "gid": self.gid,
             "resource_type": self.resource_type,
             "name": self.name,
-            "description": self.description,
-            "html_description": self.html_description,
+            "description": self.__dict__.get("description"),
+            "html_description": self.__dict__.get("html_description"),
             "public": self.public,
             "color": self.color,
         }
-        if self.team_gid:
-            response["team"] = {"gid": self.team_gid, "resource_type": "team"}
-        if self.owner_gid:
-            response["owner"] = {"gid": self.owner_gid, "resource_type": "user"}
+        pairs = (
+            ("team", self.team_gid and gid_ref(self.team_gid, "team")),
+            ("owner", self.owner_gid and gid_ref(self.owner_gid, "user")),
+        )
+        response.update([(key, value) for key, value in pairs if value])
         return response
 
 
@@ -1,8 +1,10 @@
-from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, ForeignKey, Integer
+from typing import Optional, List, TYPE_CHECKING, ClassVar
+from sqlalchemy import String, ForeignKey, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import AsanaBase
+from app.models.types import GID
+from app.models.serializers import gid_ref
 
 if TYPE_CHECKING:
     from app.models.project import Project
@@ -12,6 +14,10 @@ if TYPE_CHECKING:
 class Section(AsanaBase):
     """Section model representing a section in a project."""
     __tablename__ = "sections"
+    __table_args__ = (
+        # Project section listings are ordered by position
+        Index("ix_sections_project_order", "project_gid", "order"),
+    )
     
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     
@@ -20,24 +26,25 @@ class Section(AsanaBase):
     
     # Foreign keys
     project_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("projects.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     
     # Relationships
-    project: Mapped["Project"] = relationship("Project", back_populates="sections")
+    project: Mapped["Project"] = relationship("Project", back_populates="sections", lazy="raise_on_sql")
     
     tasks: Mapped[List["Task"]] = relationship(
         "Task",
         back_populates="section",
-        order_by="Task.order",
+        order_by="[Task.order, Task.gid]",
+        # tasks.section_gid is ON DELETE SET NULL, so the tasks need not be loaded
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
-    @property
-    def resource_type(self) -> str:
-        return "section"
+    resource_type: ClassVar[str] = "section"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -45,8 +52,8 @@ class Section(AsanaBase):
             "gid": self.gid,
             "resource_type": self.resource_type,
             "name": self.name,
-            "project": {"gid": self.project_gid, "resource_type": "project"},
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "project": gid_ref(self.project_gid, "project"),
+            "created_at": self.created_at,
         }
 
 
@@ -0,0 +1,162 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+
+import orjson
+
+from app.core.timefmt import iso_utc
+
+
+class Ref(NamedTuple):
+    """Compact ``{"gid": ..., "resource_type": ...}`` reference built from a GID column."""
+    attr: str
+    resource_type: str
+
+
+class Iso(NamedTuple):
+    """Date or timestamp column rendered in ISO 8601 form."""
+    attr: str
+
+
+class Deferred(NamedTuple):
+    """Deferred column, rendered as ``None`` unless it was loaded."""
+    attr: str
+
+
+FieldSpec = Union[str, Ref, Iso, Deferred]
+
+
+@lru_cache(maxsize=4096)
+def gid_ref(gid: str, resource_type: str) -> dict:
+    """
+    Shared ``{"gid": ..., "resource_type": ...}`` reference dict.
+
+    List responses reference the same few workspaces, users and projects
+    over and over, so one dict per (gid, resource_type) is reused instead
+    of building a new one per row. Callers must not mutate the result.
+    """
+    return {"gid": gid, "resource_type": resource_type}
+
+
+def _expression(spec: FieldSpec, value: str) -> str:
+    """Python source rendering ``spec`` given the source for its raw value."""
+    if isinstance(spec, Ref):
+        return f"gid_ref({value}, {spec.resource_type!r})"
+    if isinstance(spec, Iso):
+        return f"iso_utc({value})"
+    return value
+
+
+def _source(spec: FieldSpec) -> str:
+    """Python source reading the raw value for ``spec`` from ``self``."""
+    if isinstance(spec, Deferred):
+        # Loaded column values live in the instance __dict__; reading it
+        # directly never triggers a load (which would fail under asyncio)
+        return f"self.__dict__.get({_attr(spec)!r})"
+    return "self." + _attr(spec)
+
+
+def _attr(spec: FieldSpec) -> str:
+    attr = spec if isinstance(spec, str) else spec.attr
+    if not attr.isidentifier():
+        raise ValueError(f"Invalid attribute name in response spec: {attr!r}")
+    return attr
+
+
+def compile_response(
+    resource_type: str,
+    required: Dict[str, FieldSpec],
+    optional: Optional[Dict[str, FieldSpec]] = None,
+) -> Callable[[Any], dict]:
+    """
+    Compile a ``to_response`` function for a model at class-definition time.
+
+    The generated function builds the response with a single dict literal
+    for the required keys (constant strings such as ``resource_type`` are
+    inlined) and one truthiness check per optional key, in the order given.
+
+    Args:
+        resource_type: Value emitted for the ``resource_type`` key
+        required: Response key -> spec for keys that are always present
+        optional: Response key -> spec for keys emitted only when the
+            underlying attribute is truthy
+
+    Returns:
+        A function taking the model instance and returning the response dict
+    """
+    lines = [
+        "def to_response(self):",
+        "    response = {",
+        '        "gid": self.gid,',
+        f'        "resource_type": {resource_type!r},',
+    ]
+    for key, spec in required.items():
+        lines.append(f"        {key!r}: {_expression(spec, _source(spec))},")
+    lines.append("    }")
+
+    for key, spec in (optional or {}).items():
+        lines.append(f"    value = {_source(spec)}")
+        lines.append("    if value:")
+        lines.append(f"        response[{key!r}] = {_expression(spec, 'value')}")
+    lines.append("    return response")
+
+    namespace = {"iso_utc": iso_utc, "gid_ref": gid_ref}
+    exec(compile("\n".join(lines), f"<to_response {resource_type}>", "exec"), namespace)
+    to_response = namespace["to_response"]
+    to_response.__doc__ = "Convert to API response format."
+    return to_response
+
+
+def _json_fragment(key: str, spec: FieldSpec) -> bytes:
+    """Pre-encoded ``"key":`` prefix for ``spec``, with a ``%b`` slot for its encoded value."""
+    prefix = orjson.dumps(key).replace(b"%", b"%%") + b":"
+    if isinstance(spec, Ref):
+        resource_type = orjson.dumps(spec.resource_type).replace(b"%", b"%%")
+        return prefix + b'{"gid":%b,"resource_type":' + resource_type + b"}"
+    return prefix + b"%b"
+
+
+def _json_value(spec: FieldSpec, value: str) -> str:
+    """Python source encoding the raw value for ``spec`` as JSON bytes."""
+    if isinstance(spec, Iso):
+        return f"dumps(iso_utc({value}))"
+    return f"dumps({value})"
+
+
+def compile_json_writer(
+    resource_type: str,
+    required: Dict[str, FieldSpec],
+    optional: Optional[Dict[str, FieldSpec]] = None,
+) -> Callable[[Any, bytearray], None]:
+    """
+    Compile a function appending an object's API response, encoded as JSON, to a buffer.
+
+    Takes the same specs as ``compile_response`` and produces the same
+    output as ``orjson.dumps(to_response(obj))``, without building the
+    intermediate dict: keys, ``resource_type`` and the reference wrappers
+    are encoded once here, and only the values are encoded per object.
+    Pair it with ``app.utils.response.json_fragments_response``.
+
+    Returns:
+        A function taking the object and a ``bytearray`` to append to
+    """
+    template = b'{"gid":%b,"resource_type":' + orjson.dumps(resource_type).replace(b"%", b"%%")
+    values = ["dumps(self.gid)"]
+    for key, spec in required.items():
+        template += b"," + _json_fragment(key, spec)
+        values.append(_json_value(spec, _source(spec)))
+
+    lines = [
+        "def write_json(self, buf):",
+        f"    buf += {template!r} % ({', '.join(values)},)",
+    ]
+    for key, spec in (optional or {}).items():
+        lines.append(f"    value = {_source(spec)}")
+        lines.append("    if value:")
+        lines.append(f"        buf += {b',' + _json_fragment(key, spec)!r} % {_json_value(spec, 'value')}")
+    lines.append('    buf += b"}"')
+
+    namespace = {"iso_utc": iso_utc, "dumps": orjson.dumps}
+    exec(compile("\n".join(lines), f"<write_json {resource_type}>", "exec"), namespace)
+    write_json = namespace["write_json"]
+    write_json.__doc__ = "Append the API response, encoded as JSON, to ``buf``."
+    return write_json
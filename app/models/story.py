@@ -1,8 +1,10 @@
-from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, Boolean, ForeignKey, Text, Integer
+from typing import Optional, TYPE_CHECKING, ClassVar
+from sqlalchemy import String, Boolean, ForeignKey, Text, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import AsanaBase
+from app.models.types import GID
+from app.models.serializers import Deferred, Ref, compile_response
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -12,6 +14,10 @@ if TYPE_CHECKING:
 class Story(AsanaBase):
     """Story model representing comments and system updates on tasks."""
     __tablename__ = "stories"
+    __table_args__ = (
+        # Task stories are listed oldest first
+        Index("ix_stories_target_created", "target_gid", "created_at"),
+    )
     
     # Resource subtype
     # comment, attachment, like, assigned, due_date_changed, etc.
@@ -42,50 +48,45 @@ class Story(AsanaBase):
     
     # Foreign keys
     created_by_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
         index=True,
     )
     
     target_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("tasks.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     
     # Relationships
-    created_by: Mapped[Optional["User"]] = relationship("User", back_populates="stories")
-    target_task: Mapped["Task"] = relationship("Task", back_populates="stories")
+    created_by: Mapped[Optional["User"]] = relationship("User", back_populates="stories", lazy="raise_on_sql")
+    target_task: Mapped["Task"] = relationship("Task", back_populates="stories", lazy="raise_on_sql")
     
-    @property
-    def resource_type(self) -> str:
-        return "story"
+    resource_type: ClassVar[str] = "story"
     
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        response = {
-            "gid": self.gid,
-            "resource_type": self.resource_type,
-            "resource_subtype": self.resource_subtype,
-            "text": self.text,
-            "html_text": self.html_text,
-            "is_pinned": self.is_pinned,
-            "is_edited": self.is_edited,
-            "liked": self.liked,
-            "num_likes": self.num_likes,
-            "type": self.type,
-            "source": self.source,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "target": {"gid": self.target_gid, "resource_type": "task"},
-        }
-        
-        if self.created_by_gid:
-            response["created_by"] = {"gid": self.created_by_gid, "resource_type": "user"}
-        if self.sticker_name:
-            response["sticker_name"] = self.sticker_name
-            
-        return response
+    to_response = compile_response(
+        "story",
+        required={
+            "resource_subtype": "resource_subtype",
+            # Deferred by list endpoints unless requested: read without loading
+            "text": Deferred("text"),
+            "html_text": Deferred("html_text"),
+            "is_pinned": "is_pinned",
+            "is_edited": "is_edited",
+            "liked": "liked",
+            "num_likes": "num_likes",
+            "type": "type",
+            "source": "source",
+            "created_at": "created_at",
+            "target": Ref("target_gid", "task"),
+        },
+        optional={
+            "created_by": Ref("created_by_gid", "user"),
+            "sticker_name": "sticker_name",
+        },
+    )
 
 
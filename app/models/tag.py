@@ -1,8 +1,10 @@
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, TYPE_CHECKING, ClassVar
 from sqlalchemy import String, ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import AsanaBase
+from app.models.types import GID
+from app.models.serializers import gid_ref
 
 if TYPE_CHECKING:
     from app.models.workspace import Workspace
@@ -23,24 +25,23 @@ class Tag(AsanaBase):
     
     # Foreign keys
     workspace_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("workspaces.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     
     # Relationships
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="tags")
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="tags", lazy="raise_on_sql")
     
     task_tags: Mapped[List["TaskTag"]] = relationship(
         "TaskTag",
-        back_populates="tag",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
-    @property
-    def resource_type(self) -> str:
-        return "tag"
+    resource_type: ClassVar[str] = "tag"
     
     def to_response(self) -> dict:
         """Convert to API response format."""
@@ -48,15 +49,15 @@ class Tag(AsanaBase):
             "gid": self.gid,
             "resource_type": self.resource_type,
             "name": self.name,
-            "workspace": {"gid": self.workspace_gid, "resource_type": "workspace"},
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "workspace": gid_ref(self.workspace_gid, "workspace"),
+            "created_at": self.created_at,
         }
         
-        if self.color:
-            response["color"] = self.color
-        if self.notes:
-            response["notes"] = self.notes
-            
+        pairs = (
+            ("color", self.color),
+            ("notes", self.__dict__.get("notes")),
+        )
+        response.update([(key, value) for key, value in pairs if value])
         return response
 
 
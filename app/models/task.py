@@ -1,31 +1,75 @@
-from typing import Optional, List, TYPE_CHECKING
+from typing import Iterable, Optional, List, TYPE_CHECKING, ClassVar
 from datetime import date, datetime
-from sqlalchemy import String, Boolean, ForeignKey, Text, Date, DateTime, Integer, Table, Column
+from sqlalchemy import (
+    String, Boolean, ForeignKey, Text, Date, DateTime, Integer, Table, Column, Index, Select,
+    event, null, select,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import AsanaBase
-from app.database import Base
+from app.models.types import GID, SmallEnum
+from app.models.serializers import Deferred, Ref, compile_response
+from app.database import Base, create_subtask_count_trigger
 
 if TYPE_CHECKING:
     from app.models.user import User
     from app.models.section import Section
-    from app.models.project import Project
     from app.models.story import Story
     from app.models.attachment import Attachment
-    from app.models.tag import Tag
     from app.models.custom_field import TaskCustomFieldValue
 
 
+# Stored as SMALLINT codes: only ever append
+TASK_SUBTYPES = ("default_task", "milestone", "section", "approval")
+APPROVAL_STATUSES = ("pending", "approved", "rejected", "changes_requested")
+ASSIGNEE_STATUSES = ("inbox", "today", "upcoming", "later", "new")
+
+# Task response keys, shared by Task.to_response and task_row_to_response
+TASK_RESPONSE_FIELDS = {
+    "resource_subtype": "resource_subtype",
+    "name": "name",
+    "notes": "notes",
+    "html_notes": "html_notes",
+    "completed": "completed",
+    "liked": "liked",
+    "num_likes": "num_likes",
+    "num_subtasks": "num_subtasks",
+    "created_at": "created_at",
+    "modified_at": "modified_at",
+}
+# Optional keys are only emitted when set
+TASK_OPTIONAL_RESPONSE_FIELDS = {
+    "completed_at": "completed_at",
+    "due_on": "due_on",
+    "due_at": "due_at",
+    "start_on": "start_on",
+    "start_at": "start_at",
+    "assignee": Ref("assignee_gid", "user"),
+    "parent": Ref("parent_gid", "task"),
+    "approval_status": "approval_status",
+    "permalink_url": "permalink_url",
+}
+
+
 class Task(AsanaBase):
     """Task model representing an Asana task."""
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Section and subtask listings are ordered by position; order defaults to 0, so gid breaks ties
+        Index("ix_tasks_section_order", "section_gid", "order", "gid"),
+        Index("ix_tasks_parent_order", "parent_gid", "order", "gid"),
+        # Assignee task lists are ordered newest first
+        Index("ix_tasks_assignee_created", "assignee_gid", "created_at"),
+    )
     
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     html_notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Resource subtype (default_task, milestone, section, approval)
-    resource_subtype: Mapped[str] = mapped_column(String(50), default="default_task", nullable=False)
+    resource_subtype: Mapped[str] = mapped_column(SmallEnum(*TASK_SUBTYPES), default="default_task", nullable=False)
     
     # Completion
     completed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -38,7 +82,7 @@ class Task(AsanaBase):
     start_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
     # Approval status (pending, approved, rejected, changes_requested)
-    approval_status: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    approval_status: Mapped[Optional[str]] = mapped_column(SmallEnum(*APPROVAL_STATUSES), nullable=True)
     
     # Liked
     liked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
@@ -48,7 +92,7 @@ class Task(AsanaBase):
     hearted: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     num_hearts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     
-    # Subtasks count
+    # Subtasks count, maintained by the tasks_num_subtasks trigger (installed with the table, below)
     num_subtasks: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     
     # Order within section/project
@@ -59,18 +103,18 @@ class Task(AsanaBase):
     
     # Foreign keys
     assignee_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
         index=True,
     )
     
     # Assignee status/section (deprecated but still used)
-    assignee_status: Mapped[str] = mapped_column(String(50), default="upcoming", nullable=False)
+    assignee_status: Mapped[str] = mapped_column(SmallEnum(*ASSIGNEE_STATUSES), default="upcoming", nullable=False)
     
     # Section (can be null for tasks not in a section)
     section_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("sections.gid", ondelete="SET NULL"),
         nullable=True,
         index=True,
@@ -78,230 +122,257 @@ class Task(AsanaBase):
     
     # Parent task (for subtasks)
     parent_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("tasks.gid", ondelete="CASCADE"),
         nullable=True,
         index=True,
     )
     
-    # Relationships
+    # Relationships never lazy load: select them with selectinload when a route needs them.
+    # Child rows are removed by the foreign keys' ON DELETE CASCADE (passive_deletes)
     assignee: Mapped[Optional["User"]] = relationship(
         "User",
         back_populates="assigned_tasks",
         foreign_keys=[assignee_gid],
+        lazy="raise_on_sql",
     )
     
-    section: Mapped[Optional["Section"]] = relationship("Section", back_populates="tasks")
+    section: Mapped[Optional["Section"]] = relationship("Section", back_populates="tasks", lazy="raise_on_sql")
     
     parent: Mapped[Optional["Task"]] = relationship(
         "Task",
         remote_side="Task.gid",
         back_populates="subtasks",
         foreign_keys=[parent_gid],
+        lazy="raise_on_sql",
     )
     
     subtasks: Mapped[List["Task"]] = relationship(
         "Task",
         back_populates="parent",
         foreign_keys="Task.parent_gid",
-        order_by="Task.order",
+        order_by="[Task.order, Task.gid]",
+        lazy="raise_on_sql",
     )
     
     stories: Mapped[List["Story"]] = relationship(
         "Story",
         back_populates="target_task",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="Story.created_at",
+        lazy="raise_on_sql",
     )
     
     attachments: Mapped[List["Attachment"]] = relationship(
         "Attachment",
         back_populates="parent_task",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     # Many-to-many relationships
     projects: Mapped[List["TaskProject"]] = relationship(
         "TaskProject",
-        back_populates="task",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     task_tags: Mapped[List["TaskTag"]] = relationship(
         "TaskTag",
-        back_populates="task",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     dependencies: Mapped[List["TaskDependency"]] = relationship(
         "TaskDependency",
         foreign_keys="TaskDependency.task_gid",
-        back_populates="task",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     dependents: Mapped[List["TaskDependency"]] = relationship(
         "TaskDependency",
         foreign_keys="TaskDependency.depends_on_gid",
-        back_populates="depends_on",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     followers: Mapped[List["TaskFollower"]] = relationship(
         "TaskFollower",
-        back_populates="task",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     custom_field_values: Mapped[List["TaskCustomFieldValue"]] = relationship(
         "TaskCustomFieldValue",
         back_populates="task",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
+    
+    resource_type: ClassVar[str] = "task"
+    
+    to_response = compile_response(
+        "task",
+        {
+            **TASK_RESPONSE_FIELDS,
+            # List endpoints may defer these: read without triggering a load
+            "notes": Deferred("notes"),
+            "html_notes": Deferred("html_notes"),
+        },
+        TASK_OPTIONAL_RESPONSE_FIELDS,
     )
     
-    @property
-    def resource_type(self) -> str:
-        return "task"
-    
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        response = {
-            "gid": self.gid,
-            "resource_type": self.resource_type,
-            "resource_subtype": self.resource_subtype,
-            "name": self.name,
-            "notes": self.notes,
-            "html_notes": self.html_notes,
-            "completed": self.completed,
-            "liked": self.liked,
-            "num_likes": self.num_likes,
-            "num_subtasks": self.num_subtasks,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "modified_at": self.modified_at.isoformat() if self.modified_at else None,
-        }
+    @classmethod
+    def select_rows(cls, with_notes: bool = True) -> Select:
+        """
+        Select just the columns a task response needs, as plain rows.
         
-        if self.completed_at:
-            response["completed_at"] = self.completed_at.isoformat()
-        if self.due_on:
-            response["due_on"] = self.due_on.isoformat()
-        if self.due_at:
-            response["due_at"] = self.due_at.isoformat()
-        if self.start_on:
-            response["start_on"] = self.start_on.isoformat()
-        if self.start_at:
-            response["start_at"] = self.start_at.isoformat()
-        if self.assignee_gid:
-            response["assignee"] = {"gid": self.assignee_gid, "resource_type": "user"}
-        if self.parent_gid:
-            response["parent"] = {"gid": self.parent_gid, "resource_type": "task"}
-        if self.approval_status:
-            response["approval_status"] = self.approval_status
-        if self.permalink_url:
-            response["permalink_url"] = self.permalink_url
-            
-        return response
+        Rows skip ORM instance construction and identity-map bookkeeping;
+        serialize them with ``task_row_to_response``. Without ``with_notes``
+        the notes columns are selected as NULL.
+        """
+        columns = [getattr(cls, column) for column in TASK_LIST_COLUMNS]
+        if not with_notes:
+            columns[TASK_LIST_COLUMNS.index("notes")] = null().label("notes")
+            columns[TASK_LIST_COLUMNS.index("html_notes")] = null().label("html_notes")
+        return select(*columns)
+
+
+# num_subtasks is maintained by the database, so install the trigger with the table
+event.listen(
+    Task.__table__, "after_create",
+    lambda target, connection, **kw: create_subtask_count_trigger(connection),
+)
+
+
+# Columns of Task.select_rows rows, read by name in task_row_to_response
+TASK_LIST_COLUMNS = (
+    "gid", "resource_subtype", "name", "notes", "html_notes", "completed",
+    "liked", "num_likes", "num_subtasks", "created_at", "modified_at",
+    "completed_at", "due_on", "due_at", "start_on", "start_at",
+    "assignee_gid", "parent_gid", "approval_status", "permalink_url",
+)
 
 
-class TaskProject(AsanaBase):
+# Rows from Task.select_rows expose the same attribute names as Task itself
+task_row_to_response = compile_response(
+    "task", TASK_RESPONSE_FIELDS, TASK_OPTIONAL_RESPONSE_FIELDS,
+)
+
+
+class TaskProject(Base):
     """Association between tasks and projects."""
     __tablename__ = "task_projects"
+    __table_args__ = (
+        # Tasks of a project
+        Index("ix_task_projects_project_task", "project_gid", "task_gid"),
+    )
     
     task_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("tasks.gid", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+        primary_key=True,
     )
     project_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("projects.gid", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+        primary_key=True,
     )
     section_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("sections.gid", ondelete="SET NULL"),
         nullable=True,
     )
     
-    # Relationships
-    task: Mapped["Task"] = relationship("Task", back_populates="projects")
-    project: Mapped["Project"] = relationship("Project")
-    section: Mapped[Optional["Section"]] = relationship("Section")
+    @classmethod
+    async def bulk_add(cls, db: AsyncSession, task_gid: str, project_gids: Iterable[str]) -> None:
+        """Add the task to every project in one INSERT, skipping projects it is already in."""
+        rows = [{"task_gid": task_gid, "project_gid": gid} for gid in dict.fromkeys(project_gids)]
+        if rows:
+            await db.execute(pg_insert(cls).values(rows).on_conflict_do_nothing())
 
 
-class TaskTag(AsanaBase):
+class TaskTag(Base):
     """Association between tasks and tags."""
     __tablename__ = "task_tags"
+    __table_args__ = (
+        # Tasks carrying a tag
+        Index("ix_task_tags_tag_task", "tag_gid", "task_gid"),
+    )
     
     task_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("tasks.gid", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+        primary_key=True,
     )
     tag_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("tags.gid", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+        primary_key=True,
     )
     
-    # Relationships
-    task: Mapped["Task"] = relationship("Task", back_populates="task_tags")
-    tag: Mapped["Tag"] = relationship("Tag", back_populates="task_tags")
+    @classmethod
+    async def bulk_add(cls, db: AsyncSession, task_gid: str, tag_gids: Iterable[str]) -> None:
+        """Tag the task with every tag in one INSERT, skipping tags it already has."""
+        rows = [{"task_gid": task_gid, "tag_gid": gid} for gid in dict.fromkeys(tag_gids)]
+        if rows:
+            await db.execute(pg_insert(cls).values(rows).on_conflict_do_nothing())
 
 
-class TaskDependency(AsanaBase):
+class TaskDependency(Base):
     """Task dependency relationship."""
     __tablename__ = "task_dependencies"
+    __table_args__ = (
+        # Dependents of a task
+        Index("ix_task_dependencies_depends_on_task", "depends_on_gid", "task_gid"),
+    )
     
     task_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("tasks.gid", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+        primary_key=True,
     )
     depends_on_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("tasks.gid", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
-    )
-    
-    # Relationships
-    task: Mapped["Task"] = relationship(
-        "Task",
-        foreign_keys=[task_gid],
-        back_populates="dependencies",
-    )
-    depends_on: Mapped["Task"] = relationship(
-        "Task",
-        foreign_keys=[depends_on_gid],
-        back_populates="dependents",
+        primary_key=True,
     )
 
 
-class TaskFollower(AsanaBase):
+class TaskFollower(Base):
     """Task followers."""
     __tablename__ = "task_followers"
+    __table_args__ = (
+        # Tasks followed by a user
+        Index("ix_task_followers_user_task", "user_gid", "task_gid"),
+    )
     
     task_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("tasks.gid", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+        primary_key=True,
     )
     user_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+        primary_key=True,
     )
     
-    # Relationships
-    task: Mapped["Task"] = relationship("Task", back_populates="followers")
-    user: Mapped["User"] = relationship("User")
+    @classmethod
+    async def bulk_add(cls, db: AsyncSession, task_gid: str, user_gids: Iterable[str]) -> None:
+        """Add every user as a follower in one INSERT, skipping existing followers."""
+        rows = [{"task_gid": task_gid, "user_gid": gid} for gid in dict.fromkeys(user_gids)]
+        if rows:
+            await db.execute(pg_insert(cls).values(rows).on_conflict_do_nothing())
 
 
 class TaskTemplate(AsanaBase):
@@ -312,36 +383,33 @@ class TaskTemplate(AsanaBase):
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Template data (JSON stored as text)
-    template_data: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Never serialized, so never loaded unless asked for
+    template_data: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True)
     
     # Foreign keys
     project_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("projects.gid", ondelete="CASCADE"),
         nullable=True,
         index=True,
     )
     
     created_by_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
     
-    @property
-    def resource_type(self) -> str:
-        return "task_template"
-    
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        response = {
-            "gid": self.gid,
-            "resource_type": self.resource_type,
-            "name": self.name,
-            "description": self.description,
-        }
-        if self.project_gid:
-            response["project"] = {"gid": self.project_gid, "resource_type": "project"}
-        return response
+    resource_type: ClassVar[str] = "task_template"
+    
+    to_response = compile_response(
+        "task_template",
+        {
+            "name": "name",
+            # The list endpoint defers it unless opt_fields asks for it
+            "description": Deferred("description"),
+        },
+        {"project": Ref("project_gid", "project")},
+    )
 
 
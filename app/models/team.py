@@ -1,8 +1,10 @@
-from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, Boolean, ForeignKey, Text
+from typing import Optional, List, TYPE_CHECKING, ClassVar
+from sqlalchemy import String, Boolean, ForeignKey, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import AsanaBase
+from app.models.types import GID, SmallEnum
+from app.models.serializers import Ref, compile_response
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -10,6 +12,11 @@ if TYPE_CHECKING:
     from app.models.project import Project
 
 
+# Stored as SMALLINT codes: only ever append
+TEAM_VISIBILITIES = ("public", "members", "secret")
+TEAM_ACCESS_LEVELS = ("all_team_members", "only_team_admins")
+
+
 class Team(AsanaBase):
     """Team model representing an Asana team."""
     __tablename__ = "teams"
@@ -19,89 +26,98 @@ class Team(AsanaBase):
     html_description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Visibility: public, members, secret
-    visibility: Mapped[str] = mapped_column(String(50), default="members", nullable=False)
+    visibility: Mapped[str] = mapped_column(
+        SmallEnum(*TEAM_VISIBILITIES),
+        default="members",
+        nullable=False,
+    )
     
     # Edit team name/description setting
     edit_team_name_or_description_access_level: Mapped[str] = mapped_column(
-        String(50), default="all_team_members", nullable=False
+        SmallEnum(*TEAM_ACCESS_LEVELS), default="all_team_members", nullable=False
     )
     
     # Edit team visibility setting
     edit_team_visibility_or_trash_team_access_level: Mapped[str] = mapped_column(
-        String(50), default="only_team_admins", nullable=False
+        SmallEnum(*TEAM_ACCESS_LEVELS), default="only_team_admins", nullable=False
     )
     
     # Guest invite management
     guest_invite_management_access_level: Mapped[str] = mapped_column(
-        String(50), default="only_team_admins", nullable=False
+        SmallEnum(*TEAM_ACCESS_LEVELS), default="only_team_admins", nullable=False
     )
     
     # Join request management
     join_request_management_access_level: Mapped[str] = mapped_column(
-        String(50), default="only_team_admins", nullable=False
+        SmallEnum(*TEAM_ACCESS_LEVELS), default="only_team_admins", nullable=False
     )
     
     # Member invite management
     member_invite_management_access_level: Mapped[str] = mapped_column(
-        String(50), default="only_team_admins", nullable=False
+        SmallEnum(*TEAM_ACCESS_LEVELS), default="only_team_admins", nullable=False
     )
     
     # Team member removal
     team_member_removal_access_level: Mapped[str] = mapped_column(
-        String(50), default="only_team_admins", nullable=False
+        SmallEnum(*TEAM_ACCESS_LEVELS), default="only_team_admins", nullable=False
     )
     
     # Foreign keys
     workspace_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("workspaces.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     
-    # Relationships
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="teams")
+    # Relationships never lazy load: select them with selectinload when a route needs them.
+    # Child rows are removed (or unlinked) by the foreign keys' ON DELETE actions
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="teams", lazy="raise_on_sql")
     
     memberships: Mapped[List["TeamMembership"]] = relationship(
         "TeamMembership",
         back_populates="team",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     projects: Mapped[List["Project"]] = relationship(
         "Project",
         back_populates="team",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
-    @property
-    def resource_type(self) -> str:
-        return "team"
-    
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        return {
-            "gid": self.gid,
-            "resource_type": self.resource_type,
-            "name": self.name,
-            "description": self.description,
-            "html_description": self.html_description,
-            "visibility": self.visibility,
-            "organization": {"gid": self.workspace_gid, "resource_type": "workspace"},
-        }
+    resource_type: ClassVar[str] = "team"
+    
+    to_response = compile_response(
+        "team",
+        required={
+            "name": "name",
+            "description": "description",
+            "html_description": "html_description",
+            "visibility": "visibility",
+            "organization": Ref("workspace_gid", "workspace"),
+        },
+    )
 
 
 class TeamMembership(AsanaBase):
     """Association between users and teams."""
     __tablename__ = "team_memberships"
+    __table_args__ = (
+        # A user's teams, and the check for a user already in a team
+        Index("ix_team_memberships_user_team", "user_gid", "team_gid"),
+    )
     
     user_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     team_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("teams.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -112,23 +128,20 @@ class TeamMembership(AsanaBase):
     is_limited_access: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="team_memberships")
-    team: Mapped["Team"] = relationship("Team", back_populates="memberships")
-    
-    @property
-    def resource_type(self) -> str:
-        return "team_membership"
-    
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        return {
-            "gid": self.gid,
-            "resource_type": self.resource_type,
-            "user": {"gid": self.user_gid, "resource_type": "user"},
-            "team": {"gid": self.team_gid, "resource_type": "team"},
-            "is_admin": self.is_admin,
-            "is_guest": self.is_guest,
-            "is_limited_access": self.is_limited_access,
-        }
+    user: Mapped["User"] = relationship("User", back_populates="team_memberships", lazy="raise_on_sql")
+    team: Mapped["Team"] = relationship("Team", back_populates="memberships", lazy="raise_on_sql")
+    
+    resource_type: ClassVar[str] = "team_membership"
+    
+    to_response = compile_response(
+        "team_membership",
+        required={
+            "user": Ref("user_gid", "user"),
+            "team": Ref("team_gid", "team"),
+            "is_admin": "is_admin",
+            "is_guest": "is_guest",
+            "is_limited_access": "is_limited_access",
+        },
+    )
 
 
@@ -1,9 +1,11 @@
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING, ClassVar
 from datetime import date
 from sqlalchemy import String, ForeignKey, Date
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import AsanaBase
+from app.models.types import GID
+from app.models.serializers import Iso, Ref, compile_response
 
 if TYPE_CHECKING:
     from app.models.workspace import Workspace
@@ -25,7 +27,7 @@ class TimePeriod(AsanaBase):
     
     # Foreign keys
     parent_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("workspaces.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -34,20 +36,17 @@ class TimePeriod(AsanaBase):
     # Relationships
     workspace: Mapped["Workspace"] = relationship("Workspace")
     
-    @property
-    def resource_type(self) -> str:
-        return "time_period"
+    resource_type: ClassVar[str] = "time_period"
     
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        return {
-            "gid": self.gid,
-            "resource_type": self.resource_type,
-            "display_name": self.display_name,
-            "period": self.period,
-            "start_on": self.start_on.isoformat() if self.start_on else None,
-            "end_on": self.end_on.isoformat() if self.end_on else None,
-            "parent": {"gid": self.parent_gid, "resource_type": "workspace"},
-        }
+    to_response = compile_response(
+        "time_period",
+        required={
+            "display_name": "display_name",
+            "period": "period",
+            "start_on": Iso("start_on"),
+            "end_on": Iso("end_on"),
+            "parent": Ref("parent_gid", "workspace"),
+        },
+    )
 
 
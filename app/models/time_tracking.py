@@ -1,9 +1,11 @@
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING, ClassVar
 from datetime import date
-from sqlalchemy import String, ForeignKey, Date, Integer
+from sqlalchemy import ForeignKey, Date, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import AsanaBase
+from app.models.types import GID
+from app.models.serializers import Iso, Ref, compile_response
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -22,14 +24,14 @@ class TimeTrackingEntry(AsanaBase):
     
     # Foreign keys
     task_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("tasks.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
     )
     
     created_by_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
@@ -38,24 +40,19 @@ class TimeTrackingEntry(AsanaBase):
     task: Mapped["Task"] = relationship("Task")
     created_by: Mapped[Optional["User"]] = relationship("User")
     
-    @property
-    def resource_type(self) -> str:
-        return "time_tracking_entry"
+    resource_type: ClassVar[str] = "time_tracking_entry"
     
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        response = {
-            "gid": self.gid,
-            "resource_type": self.resource_type,
-            "duration_minutes": self.duration_minutes,
-            "entered_on": self.entered_on.isoformat() if self.entered_on else None,
-            "task": {"gid": self.task_gid, "resource_type": "task"},
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
-        
-        if self.created_by_gid:
-            response["created_by"] = {"gid": self.created_by_gid, "resource_type": "user"}
-            
-        return response
+    to_response = compile_response(
+        "time_tracking_entry",
+        required={
+            "duration_minutes": "duration_minutes",
+            "entered_on": Iso("entered_on"),
+            "task": Ref("task_gid", "task"),
+            "created_at": Iso("created_at"),
+        },
+        optional={
+            "created_by": Ref("created_by_gid", "user"),
+        },
+    )
 
 
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from typing import Any, Optional, Tuple
+
+import msgpack
+from sqlalchemy import DateTime, LargeBinary, SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+
+class GID(TypeDecorator):
+    """GID stored as raw bytes instead of its hex string.
+    
+    Generated GIDs are 16 hex characters, so they pack into 8 bytes. Binding
+    a value that is not valid hex (e.g. a mistyped GID in a URL) raises
+    ``ValueError``, which ErrorAndTimingMiddleware renders as a 400.
+    """
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        try:
+            return bytes.fromhex(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{value!r} is not a valid GID") from None
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return value.hex()
+
+
+class UTCDateTime(TypeDecorator):
+    """Timestamp stored as naive UTC and loaded as an aware UTC datetime.
+    
+    Aware values are converted to UTC before binding; naive values are taken
+    to already be UTC. Loaded values carry ``timezone.utc`` so they render
+    with an explicit offset wherever they are serialized.
+    """
+    impl = DateTime(timezone=False)
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[datetime], dialect) -> Optional[datetime]:
+        if value is None or value.tzinfo is None:
+            return value
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    def process_result_value(self, value: Optional[datetime], dialect) -> Optional[datetime]:
+        if value is None:
+            return None
+        return value.replace(tzinfo=timezone.utc)
+
+
+class MsgPackType(TypeDecorator):
+    """Structured payload stored as MessagePack bytes."""
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return msgpack.packb(value, use_bin_type=True)
+
+    def process_result_value(self, value: Optional[bytes], dialect) -> Any:
+        if value is None:
+            return None
+        return msgpack.unpackb(value, raw=False)
+
+
+class SmallEnum(TypeDecorator):
+    """Low-cardinality string stored as a SMALLINT index into a fixed list of names.
+    
+    A name's position is its stored code, so new names must only ever be
+    appended. Binding a name outside the list raises ``ValueError``; endpoints
+    taking these values unvalidated check them against the list first.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, *values: str):
+        super().__init__()
+        self.values: Tuple[str, ...] = values
+        self._codes = {name: code for code, name in enumerate(values)}
+
+    def process_bind_param(self, value: Optional[str], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        try:
+            return self._codes[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not one of {', '.join(self.values)}") from None
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return self.values[value]
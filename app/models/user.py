@@ -1,4 +1,5 @@
-from typing import Optional, List, TYPE_CHECKING
+from functools import lru_cache
+from typing import Optional, List, TYPE_CHECKING, ClassVar
 from sqlalchemy import String, Boolean, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -14,6 +15,23 @@ if TYPE_CHECKING:
     from app.models.user_favorites import UserFavorite
 
 
+@lru_cache(maxsize=4096)
+def photo_sizes(photo: str) -> dict:
+    """
+    Shared ``photo`` response dict for a photo URL.
+    
+    Every size points at the same URL, so the dict only depends on it and is
+    built once per URL. Callers must not mutate the result.
+    """
+    return {
+        "image_128x128": photo,
+        "image_60x60": photo,
+        "image_36x36": photo,
+        "image_27x27": photo,
+        "image_21x21": photo,
+    }
+
+
 class User(AsanaBase):
     """User model representing an Asana user."""
     __tablename__ = "users"
@@ -34,17 +52,20 @@ class User(AsanaBase):
         "WorkspaceMembership",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     team_memberships: Mapped[List["TeamMembership"]] = relationship(
         "TeamMembership",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     project_memberships: Mapped[List["ProjectMembership"]] = relationship(
         "ProjectMembership",
-        back_populates="user",
         cascade="all, delete-orphan",
     )
     
@@ -71,9 +92,7 @@ class User(AsanaBase):
         cascade="all, delete-orphan",
     )
     
-    @property
-    def resource_type(self) -> str:
-        return "user"
+    resource_type: ClassVar[str] = "user"
     
     def to_response(self, include_email: bool = False) -> dict:
         """Convert to API response format."""
@@ -85,12 +104,6 @@ class User(AsanaBase):
         if include_email:
             response["email"] = self.email
         if self.photo:
-            response["photo"] = {
-                "image_128x128": self.photo,
-                "image_60x60": self.photo,
-                "image_36x36": self.photo,
-                "image_27x27": self.photo,
-                "image_21x21": self.photo,
-            }
+            response["photo"] = photo_sizes(self.photo)
         return response
 
@@ -1,8 +1,9 @@
 from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import AsanaBase
+from app.models.types import GID
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -12,6 +13,10 @@ if TYPE_CHECKING:
 class UserFavorite(AsanaBase):
     """User favorite resources."""
     __tablename__ = "user_favorites"
+    __table_args__ = (
+        # A user's favorites are listed per workspace
+        Index("ix_user_favorites_user_workspace", "user_gid", "workspace_gid"),
+    )
     
     # Resource being favorited
     resource_gid: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
@@ -19,14 +24,13 @@ class UserFavorite(AsanaBase):
     
     # Foreign keys
     user_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     
     workspace_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("workspaces.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
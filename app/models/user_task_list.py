@@ -1,8 +1,10 @@
-from typing import Optional, TYPE_CHECKING
-from sqlalchemy import String, ForeignKey
+from typing import Optional, TYPE_CHECKING, ClassVar
+from sqlalchemy import String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import AsanaBase
+from app.models.types import GID
+from app.models.serializers import Ref, compile_response
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -12,18 +14,21 @@ if TYPE_CHECKING:
 class UserTaskList(AsanaBase):
     """User task list - My Tasks list for a user in a workspace."""
     __tablename__ = "user_task_lists"
+    __table_args__ = (
+        # A user's task list is looked up per workspace
+        Index("ix_user_task_lists_owner_workspace", "owner_gid", "workspace_gid"),
+    )
     
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     
     # Foreign keys
     owner_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     workspace_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("workspaces.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -33,18 +38,15 @@ class UserTaskList(AsanaBase):
     owner: Mapped["User"] = relationship("User", back_populates="task_lists")
     workspace: Mapped["Workspace"] = relationship("Workspace")
     
-    @property
-    def resource_type(self) -> str:
-        return "user_task_list"
+    resource_type: ClassVar[str] = "user_task_list"
     
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        return {
-            "gid": self.gid,
-            "resource_type": self.resource_type,
-            "name": self.name,
-            "owner": {"gid": self.owner_gid, "resource_type": "user"},
-            "workspace": {"gid": self.workspace_gid, "resource_type": "workspace"},
-        }
+    to_response = compile_response(
+        "user_task_list",
+        required={
+            "name": "name",
+            "owner": Ref("owner_gid", "user"),
+            "workspace": Ref("workspace_gid", "workspace"),
+        },
+    )
 
 
@@ -1,8 +1,11 @@
+from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 from sqlalchemy import String, Boolean, ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import AsanaBase
+from app.models.types import GID, UTCDateTime
+from app.models.serializers import Deferred, Iso, compile_response, gid_ref
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -29,13 +32,13 @@ class Webhook(AsanaBase):
     filters: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Last delivered at timestamp
-    last_success_at: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    last_failure_at: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    last_success_at: Mapped[Optional[datetime]] = mapped_column(UTCDateTime, nullable=True)
+    last_failure_at: Mapped[Optional[datetime]] = mapped_column(UTCDateTime, nullable=True)
     last_failure_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Created by user
     created_by_gid: Mapped[Optional[str]] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="SET NULL"),
         nullable=True,
     )
@@ -43,24 +46,25 @@ class Webhook(AsanaBase):
     # Relationships
     created_by: Mapped[Optional["User"]] = relationship("User")
     
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        response = {
-            "gid": self.gid,
-            "resource_type": "webhook",
-            "resource": {"gid": self.resource_gid, "resource_type": self.resource_type},
-            "target": self.target,
-            "active": self.active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
-        
-        if self.last_success_at:
-            response["last_success_at"] = self.last_success_at
-        if self.last_failure_at:
-            response["last_failure_at"] = self.last_failure_at
-        if self.last_failure_content:
-            response["last_failure_content"] = self.last_failure_content
-            
-        return response
+    @property
+    def _resource_ref(self) -> dict:
+        # resource_type is a column here: the type of the watched resource
+        return gid_ref(self.resource_gid, self.resource_type)
+    
+    to_response = compile_response(
+        "webhook",
+        required={
+            "resource": "_resource_ref",
+            "target": "target",
+            "active": "active",
+            "created_at": Iso("created_at"),
+        },
+        optional={
+            "last_success_at": Iso("last_success_at"),
+            "last_failure_at": Iso("last_failure_at"),
+            # Deferred by the list endpoint unless requested
+            "last_failure_content": Deferred("last_failure_content"),
+        },
+    )
 
 
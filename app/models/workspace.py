@@ -1,9 +1,12 @@
-from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import String, Boolean, ForeignKey, Enum as SQLEnum
+from typing import Optional, List, TYPE_CHECKING, ClassVar
+from sqlalchemy import JSON, String, Boolean, ForeignKey, Enum as SQLEnum, Index
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 import enum
 
 from app.models.base import AsanaBase
+from app.models.types import GID
+from app.models.serializers import Ref, compile_response
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -35,79 +38,102 @@ class Workspace(AsanaBase):
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     is_organization: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
-    # Email domains for organization (JSON array stored as string)
-    email_domains: Mapped[Optional[str]] = mapped_column(String(1000), nullable=True)
+    # Email domains for organization, loaded as a list by the driver
+    # (a native array on PostgreSQL, JSON elsewhere)
+    email_domains: Mapped[Optional[List[str]]] = mapped_column(
+        JSON().with_variant(ARRAY(String(255)), "postgresql"),
+        nullable=True,
+    )
     
-    # Relationships
+    # Relationships never lazy load: select them with selectinload when a route needs them.
+    # Child rows are removed (or unlinked) by the foreign keys' ON DELETE actions
     memberships: Mapped[List["WorkspaceMembership"]] = relationship(
         "WorkspaceMembership",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     teams: Mapped[List["Team"]] = relationship(
         "Team",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     projects: Mapped[List["Project"]] = relationship(
         "Project",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     tags: Mapped[List["Tag"]] = relationship(
         "Tag",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     custom_fields: Mapped[List["CustomField"]] = relationship(
         "CustomField",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     portfolios: Mapped[List["Portfolio"]] = relationship(
         "Portfolio",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
     goals: Mapped[List["Goal"]] = relationship(
         "Goal",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     
+    resource_type: ClassVar[str] = "workspace"
+    
     @property
-    def resource_type(self) -> str:
-        return "workspace"
-    
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        return {
-            "gid": self.gid,
-            "resource_type": self.resource_type,
-            "name": self.name,
-            "is_organization": self.is_organization,
-            "email_domains": self.email_domains.split(",") if self.email_domains else [],
-        }
+    def _email_domains_list(self) -> List[str]:
+        return self.email_domains or []
+    
+    to_response = compile_response(
+        "workspace",
+        required={
+            "name": "name",
+            "is_organization": "is_organization",
+            "email_domains": "_email_domains_list",
+        },
+    )
 
 
 class WorkspaceMembership(AsanaBase):
     """Association between users and workspaces."""
     __tablename__ = "workspace_memberships"
+    __table_args__ = (
+        # Membership checks look up a user in a workspace
+        Index("ix_workspace_memberships_user_workspace", "user_gid", "workspace_gid"),
+    )
     
     user_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("users.gid", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     workspace_gid: Mapped[str] = mapped_column(
-        String(32),
+        GID,
         ForeignKey("workspaces.gid", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -119,23 +145,20 @@ class WorkspaceMembership(AsanaBase):
     is_guest: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="workspace_memberships")
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="memberships")
-    
-    @property
-    def resource_type(self) -> str:
-        return "workspace_membership"
-    
-    def to_response(self) -> dict:
-        """Convert to API response format."""
-        return {
-            "gid": self.gid,
-            "resource_type": self.resource_type,
-            "user": {"gid": self.user_gid, "resource_type": "user"},
-            "workspace": {"gid": self.workspace_gid, "resource_type": "workspace"},
-            "is_admin": self.is_admin,
-            "is_active": self.is_active,
-            "is_guest": self.is_guest,
-        }
+    user: Mapped["User"] = relationship("User", back_populates="workspace_memberships", lazy="raise_on_sql")
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="memberships", lazy="raise_on_sql")
+    
+    resource_type: ClassVar[str] = "workspace_membership"
+    
+    to_response = compile_response(
+        "workspace_membership",
+        required={
+            "user": Ref("user_gid", "user"),
+            "workspace": Ref("workspace_gid", "workspace"),
+            "is_admin": "is_admin",
+            "is_active": "is_active",
+            "is_guest": "is_guest",
+        },
+    )
 
 
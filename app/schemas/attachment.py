@@ -1,16 +1,18 @@
-from typing import Optional
+from typing import Optional, Literal
 from pydantic import BaseModel, Field
 
+from app.schemas.common import CompactBase, Gid, Name255, ORMBase
+
 
 class AttachmentCreate(BaseModel):
     """Schema for creating an attachment (external URL)."""
-    parent: str = Field(..., description="Parent task GID")
-    name: str = Field(..., min_length=1, max_length=255)
+    parent: Gid = Field(..., description="Parent task GID")
+    name: Name255
     url: str = Field(..., description="URL to the attachment")
-    resource_subtype: str = Field(default="external", pattern="^(asana|external|dropbox|gdrive|onedrive|box|vimeo)$")
+    resource_subtype: Literal["asana", "external", "dropbox", "gdrive", "onedrive", "box", "vimeo"] = "external"
 
 
-class AttachmentResponse(BaseModel):
+class AttachmentResponse(ORMBase):
     """Attachment response schema."""
     gid: str
     resource_type: str = "attachment"
@@ -24,18 +26,12 @@ class AttachmentResponse(BaseModel):
     created_at: Optional[str] = None
     parent: Optional[dict] = None
     connected_to_app: bool = False
-    
-    class Config:
-        from_attributes = True
 
 
-class AttachmentCompact(BaseModel):
+class AttachmentCompact(CompactBase):
     """Compact attachment representation."""
     gid: str
     resource_type: str = "attachment"
     name: str
-    
-    class Config:
-        from_attributes = True
 
 
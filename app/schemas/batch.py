@@ -1,11 +1,11 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from pydantic import BaseModel, Field
 
 
 class BatchRequest(BaseModel):
     """Single request in a batch."""
     relative_path: str = Field(..., description="API path relative to /api/1.0")
-    method: str = Field(default="GET", pattern="^(GET|POST|PUT|DELETE|PATCH)$")
+    method: Literal["GET", "POST", "PUT", "DELETE", "PATCH"] = "GET"
     data: Optional[Dict[str, Any]] = None
     options: Optional[Dict[str, Any]] = None
 
@@ -1,10 +1,36 @@
-from typing import Optional, List, Any, Dict, Generic, TypeVar
-from pydantic import BaseModel, Field
+from typing import Annotated, Optional, List, Any, Dict, Generic, TypeVar
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, StringConstraints
+from typing_extensions import TypedDict
 from datetime import datetime
 
 
 T = TypeVar("T")
 
+# Reusable constrained string types for request fields
+Name255 = Annotated[str, StringConstraints(min_length=1, max_length=255)]
+Gid = Annotated[str, StringConstraints(min_length=1)]
+
+
+def _split_comma_separated(value: Any) -> Any:
+    """Split a comma-separated string into its non-empty, stripped parts."""
+    if isinstance(value, str):
+        return [part.strip() for part in value.split(",") if part.strip()]
+    return value
+
+
+# A list of GIDs, also accepted as a comma-separated string
+GidList = Annotated[List[Gid], BeforeValidator(_split_comma_separated)]
+
+
+class ORMBase(BaseModel):
+    """Base for response schemas that can be built from ORM objects."""
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CompactBase(ORMBase):
+    """Base for compact (nested reference) schemas, which are never modified."""
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
 
 class ResourceRef(BaseModel):
     """Reference to a resource."""
@@ -17,7 +43,7 @@ class AsanaResponse(BaseModel, Generic[T]):
     data: T
 
 
-class NextPage(BaseModel):
+class NextPage(TypedDict):
     """Pagination info."""
     offset: str
     path: str
@@ -1,10 +1,12 @@
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Literal
 from pydantic import BaseModel, Field
 
+from app.schemas.common import CompactBase, Gid, Name255, ORMBase
+
 
 class EnumOptionBase(BaseModel):
     """Base enum option schema."""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name255
     color: Optional[str] = None
     enabled: bool = True
 
@@ -17,52 +19,52 @@ class EnumOptionCreate(EnumOptionBase):
 
 class EnumOptionUpdate(BaseModel):
     """Schema for updating an enum option."""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[Name255] = None
     color: Optional[str] = None
     enabled: Optional[bool] = None
 
 
-class EnumOptionResponse(BaseModel):
+class EnumOptionResponse(ORMBase):
     """Enum option response schema."""
     gid: str
     resource_type: str = "enum_option"
     name: str
     color: Optional[str] = None
     enabled: bool = True
-    
-    class Config:
-        from_attributes = True
 
 
 class CustomFieldBase(BaseModel):
     """Base custom field schema."""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name255
     description: Optional[str] = None
-    resource_subtype: str = Field(default="text", pattern="^(text|enum|multi_enum|number|date|people)$")
+    resource_subtype: Literal["text", "enum", "multi_enum", "number", "date", "people"] = "text"
+
+
+CustomFieldFormat = Literal["none", "currency", "percentage", "custom"]
 
 
 class CustomFieldCreate(CustomFieldBase):
     """Schema for creating a custom field."""
-    workspace: str = Field(..., description="Workspace GID")
+    workspace: Gid = Field(..., description="Workspace GID")
     enum_options: Optional[List[EnumOptionCreate]] = None
-    format: Optional[str] = Field(None, pattern="^(none|currency|percentage|custom)$")
+    format: Optional[CustomFieldFormat] = None
     currency_code: Optional[str] = None
     custom_label: Optional[str] = None
-    custom_label_position: Optional[str] = Field(None, pattern="^(prefix|suffix)$")
+    custom_label_position: Optional[Literal["prefix", "suffix"]] = None
     precision: int = 0
 
 
 class CustomFieldUpdate(BaseModel):
     """Schema for updating a custom field."""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[Name255] = None
     description: Optional[str] = None
-    format: Optional[str] = None
+    format: Optional[CustomFieldFormat] = None
     currency_code: Optional[str] = None
     custom_label: Optional[str] = None
     precision: Optional[int] = None
 
 
-class CustomFieldResponse(BaseModel):
+class CustomFieldResponse(ORMBase):
     """Custom field response schema."""
     gid: str
     resource_type: str = "custom_field"
@@ -79,40 +81,31 @@ class CustomFieldResponse(BaseModel):
     is_formula_field: bool = False
     is_important: bool = False
     has_notifications_enabled: bool = False
-    
-    class Config:
-        from_attributes = True
 
 
-class CustomFieldCompact(BaseModel):
+class CustomFieldCompact(CompactBase):
     """Compact custom field representation."""
     gid: str
     resource_type: str = "custom_field"
     name: str
     resource_subtype: str = "text"
-    
-    class Config:
-        from_attributes = True
 
 
 class CustomFieldSettingCreate(BaseModel):
     """Schema for adding a custom field to a project."""
-    custom_field: str = Field(..., description="Custom field GID")
+    custom_field: Gid = Field(..., description="Custom field GID")
     is_important: bool = False
     insert_before: Optional[str] = None
     insert_after: Optional[str] = None
 
 
-class CustomFieldSettingResponse(BaseModel):
+class CustomFieldSettingResponse(ORMBase):
     """Custom field setting response schema."""
     gid: str
     resource_type: str = "custom_field_setting"
     custom_field: dict
     project: dict
     is_important: bool = False
-    
-    class Config:
-        from_attributes = True
 
 
 class TaskCustomFieldValueUpdate(BaseModel):
@@ -1,11 +1,16 @@
-from typing import Optional, List
+from typing import Optional, List, Literal
 from pydantic import BaseModel, Field
 from datetime import date
 
+from app.schemas.common import CompactBase, Gid, Name255, ORMBase, ResourceRef
+from app.schemas.team import TeamCompact
+from app.schemas.user import UserCompact
+from app.schemas.workspace import WorkspaceCompact
+
 
 class MetricBase(BaseModel):
     """Base metric schema for goals."""
-    metric_type: Optional[str] = Field(None, pattern="^(number|percent|currency)$")
+    metric_type: Optional[Literal["number", "percent", "currency"]] = None
     unit: Optional[str] = None
     precision: int = 0
     currency_code: Optional[str] = None
@@ -16,39 +21,39 @@ class MetricBase(BaseModel):
 
 class GoalBase(BaseModel):
     """Base goal schema."""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name255
     notes: Optional[str] = None
     html_notes: Optional[str] = None
 
 
 class GoalCreate(GoalBase):
     """Schema for creating a goal."""
-    workspace: str = Field(..., description="Workspace GID")
-    team: Optional[str] = Field(None, description="Team GID")
-    owner: Optional[str] = Field(None, description="Owner user GID")
-    time_period: Optional[str] = Field(None, description="Time period GID")
+    workspace: Gid = Field(..., description="Workspace GID")
+    team: Optional[Gid] = Field(None, description="Team GID")
+    owner: Optional[Gid] = Field(None, description="Owner user GID")
+    time_period: Optional[Gid] = Field(None, description="Time period GID")
     due_on: Optional[date] = None
     start_on: Optional[date] = None
     is_workspace_level: bool = False
-    status: Optional[str] = Field(None, pattern="^(on_track|at_risk|off_track)$")
+    status: Optional[Literal["on_track", "at_risk", "off_track"]] = None
     metric: Optional[MetricBase] = None
 
 
 class GoalUpdate(BaseModel):
     """Schema for updating a goal."""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[Name255] = None
     notes: Optional[str] = None
     html_notes: Optional[str] = None
     due_on: Optional[date] = None
     start_on: Optional[date] = None
-    owner: Optional[str] = None
-    team: Optional[str] = None
-    time_period: Optional[str] = None
-    status: Optional[str] = Field(None, pattern="^(on_track|at_risk|off_track)$")
+    owner: Optional[Gid] = None
+    team: Optional[Gid] = None
+    time_period: Optional[Gid] = None
+    status: Optional[Literal["on_track", "at_risk", "off_track"]] = None
     liked: Optional[bool] = None
 
 
-class GoalResponse(BaseModel):
+class GoalResponse(ORMBase):
     """Goal response schema."""
     gid: str
     resource_type: str = "goal"
@@ -61,29 +66,23 @@ class GoalResponse(BaseModel):
     is_workspace_level: bool = False
     liked: bool = False
     num_likes: int = 0
-    workspace: Optional[dict] = None
-    owner: Optional[dict] = None
-    team: Optional[dict] = None
-    time_period: Optional[dict] = None
-    metric: Optional[dict] = None
-    
-    class Config:
-        from_attributes = True
+    workspace: Optional[WorkspaceCompact] = None
+    owner: Optional[UserCompact] = None
+    team: Optional[TeamCompact] = None
+    time_period: Optional[ResourceRef] = None
+    metric: Optional[MetricBase] = None
 
 
-class GoalCompact(BaseModel):
+class GoalCompact(CompactBase):
     """Compact goal representation."""
     gid: str
     resource_type: str = "goal"
     name: str
-    
-    class Config:
-        from_attributes = True
 
 
 class GoalRelationshipCreate(BaseModel):
     """Schema for creating a goal relationship."""
-    supporting_resource: str = Field(..., description="Supporting goal GID")
+    supporting_resource: Gid = Field(..., description="Supporting goal GID")
     contribution_weight: float = Field(default=1.0, ge=0, le=1)
 
 
@@ -92,32 +91,29 @@ class GoalRelationshipUpdate(BaseModel):
     contribution_weight: Optional[float] = Field(None, ge=0, le=1)
 
 
-class GoalRelationshipResponse(BaseModel):
+class GoalRelationshipResponse(ORMBase):
     """Goal relationship response schema."""
     gid: str
     resource_type: str = "goal_relationship"
     supporting_goal: dict
     supported_goal: dict
     contribution_weight: float = 1.0
-    
-    class Config:
-        from_attributes = True
 
 
 class StatusUpdateBase(BaseModel):
     """Base status update schema."""
-    title: str = Field(..., min_length=1, max_length=255)
+    title: Name255
     text: Optional[str] = None
     html_text: Optional[str] = None
-    status_type: str = Field(default="on_track", pattern="^(on_track|at_risk|off_track|on_hold|complete)$")
+    status_type: Literal["on_track", "at_risk", "off_track", "on_hold", "complete"] = "on_track"
 
 
 class StatusUpdateCreate(StatusUpdateBase):
     """Schema for creating a status update."""
-    parent: str = Field(..., description="Goal GID")
+    parent: Gid = Field(..., description="Goal GID")
 
 
-class StatusUpdateResponse(BaseModel):
+class StatusUpdateResponse(ORMBase):
     """Status update response schema."""
     gid: str
     resource_type: str = "status_update"
@@ -129,8 +125,5 @@ class StatusUpdateResponse(BaseModel):
     created_at: Optional[str] = None
     author: Optional[dict] = None
     parent: Optional[dict] = None
-    
-    class Config:
-        from_attributes = True
 
 
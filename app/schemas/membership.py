@@ -0,0 +1,23 @@
+from pydantic import BaseModel, Field
+
+from app.schemas.common import GidList
+
+
+class AddMembersRequest(BaseModel):
+    """Request to add members to a project or portfolio."""
+    members: GidList = Field(..., description="User GIDs, as a list or comma-separated")
+
+
+class RemoveMembersRequest(BaseModel):
+    """Request to remove members from a project or portfolio."""
+    members: GidList = Field(..., description="User GIDs, as a list or comma-separated")
+
+
+class AddFollowersRequest(BaseModel):
+    """Request to add followers to a project."""
+    followers: GidList = Field(..., description="User GIDs, as a list or comma-separated")
+
+
+class RemoveFollowersRequest(BaseModel):
+    """Request to remove followers from a project."""
+    followers: GidList = Field(..., description="User GIDs, as a list or comma-separated")
@@ -1,83 +1,69 @@
-from typing import Optional, List
+from typing import Literal, Optional, List
 from pydantic import BaseModel, Field
 
+from app.schemas.common import CompactBase, Gid, Name255, ORMBase
+from app.schemas.user import UserCompact
+from app.schemas.workspace import WorkspaceCompact
+from app.schemas.membership import AddMembersRequest, RemoveMembersRequest
+
 
 class PortfolioBase(BaseModel):
     """Base portfolio schema."""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name255
     color: Optional[str] = None
     public: bool = False
 
 
 class PortfolioCreate(PortfolioBase):
     """Schema for creating a portfolio."""
-    workspace: str = Field(..., description="Workspace GID")
+    workspace: Gid = Field(..., description="Workspace GID")
     members: Optional[List[str]] = None
 
 
 class PortfolioUpdate(BaseModel):
     """Schema for updating a portfolio."""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[Name255] = None
     color: Optional[str] = None
     public: Optional[bool] = None
 
 
-class PortfolioResponse(BaseModel):
+class PortfolioResponse(ORMBase):
     """Portfolio response schema."""
     gid: str
     resource_type: str = "portfolio"
     name: str
     color: Optional[str] = None
     public: bool = False
-    workspace: Optional[dict] = None
-    owner: Optional[dict] = None
+    workspace: Optional[WorkspaceCompact] = None
+    owner: Optional[UserCompact] = None
     created_at: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
 
 
-class PortfolioCompact(BaseModel):
+class PortfolioCompact(CompactBase):
     """Compact portfolio representation."""
     gid: str
-    resource_type: str = "portfolio"
+    resource_type: Literal["portfolio"] = "portfolio"
     name: str
-    
-    class Config:
-        from_attributes = True
 
 
 class AddItemRequest(BaseModel):
     """Request to add an item to a portfolio."""
-    item: str = Field(..., description="Project GID")
+    item: Gid = Field(..., description="Project GID")
     insert_before: Optional[str] = None
     insert_after: Optional[str] = None
 
 
 class RemoveItemRequest(BaseModel):
     """Request to remove an item from a portfolio."""
-    item: str = Field(..., description="Project GID")
-
-
-class AddMembersRequest(BaseModel):
-    """Request to add members to a portfolio."""
-    members: str = Field(..., description="Comma-separated user GIDs")
-
-
-class RemoveMembersRequest(BaseModel):
-    """Request to remove members from a portfolio."""
-    members: str = Field(..., description="Comma-separated user GIDs")
+    item: Gid = Field(..., description="Project GID")
 
 
-class PortfolioMembershipResponse(BaseModel):
+class PortfolioMembershipResponse(ORMBase):
     """Portfolio membership response schema."""
     gid: str
     resource_type: str = "portfolio_membership"
-    portfolio: dict
-    user: dict
+    portfolio: PortfolioCompact
+    user: UserCompact
     access_level: str = "editor"
-    
-    class Config:
-        from_attributes = True
 
 
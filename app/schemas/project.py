@@ -4,11 +4,21 @@ Project schemas based on Asana API Reference.
 Reference: https://developers.asana.com/reference/projects
          https://developers.asana.com/reference/createproject
 """
-from typing import Optional, List
+from typing import Annotated, Any, Dict, Literal, Optional, List, Union
 from enum import Enum
 from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
 from datetime import date
 
+from app.schemas.common import CompactBase, Gid, Name255, NextPage, ORMBase, ResourceRef
+from app.schemas.team import TeamCompact
+from app.schemas.user import UserCompact
+from app.schemas.workspace import WorkspaceCompact
+from app.schemas.membership import (
+    AddMembersRequest, RemoveMembersRequest, AddFollowersRequest, RemoveFollowersRequest,
+)
+from app.schemas.portfolio import PortfolioCompact
+
 
 # =============================================================================
 # COLOR ENUM VALUES (from Asana API)
@@ -25,7 +35,7 @@ from datetime import date
 
 class ProjectBase(BaseModel):
     """Base project schema with common writable fields."""
-    name: Optional[str] = Field(None, min_length=1, max_length=255, description="Name of the project")
+    name: Optional[Name255] = Field(None, description="Name of the project")
     notes: Optional[str] = Field(None, description="Free-form textual description of the project")
     html_notes: Optional[str] = Field(None, description="HTML formatted notes for the project")
 
@@ -43,7 +53,7 @@ class ProjectCreate(ProjectBase):
     - Required: name, workspace (or team for organizations)
     """
     # Required field
-    name: str = Field(..., min_length=1, max_length=255, description="Name of the project")
+    name: Name255 = Field(..., description="Name of the project")
     
     # Location/context (2)
     workspace: Optional[str] = Field(None, description="Workspace GID. Required if team is not specified")
@@ -51,9 +61,8 @@ class ProjectCreate(ProjectBase):
     
     # Privacy (2)
     public: Optional[bool] = Field(None, description="DEPRECATED: Use privacy_setting instead")
-    privacy_setting: Optional[str] = Field(
+    privacy_setting: Optional[Literal["public_to_workspace", "private_to_team", "private"]] = Field(
         None,
-        pattern="^(public_to_workspace|private_to_team|private)$",
         description="Privacy setting: public_to_workspace, private_to_team, or private"
     )
     
@@ -62,9 +71,8 @@ class ProjectCreate(ProjectBase):
         None,
         description="Color of the project (e.g., dark-pink, light-green, none)"
     )
-    default_view: Optional[str] = Field(
+    default_view: Optional[Literal["list", "board", "calendar", "timeline"]] = Field(
         None,
-        pattern="^(list|board|calendar|timeline)$",
         description="Default view: list, board, calendar, or timeline"
     )
     icon: Optional[str] = Field(
@@ -86,24 +94,21 @@ class ProjectCreate(ProjectBase):
     followers: Optional[str] = Field(None, description="Comma-separated user GIDs (Create-only)")
     
     # Access control (3)
-    default_access_level: Optional[str] = Field(
+    default_access_level: Optional[Literal["admin", "editor", "commenter", "viewer"]] = Field(
         None,
-        pattern="^(admin|editor|commenter|viewer)$",
         description="Default access for users who join: admin, editor, commenter, viewer"
     )
-    minimum_access_level_for_customization: Optional[str] = Field(
+    minimum_access_level_for_customization: Optional[Literal["admin", "editor"]] = Field(
         None,
-        pattern="^(admin|editor)$",
         description="Minimum access to modify workflow: admin or editor"
     )
-    minimum_access_level_for_sharing: Optional[str] = Field(
+    minimum_access_level_for_sharing: Optional[Literal["admin", "editor"]] = Field(
         None,
-        pattern="^(admin|editor)$",
         description="Minimum access to share and manage memberships: admin or editor"
     )
     
     # Custom data (1)
-    custom_fields: Optional[dict] = Field(
+    custom_fields: Optional[Dict[str, Any]] = Field(
         None,
         description="Custom field values as {custom_field_gid: value}"
     )
@@ -121,7 +126,7 @@ class ProjectUpdate(BaseModel):
     Note: workspace and team cannot be changed after creation
     """
     # Content (3)
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[Name255] = None
     notes: Optional[str] = None
     html_notes: Optional[str] = None
     
@@ -131,14 +136,11 @@ class ProjectUpdate(BaseModel):
     
     # Privacy (2)
     public: Optional[bool] = Field(None, description="DEPRECATED: Use privacy_setting")
-    privacy_setting: Optional[str] = Field(
-        None,
-        pattern="^(public_to_workspace|private_to_team|private)$"
-    )
+    privacy_setting: Optional[Literal["public_to_workspace", "private_to_team", "private"]] = None
     
     # Display (3)
     color: Optional[str] = None
-    default_view: Optional[str] = Field(None, pattern="^(list|board|calendar|timeline)$")
+    default_view: Optional[Literal["list", "board", "calendar", "timeline"]] = None
     icon: Optional[str] = None
     
     # Dates (2)
@@ -150,24 +152,21 @@ class ProjectUpdate(BaseModel):
     current_status_update: Optional[str] = Field(None, description="Status update GID to set as current")
     
     # Access control (3)
-    default_access_level: Optional[str] = Field(
+    default_access_level: Optional[Literal["admin", "editor", "commenter", "viewer"]] = Field(
         None,
-        pattern="^(admin|editor|commenter|viewer)$",
         description="Default access for users who join: admin, editor, commenter, viewer"
     )
-    minimum_access_level_for_customization: Optional[str] = Field(
+    minimum_access_level_for_customization: Optional[Literal["admin", "editor"]] = Field(
         None,
-        pattern="^(admin|editor)$",
         description="Minimum access to modify workflow: admin or editor"
     )
-    minimum_access_level_for_sharing: Optional[str] = Field(
+    minimum_access_level_for_sharing: Optional[Literal["admin", "editor"]] = Field(
         None,
-        pattern="^(admin|editor)$",
         description="Minimum access to share and manage memberships: admin or editor"
     )
     
     # Custom data (1)
-    custom_fields: Optional[dict] = None
+    custom_fields: Optional[Dict[str, Any]] = None
 
 
 # =============================================================================
@@ -175,41 +174,27 @@ class ProjectUpdate(BaseModel):
 # Based on: https://developers.asana.com/reference/getproject (200 response)
 # =============================================================================
 
-class UserCompact(BaseModel):
-    """Compact user schema for nested responses."""
-    gid: str
-    resource_type: str = "user"
-    name: str
-
-
-class WorkspaceCompact(BaseModel):
-    """Compact workspace schema for nested responses."""
-    gid: str
-    resource_type: str = "workspace"
-    name: str
-
-
-class TeamCompact(BaseModel):
-    """Compact team schema for nested responses."""
+class ProjectCompact(CompactBase):
+    """Compact project representation for nested responses."""
     gid: str
-    resource_type: str = "team"
+    resource_type: Literal["project"] = "project"
     name: str
 
 
-class ProjectTemplateCompact(BaseModel):
+class ProjectTemplateCompact(CompactBase):
     """Compact project template schema for nested responses."""
     gid: str
     resource_type: str = "project_template"
     name: str
 
 
-class ProjectBriefCompact(BaseModel):
+class ProjectBriefCompact(CompactBase):
     """Compact project brief schema for nested responses."""
     gid: str
     resource_type: str = "project_brief"
 
 
-class EnumOptionCompact(BaseModel):
+class EnumOptionCompact(CompactBase):
     """Compact enum option schema for custom fields."""
     gid: str
     resource_type: str = "enum_option"
@@ -218,32 +203,20 @@ class EnumOptionCompact(BaseModel):
     color: Optional[str] = None
 
 
-class DateValue(BaseModel):
+class DateValue(TypedDict, total=False):
     """Date value schema for custom field date values."""
-    date: Optional[str] = None
-    date_time: Optional[str] = None
+    date: Optional[str]
+    date_time: Optional[str]
 
 
-class CustomFieldResponse(BaseModel):
-    """Full custom field response schema for project custom_fields array.
+class CustomFieldResponseBase(BaseModel):
+    """Fields shared by every custom field type in a project's custom_fields array.
     
     Based on: https://developers.asana.com/reference/customfields
     """
     gid: str
     resource_type: str = "custom_field"
     name: str
-    type: str  # "text", "enum", "multi_enum", "number", "date", "people", "formula"
-    
-    # Enum fields
-    enum_options: Optional[List[EnumOptionCompact]] = None
-    enum_value: Optional[EnumOptionCompact] = None
-    multi_enum_values: Optional[List[EnumOptionCompact]] = None
-    
-    # Value fields
-    text_value: Optional[str] = None
-    number_value: Optional[float] = None
-    date_value: Optional[DateValue] = None
-    people_value: Optional[List[UserCompact]] = None
     display_value: Optional[str] = None
     
     # Metadata
@@ -269,20 +242,74 @@ class CustomFieldResponse(BaseModel):
     resource_subtype: Optional[str] = None
 
 
-class CustomFieldSettingResponse(BaseModel):
+class TextCustomField(CustomFieldResponseBase):
+    """Text custom field."""
+    type: Literal["text"]
+    text_value: Optional[str] = None
+
+
+class EnumCustomField(CustomFieldResponseBase):
+    """Single- or multi-select enum custom field."""
+    type: Literal["enum", "multi_enum"]
+    enum_options: Optional[List[EnumOptionCompact]] = None
+    enum_value: Optional[EnumOptionCompact] = None
+    multi_enum_values: Optional[List[EnumOptionCompact]] = None
+
+
+class NumberCustomField(CustomFieldResponseBase):
+    """Number custom field."""
+    type: Literal["number"]
+    number_value: Optional[float] = None
+
+
+class DateCustomField(CustomFieldResponseBase):
+    """Date custom field."""
+    type: Literal["date"]
+    date_value: Optional[DateValue] = None
+
+
+class PeopleCustomField(CustomFieldResponseBase):
+    """People custom field."""
+    type: Literal["people"]
+    people_value: Optional[List[UserCompact]] = None
+
+
+class FormulaCustomField(CustomFieldResponseBase):
+    """Formula custom field, whose computed value is read only."""
+    type: Literal["formula"]
+    number_value: Optional[float] = None
+
+
+# Full custom field response, dispatched on type
+CustomFieldResponse = Annotated[
+    Union[
+        TextCustomField,
+        EnumCustomField,
+        NumberCustomField,
+        DateCustomField,
+        PeopleCustomField,
+        FormulaCustomField,
+    ],
+    Field(discriminator="type"),
+]
+
+
+class CustomFieldSettingResponse(ORMBase):
     """Custom field setting response schema for project custom_field_settings array.
     
     Based on: https://developers.asana.com/reference/customfieldsettings
     """
     gid: str
     resource_type: str = "custom_field_setting"
-    project: Optional[dict] = None  # ProjectCompact (deprecated - use parent)
-    parent: Optional[dict] = None  # ProjectCompact or PortfolioCompact
+    project: Optional[ProjectCompact] = None  # Deprecated - use parent
+    parent: Optional[
+        Annotated[Union[ProjectCompact, PortfolioCompact], Field(discriminator="resource_type")]
+    ] = None
     is_important: bool = False
     custom_field: Optional[CustomFieldResponse] = None
 
 
-class ProjectStatusResponse(BaseModel):
+class ProjectStatusResponse(ORMBase):
     """Project status (deprecated) response schema.
     
     Note: This is deprecated. Use status_updates instead.
@@ -293,14 +320,14 @@ class ProjectStatusResponse(BaseModel):
     title: str
     text: Optional[str] = None
     html_text: Optional[str] = None
-    color: str = "green"  # green, yellow, red, complete
+    color: Literal["green", "yellow", "red", "blue", "complete"] = "green"
     author: Optional[UserCompact] = None
     created_at: Optional[str] = None
     created_by: Optional[UserCompact] = None
     modified_at: Optional[str] = None
 
 
-class StatusUpdateCompact(BaseModel):
+class StatusUpdateCompact(CompactBase):
     """Compact status update schema for current_status_update field."""
     gid: str
     resource_type: str = "status_update"
@@ -313,7 +340,7 @@ class StatusUpdateCompact(BaseModel):
 # Based on: https://developers.asana.com/reference/getproject
 # =============================================================================
 
-class ProjectResponse(BaseModel):
+class ProjectResponse(ORMBase):
     """Full project response schema matching Asana API 200 response.
     
     Based on: https://developers.asana.com/reference/getproject
@@ -377,22 +404,12 @@ class ProjectResponse(BaseModel):
     default_access_level: Optional[str] = None  # "admin", "editor", "commenter", "viewer"
     minimum_access_level_for_customization: Optional[str] = None  # "admin", "editor"
     minimum_access_level_for_sharing: Optional[str] = None  # "admin", "editor"
-    
-    class Config:
-        from_attributes = True
 
 
 # =============================================================================
 # LIST RESPONSE WITH PAGINATION
 # =============================================================================
 
-class NextPage(BaseModel):
-    """Pagination next_page object."""
-    offset: str
-    path: str
-    uri: str
-
-
 class ProjectListResponse(BaseModel):
     """Response schema for GET /projects (list with pagination).
     
@@ -421,20 +438,6 @@ class ErrorResponse(BaseModel):
     errors: List[ErrorDetail]
 
 
-# =============================================================================
-# COMPACT SCHEMAS FOR NESTED USE
-# =============================================================================
-
-class ProjectCompact(BaseModel):
-    """Compact project representation for nested responses."""
-    gid: str
-    resource_type: str = "project"
-    name: str
-    
-    class Config:
-        from_attributes = True
-
-
 # =============================================================================
 # DUPLICATE PROJECT REQUEST
 # =============================================================================
@@ -455,6 +458,26 @@ class DuplicateIncludeOption(str, Enum):
     TASK_PROJECTS = "task_projects"
 
 
+# The same options as a Literal, checked by pydantic-core's literal validator
+DuplicateIncludeValue = Literal[tuple(option.value for option in DuplicateIncludeOption)]
+
+
+# Duplicated unless the request lists what to include (everything but forms)
+DEFAULT_DUPLICATE_INCLUDE = (
+    DuplicateIncludeOption.MEMBERS,
+    DuplicateIncludeOption.NOTES,
+    DuplicateIncludeOption.TASK_NOTES,
+    DuplicateIncludeOption.TASK_ASSIGNEE,
+    DuplicateIncludeOption.TASK_SUBTASKS,
+    DuplicateIncludeOption.TASK_ATTACHMENTS,
+    DuplicateIncludeOption.TASK_DATES,
+    DuplicateIncludeOption.TASK_DEPENDENCIES,
+    DuplicateIncludeOption.TASK_FOLLOWERS,
+    DuplicateIncludeOption.TASK_TAGS,
+    DuplicateIncludeOption.TASK_PROJECTS,
+)
+
+
 class DuplicateScheduleDates(BaseModel):
     """Schedule dates configuration for project duplication."""
     should_skip_weekends: Optional[bool] = Field(None, description="Skip weekends when scheduling")
@@ -467,22 +490,10 @@ class ProjectDuplicateRequest(BaseModel):
     
     Based on: https://developers.asana.com/reference/duplicateproject
     """
-    name: str = Field(..., min_length=1, max_length=255, description="New project name")
+    name: Name255 = Field(..., description="New project name")
     team: Optional[str] = Field(None, description="Target team GID")
-    include: Optional[List[str]] = Field(
-        default=[
-            "members",
-            "notes", 
-            "task_notes",
-            "task_assignee",
-            "task_subtasks",
-            "task_attachments",
-            "task_dates",
-            "task_dependencies",
-            "task_followers",
-            "task_tags",
-            "task_projects"
-        ],
+    include: Optional[List[DuplicateIncludeValue]] = Field(
+        default_factory=lambda: [option.value for option in DEFAULT_DUPLICATE_INCLUDE],
         description="Elements to duplicate: members, notes, forms, task_notes, task_assignee, task_subtasks, task_attachments, task_dates, task_dependencies, task_followers, task_tags, task_projects"
     )
     schedule_dates: Optional[DuplicateScheduleDates] = Field(
@@ -495,42 +506,19 @@ class ProjectDuplicateRequest(BaseModel):
 # PROJECT MEMBERSHIP SCHEMAS
 # =============================================================================
 
-class AddMembersRequest(BaseModel):
-    """Request to add members to a project."""
-    members: str = Field(..., description="Comma-separated user GIDs")
-
-
-class RemoveMembersRequest(BaseModel):
-    """Request to remove members from a project."""
-    members: str = Field(..., description="Comma-separated user GIDs")
-
-
-class AddFollowersRequest(BaseModel):
-    """Request to add followers to a project."""
-    followers: str = Field(..., description="Comma-separated user GIDs")
-
-
-class RemoveFollowersRequest(BaseModel):
-    """Request to remove followers from a project."""
-    followers: str = Field(..., description="Comma-separated user GIDs")
-
-
-class ProjectMembershipResponse(BaseModel):
+class ProjectMembershipResponse(ORMBase):
     """Project membership response.
     
     Based on: https://developers.asana.com/reference/getprojectmembership
     """
     gid: str
     resource_type: str = "project_membership"
-    user: dict
-    project: dict
-    parent: Optional[dict] = None
-    member: Optional[dict] = None
+    user: UserCompact
+    project: ProjectCompact
+    parent: Optional[ResourceRef] = None
+    member: Optional[ResourceRef] = None
     access_level: str = "editor"
     write_access: str = "full_write"
-    
-    class Config:
-        from_attributes = True
 
 
 # =============================================================================
@@ -556,12 +544,11 @@ class TaskCountsResponse(BaseModel):
 
 class ProjectStatusBase(BaseModel):
     """Base project status schema."""
-    title: str = Field(..., min_length=1, max_length=255)
+    title: Name255
     text: Optional[str] = None
     html_text: Optional[str] = None
-    color: str = Field(
+    color: Literal["green", "yellow", "red", "blue", "complete"] = Field(
         default="green",
-        pattern="^(green|yellow|red|blue|complete)$",
         description="Status color: green, yellow, red, blue, complete"
     )
 
@@ -571,26 +558,6 @@ class ProjectStatusCreate(ProjectStatusBase):
     pass
 
 
-class ProjectStatusResponse(BaseModel):
-    """Project status response (DEPRECATED - use status_updates).
-    
-    Based on: https://developers.asana.com/reference/getprojectstatus
-    """
-    gid: str
-    resource_type: str = "project_status"
-    title: str
-    text: Optional[str] = None
-    html_text: Optional[str] = None
-    color: str = "green"
-    created_at: Optional[str] = None
-    created_by: Optional[dict] = None
-    author: Optional[dict] = None
-    modified_at: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
-
-
 # =============================================================================
 # PROJECT BRIEF SCHEMAS
 # =============================================================================
@@ -607,7 +574,7 @@ class ProjectBriefCreate(ProjectBriefBase):
     
     Based on: https://developers.asana.com/reference/createprojectbrief
     """
-    project: str = Field(..., description="Project GID")
+    project: Gid = Field(..., description="Project GID")
 
 
 class ProjectBriefUpdate(ProjectBriefBase):
@@ -615,7 +582,7 @@ class ProjectBriefUpdate(ProjectBriefBase):
     pass
 
 
-class ProjectBriefResponse(BaseModel):
+class ProjectBriefResponse(ORMBase):
     """Project brief response.
     
     Based on: https://developers.asana.com/reference/getprojectbrief
@@ -625,11 +592,8 @@ class ProjectBriefResponse(BaseModel):
     title: Optional[str] = None
     text: Optional[str] = None
     html_text: Optional[str] = None
-    project: Optional[dict] = None
+    project: Optional[ProjectCompact] = None
     permalink_url: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
 
 
 # =============================================================================
@@ -641,7 +605,7 @@ class AddCustomFieldRequest(BaseModel):
     
     Based on: https://developers.asana.com/reference/addcustomfieldtoproject
     """
-    custom_field: str = Field(..., description="Custom field GID")
+    custom_field: Gid = Field(..., description="Custom field GID")
     is_important: Optional[bool] = Field(None, description="Whether to pin the field")
     insert_before: Optional[str] = Field(None, description="Custom field setting GID to insert before")
     insert_after: Optional[str] = Field(None, description="Custom field setting GID to insert after")
@@ -649,7 +613,7 @@ class AddCustomFieldRequest(BaseModel):
 
 class RemoveCustomFieldRequest(BaseModel):
     """Request to remove a custom field from a project."""
-    custom_field: str = Field(..., description="Custom field GID")
+    custom_field: Gid = Field(..., description="Custom field GID")
 
 
 # =============================================================================
@@ -661,7 +625,7 @@ class SaveAsTemplateRequest(BaseModel):
     
     Based on: https://developers.asana.com/reference/projectsaveasstemplate
     """
-    name: str = Field(..., min_length=1, max_length=255, description="Name for the new template")
+    name: Name255 = Field(..., description="Name for the new template")
     team: Optional[str] = Field(None, description="Team GID to share the template with")
     public: Optional[bool] = Field(None, description="Whether the template is public")
 
@@ -684,31 +648,11 @@ class ProjectQueryParams(BaseModel):
     opt_pretty: Optional[bool] = Field(None, description="Pretty print the response")
 
 
-# =============================================================================
-# CUSTOM FIELD SETTING RESPONSE
-# =============================================================================
-
-class CustomFieldSettingResponse(BaseModel):
-    """Custom field setting response.
-    
-    Based on: https://developers.asana.com/reference/customfieldsettings
-    """
-    gid: str
-    resource_type: str = "custom_field_setting"
-    project: Optional[dict] = Field(None, description="Deprecated: use parent")
-    parent: Optional[dict] = Field(None, description="Project or portfolio this setting belongs to")
-    is_important: bool = False
-    custom_field: Optional[dict] = None
-    
-    class Config:
-        from_attributes = True
-
-
 # =============================================================================
 # JOB RESPONSE (for async operations like duplicate)
 # =============================================================================
 
-class JobResponse(BaseModel):
+class JobResponse(ORMBase):
     """Job response for async operations.
     
     Based on: https://developers.asana.com/reference/getjob
@@ -721,6 +665,3 @@ class JobResponse(BaseModel):
     new_task: Optional[dict] = None
     new_task_template: Optional[dict] = None
     new_project_template: Optional[dict] = None
-    
-    class Config:
-        from_attributes = True
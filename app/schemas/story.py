@@ -1,6 +1,8 @@
 from typing import Optional
 from pydantic import BaseModel, Field
 
+from app.schemas.common import CompactBase, ORMBase
+
 
 class StoryBase(BaseModel):
     """Base story schema."""
@@ -22,7 +24,7 @@ class StoryUpdate(BaseModel):
     is_pinned: Optional[bool] = None
 
 
-class StoryResponse(BaseModel):
+class StoryResponse(ORMBase):
     """Story response schema."""
     gid: str
     resource_type: str = "story"
@@ -39,19 +41,13 @@ class StoryResponse(BaseModel):
     created_by: Optional[dict] = None
     target: Optional[dict] = None
     sticker_name: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
 
 
-class StoryCompact(BaseModel):
+class StoryCompact(CompactBase):
     """Compact story representation."""
     gid: str
     resource_type: str = "story"
     resource_subtype: str = "comment"
     text: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
 
 
@@ -1,27 +1,29 @@
 from typing import Optional
 from pydantic import BaseModel, Field
 
+from app.schemas.common import CompactBase, Gid, Name255, ORMBase
+
 
 class TagBase(BaseModel):
     """Base tag schema."""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name255
     color: Optional[str] = None
     notes: Optional[str] = None
 
 
 class TagCreate(TagBase):
     """Schema for creating a tag."""
-    workspace: str = Field(..., description="Workspace GID")
+    workspace: Gid = Field(..., description="Workspace GID")
 
 
 class TagUpdate(BaseModel):
     """Schema for updating a tag."""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[Name255] = None
     color: Optional[str] = None
     notes: Optional[str] = None
 
 
-class TagResponse(BaseModel):
+class TagResponse(ORMBase):
     """Tag response schema."""
     gid: str
     resource_type: str = "tag"
@@ -30,18 +32,12 @@ class TagResponse(BaseModel):
     notes: Optional[str] = None
     workspace: Optional[dict] = None
     created_at: Optional[str] = None
-    
-    class Config:
-        from_attributes = True
 
 
-class TagCompact(BaseModel):
+class TagCompact(CompactBase):
     """Compact tag representation."""
     gid: str
     resource_type: str = "tag"
     name: str
-    
-    class Config:
-        from_attributes = True
 
 
@@ -1,11 +1,13 @@
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Literal
 from pydantic import BaseModel, Field, model_validator
 from datetime import date, datetime
 
+from app.schemas.common import CompactBase, Gid, Name255, ORMBase
+
 
 class TaskBase(BaseModel):
     """Base task schema."""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[Name255] = None
     notes: Optional[str] = None
     html_notes: Optional[str] = None
 
@@ -32,8 +34,8 @@ class TaskCreate(TaskBase):
     start_at: Optional[datetime] = None
     
     # Task type/status (4)
-    resource_subtype: str = Field(default="default_task", pattern="^(default_task|milestone|section|approval)$")
-    approval_status: Optional[str] = Field(None, pattern="^(pending|approved|rejected|changes_requested)$")
+    resource_subtype: Literal["default_task", "milestone", "section", "approval"] = "default_task"
+    approval_status: Optional[Literal["pending", "approved", "rejected", "changes_requested"]] = None
     custom_type: Optional[str] = Field(None, description="GID of a custom task type")
     custom_type_status_option: Optional[str] = Field(None, description="Option GID for custom type's status")
     
@@ -47,7 +49,7 @@ class TaskCreate(TaskBase):
     is_rendered_as_separator: Optional[bool] = Field(None, description="For board/list rendering")
     
     # Data (2)
-    custom_fields: Optional[dict] = Field(None, description="Custom field values keyed by GID")
+    custom_fields: Optional[Dict[str, Any]] = Field(None, description="Custom field values keyed by GID")
     external: Optional[dict] = Field(None, description="External data for integrations")
     
     @model_validator(mode='after')
@@ -60,7 +62,7 @@ class TaskCreate(TaskBase):
 
 class TaskUpdate(BaseModel):
     """Schema for updating a task."""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[Name255] = None
     notes: Optional[str] = None
     html_notes: Optional[str] = None
     completed: Optional[bool] = None
@@ -70,10 +72,10 @@ class TaskUpdate(BaseModel):
     start_on: Optional[date] = None
     start_at: Optional[datetime] = None
     liked: Optional[bool] = None
-    approval_status: Optional[str] = Field(None, pattern="^(pending|approved|rejected|changes_requested)$")
+    approval_status: Optional[Literal["pending", "approved", "rejected", "changes_requested"]] = None
 
 
-class TaskResponse(BaseModel):
+class TaskResponse(ORMBase):
     """Task response schema.
     
     Based on: https://developers.asana.com/reference/createtask
@@ -112,25 +114,19 @@ class TaskResponse(BaseModel):
     external: Optional[dict] = None
     actual_time_minutes: Optional[int] = None
     is_rendered_as_separator: bool = False
-    
-    class Config:
-        from_attributes = True
 
 
-class TaskCompact(BaseModel):
+class TaskCompact(CompactBase):
     """Compact task representation."""
     gid: str
     resource_type: str = "task"
     name: str
     resource_subtype: str = "default_task"
-    
-    class Config:
-        from_attributes = True
 
 
 class TaskDuplicateRequest(BaseModel):
     """Request to duplicate a task."""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name255
     include: Optional[List[str]] = Field(
         default=["notes", "assignee", "subtasks", "attachments", "tags", "followers", "projects", "dates", "dependencies", "parent"]
     )
@@ -138,14 +134,14 @@ class TaskDuplicateRequest(BaseModel):
 
 class SetParentRequest(BaseModel):
     """Request to set a task's parent."""
-    parent: str = Field(..., description="Parent task GID")
+    parent: Gid = Field(..., description="Parent task GID")
     insert_before: Optional[str] = None
     insert_after: Optional[str] = None
 
 
 class AddProjectRequest(BaseModel):
     """Request to add a task to a project."""
-    project: str = Field(..., description="Project GID")
+    project: Gid = Field(..., description="Project GID")
     section: Optional[str] = Field(None, description="Section GID")
     insert_before: Optional[str] = None
     insert_after: Optional[str] = None
@@ -153,17 +149,17 @@ class AddProjectRequest(BaseModel):
 
 class RemoveProjectRequest(BaseModel):
     """Request to remove a task from a project."""
-    project: str = Field(..., description="Project GID")
+    project: Gid = Field(..., description="Project GID")
 
 
 class AddTagRequest(BaseModel):
     """Request to add a tag to a task."""
-    tag: str = Field(..., description="Tag GID")
+    tag: Gid = Field(..., description="Tag GID")
 
 
 class RemoveTagRequest(BaseModel):
     """Request to remove a tag from a task."""
-    tag: str = Field(..., description="Tag GID")
+    tag: Gid = Field(..., description="Tag GID")
 
 
 class AddFollowersRequest(BaseModel):
@@ -198,7 +194,7 @@ class RemoveDependentsRequest(BaseModel):
 
 class TaskSearchRequest(BaseModel):
     """Task search request parameters."""
-    workspace: str = Field(..., description="Workspace GID")
+    workspace: Gid = Field(..., description="Workspace GID")
     text: Optional[str] = None
     assignee_any: Optional[str] = None
     assignee_not: Optional[str] = None
@@ -229,7 +225,7 @@ class TaskSearchRequest(BaseModel):
     completed_on: Optional[date] = None
     completed_on_before: Optional[date] = None
     completed_on_after: Optional[date] = None
-    sort_by: str = Field(default="modified_at", pattern="^(due_date|created_at|completed_at|likes|modified_at)$")
+    sort_by: Literal["due_date", "created_at", "completed_at", "likes", "modified_at"] = "modified_at"
     sort_ascending: bool = False
 
 
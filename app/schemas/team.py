@@ -1,29 +1,31 @@
-from typing import Optional
+from typing import Optional, Literal
 from pydantic import BaseModel, Field
 
+from app.schemas.common import CompactBase, Gid, Name255, ORMBase
+
 
 class TeamBase(BaseModel):
     """Base team schema."""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name255
     description: Optional[str] = None
     html_description: Optional[str] = None
 
 
 class TeamCreate(TeamBase):
     """Schema for creating a team."""
-    organization: str = Field(..., description="Workspace/Organization GID")
-    visibility: str = Field(default="members", pattern="^(public|members|secret)$")
+    organization: Gid = Field(..., description="Workspace/Organization GID")
+    visibility: Literal["public", "members", "secret"] = "members"
 
 
 class TeamUpdate(BaseModel):
     """Schema for updating a team."""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[Name255] = None
     description: Optional[str] = None
     html_description: Optional[str] = None
-    visibility: Optional[str] = Field(None, pattern="^(public|members|secret)$")
+    visibility: Optional[Literal["public", "members", "secret"]] = None
 
 
-class TeamResponse(BaseModel):
+class TeamResponse(ORMBase):
     """Team response schema."""
     gid: str
     resource_type: str = "team"
@@ -32,19 +34,13 @@ class TeamResponse(BaseModel):
     html_description: Optional[str] = None
     visibility: str = "members"
     organization: Optional[dict] = None
-    
-    class Config:
-        from_attributes = True
 
 
-class TeamCompact(BaseModel):
+class TeamCompact(CompactBase):
     """Compact team representation."""
     gid: str
     resource_type: str = "team"
-    name: str
-    
-    class Config:
-        from_attributes = True
+    name: Optional[str] = None  # absent on bare GID references
 
 
 class AddUserToTeamRequest(BaseModel):
@@ -52,7 +48,7 @@ class AddUserToTeamRequest(BaseModel):
     user: str = Field(..., description="User GID to add")
 
 
-class TeamMembershipResponse(BaseModel):
+class TeamMembershipResponse(ORMBase):
     """Team membership response."""
     gid: str
     resource_type: str = "team_membership"
@@ -61,8 +57,5 @@ class TeamMembershipResponse(BaseModel):
     is_admin: bool = False
     is_guest: bool = False
     is_limited_access: bool = False
-    
-    class Config:
-        from_attributes = True
 
 
@@ -1,7 +1,9 @@
 from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr
 from datetime import datetime
 
+from app.schemas.common import CompactBase, Name255, ORMBase
+
 
 class PhotoUrls(BaseModel):
     """User photo URLs at various sizes."""
@@ -14,7 +16,7 @@ class PhotoUrls(BaseModel):
 
 class UserBase(BaseModel):
     """Base user schema."""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name255
     email: EmailStr
 
 
@@ -24,30 +26,24 @@ class UserCreate(UserBase):
 
 class UserUpdate(BaseModel):
     """Schema for updating a user."""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[Name255] = None
     photo: Optional[str] = None
 
 
-class UserResponse(BaseModel):
+class UserResponse(ORMBase):
     """User response schema."""
     gid: str
     resource_type: str = "user"
     name: str
     email: Optional[str] = None
     photo: Optional[PhotoUrls] = None
-    
-    class Config:
-        from_attributes = True
 
 
-class UserCompact(BaseModel):
+class UserCompact(CompactBase):
     """Compact user representation."""
     gid: str
     resource_type: str = "user"
-    name: str
-    
-    class Config:
-        from_attributes = True
+    name: Optional[str] = None  # absent on bare GID references
 
 
 
@@ -1,6 +1,8 @@
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 
+from app.schemas.common import CompactBase, ORMBase
+
 
 class WebhookFilter(BaseModel):
     """Webhook filter configuration."""
@@ -17,7 +19,7 @@ class WebhookCreate(BaseModel):
     filters: Optional[List[WebhookFilter]] = None
 
 
-class WebhookResponse(BaseModel):
+class WebhookResponse(ORMBase):
     """Webhook response schema."""
     gid: str
     resource_type: str = "webhook"
@@ -29,21 +31,15 @@ class WebhookResponse(BaseModel):
     last_failure_at: Optional[str] = None
     last_failure_content: Optional[str] = None
     filters: Optional[List[Dict[str, Any]]] = None
-    
-    class Config:
-        from_attributes = True
 
 
-class WebhookCompact(BaseModel):
+class WebhookCompact(CompactBase):
     """Compact webhook representation."""
     gid: str
     resource_type: str = "webhook"
     resource: dict
     target: str
     active: bool = True
-    
-    class Config:
-        from_attributes = True
 
 
 class WebhookEvent(BaseModel):
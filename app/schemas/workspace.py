@@ -1,10 +1,12 @@
 from typing import Optional, List
 from pydantic import BaseModel, Field
 
+from app.schemas.common import CompactBase, Name255, ORMBase
+
 
 class WorkspaceBase(BaseModel):
     """Base workspace schema."""
-    name: str = Field(..., min_length=1, max_length=255)
+    name: Name255
 
 
 class WorkspaceCreate(WorkspaceBase):
@@ -15,29 +17,23 @@ class WorkspaceCreate(WorkspaceBase):
 
 class WorkspaceUpdate(BaseModel):
     """Schema for updating a workspace."""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    name: Optional[Name255] = None
 
 
-class WorkspaceResponse(BaseModel):
+class WorkspaceResponse(ORMBase):
     """Workspace response schema."""
     gid: str
     resource_type: str = "workspace"
     name: str
     is_organization: bool = False
     email_domains: Optional[List[str]] = None
-    
-    class Config:
-        from_attributes = True
 
 
-class WorkspaceCompact(BaseModel):
+class WorkspaceCompact(CompactBase):
     """Compact workspace representation."""
     gid: str
     resource_type: str = "workspace"
-    name: str
-    
-    class Config:
-        from_attributes = True
+    name: Optional[str] = None  # absent on bare GID references
 
 
 class AddUserRequest(BaseModel):
@@ -50,7 +46,7 @@ class RemoveUserRequest(BaseModel):
     user: str = Field(..., description="User GID to remove")
 
 
-class WorkspaceMembershipResponse(BaseModel):
+class WorkspaceMembershipResponse(ORMBase):
     """Workspace membership response."""
     gid: str
     resource_type: str = "workspace_membership"
@@ -59,8 +55,5 @@ class WorkspaceMembershipResponse(BaseModel):
     is_admin: bool = False
     is_active: bool = True
     is_guest: bool = False
-    
-    class Config:
-        from_attributes = True
 
 
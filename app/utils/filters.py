@@ -1,5 +1,6 @@
 from typing import Optional, List, Any, Dict, Set
 from pydantic import BaseModel
+from sqlalchemy.orm import defer
 
 
 def parse_opt_fields(opt_fields: Optional[str]) -> Set[str]:
@@ -83,6 +84,8 @@ def filter_list(data: List[Dict[str, Any]], opt_fields: Set[str]) -> List[Dict[s
 class OptFieldsParser:
     """Helper class to parse and apply opt_fields filtering."""
     
+    __slots__ = ("fields",)
+    
     def __init__(self, opt_fields: Optional[str] = None):
         self.fields = parse_opt_fields(opt_fields)
     
@@ -99,5 +102,17 @@ class OptFieldsParser:
         if not self.fields:
             return True  # No filtering means include all
         return field in self.fields or any(f.startswith(f"{field}.") for f in self.fields)
+    
+    def defer_unrequested(self, *columns: Any) -> List[Any]:
+        """
+        Loader options deferring the given columns when opt_fields leaves them out.
+        
+        Args:
+            columns: Mapped column attributes (e.g. ``Task.notes``) named after their response keys
+        
+        Returns:
+            ``defer()`` options to pass to ``select(...).options()``
+        """
+        return [defer(column) for column in columns if not self.has_field(column.key)]
 
 
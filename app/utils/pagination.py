@@ -1,13 +1,14 @@
 from typing import Optional, List, Any, TypeVar, Generic
 from pydantic import BaseModel
+from typing_extensions import TypedDict
 
 from app.config import settings
 
 T = TypeVar("T")
 
 
-class NextPage(BaseModel):
-    """Pagination info for next page."""
+class NextPage(TypedDict):
+    """Pagination info for next page, already in its response shape."""
     offset: str
     path: str
     uri: str
@@ -1,6 +1,37 @@
-from typing import Optional, Any, Dict, List, Union
+from decimal import Decimal
+from typing import Optional, Any, Callable, Dict, List, Union
+import orjson
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
+from app.utils.pagination import PaginatedResponse
+
+
+def _orjson_default(value: Any) -> Any:
+    """Encode the few types orjson does not handle natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson.
+    
+    Datetimes and dates are encoded natively (naive values as UTC), so
+    response dicts can carry them without formatting them first.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC,
+        )
+
 
 class AsanaResponse(BaseModel):
     """Standard Asana API response wrapper."""
@@ -25,20 +56,70 @@ class AsanaErrorResponse(BaseModel):
     errors: List[AsanaErrorDetail]
 
 
-def wrap_response(data: Any) -> Dict[str, Any]:
-    """Wrap data in Asana response format."""
-    return {"data": data}
+def wrap_response(data: Any) -> ORJSONResponse:
+    """
+    Wrap data in Asana response format.
+    
+    Returned as a response so FastAPI encodes it once with orjson instead of
+    walking it with jsonable_encoder first.
+    """
+    return ORJSONResponse({"data": data})
 
 
 def wrap_list_response(
     data: List[Any],
     next_page: Optional[Dict[str, str]] = None,
-) -> Dict[str, Any]:
+) -> ORJSONResponse:
     """Wrap list data in Asana response format with pagination."""
     response = {"data": data}
     if next_page:
         response["next_page"] = next_page
-    return response
+    return ORJSONResponse(response)
+
+
+def paginated_response(paginated: PaginatedResponse) -> ORJSONResponse:
+    """
+    List response for a ``paginate`` result, with ``next_page`` always present.
+    
+    Like ``wrap_response``, the items go straight to orjson rather than through
+    FastAPI's jsonable_encoder.
+    """
+    return ORJSONResponse({
+        "data": paginated.data,
+        "next_page": paginated.next_page,
+    })
+
+
+def json_list_response(
+    items: List[bytes],
+    next_page: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Build a list response from pre-encoded JSON items without re-encoding them."""
+    body = b"".join([
+        b'{"data":[',
+        b",".join(items),
+        b'],"next_page":',
+        orjson.dumps(next_page),
+        b"}",
+    ])
+    return Response(content=body, media_type="application/json")
+
+
+def json_fragments_response(
+    items: List[Any],
+    write: Callable[[Any, bytearray], None],
+    next_page: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Build a list response by having ``write`` append each item's JSON to one shared buffer."""
+    buf = bytearray(b'{"data":[')
+    for index, item in enumerate(items):
+        if index:
+            buf += b","
+        write(item, buf)
+    buf += b'],"next_page":'
+    buf += orjson.dumps(next_page)
+    buf += b"}"
+    return Response(content=bytes(buf), media_type="application/json")
 
 
 def error_response(
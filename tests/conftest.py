@@ -7,8 +7,9 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.main import app
-from app.database import Base, get_db
-from app.core.security import get_password_hash, generate_gid
+from app.api.deps import get_db
+from app.database import Base
+from app.core.security import generate_gid
 from app.models.user import User
 from app.models.workspace import Workspace, WorkspaceMembership
 
@@ -74,7 +75,6 @@ async def test_user(db_session: AsyncSession) -> User:
         gid=generate_gid(),
         name="Test User",
         email="test@example.com",
-        hashed_password=get_password_hash("testpassword123"),
     )
     db_session.add(user)
     await db_session.commit()
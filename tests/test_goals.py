@@ -0,0 +1,135 @@
+from datetime import date
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from httpx import AsyncClient
+
+from app.models.goal import goal_row_to_response, write_goal_json
+from app.models.workspace import Workspace
+
+
+async def _create_goal(client: AsyncClient, workspace: Workspace, **fields) -> dict:
+    response = await client.post(
+        "/api/1.0/goals",
+        json={"data": {"name": "Test Goal", "workspace": workspace.gid, **fields}},
+    )
+    assert response.status_code == 200
+    return response.json()["data"]
+
+
+@pytest.mark.asyncio
+async def test_create_goal(client: AsyncClient, test_workspace):
+    """Test creating a goal."""
+    data = await _create_goal(client, test_workspace, notes="Goal notes")
+    assert data["name"] == "Test Goal"
+    assert data["resource_type"] == "goal"
+    assert data["notes"] == "Goal notes"
+
+
+@pytest.mark.asyncio
+async def test_update_goal_returns_notes(client: AsyncClient, test_workspace):
+    """Test that PUT /goals/{gid} returns the stored notes."""
+    goal = await _create_goal(
+        client,
+        test_workspace,
+        notes="Original notes",
+        html_notes="<body>Original notes</body>",
+    )
+
+    # Updating another field must not drop the (deferred) notes
+    response = await client.put(
+        f"/api/1.0/goals/{goal['gid']}",
+        json={"data": {"name": "Updated Name"}},
+    )
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["name"] == "Updated Name"
+    assert data["notes"] == "Original notes"
+    assert data["html_notes"] == "<body>Original notes</body>"
+
+    response = await client.put(
+        f"/api/1.0/goals/{goal['gid']}",
+        json={"data": {"notes": "Updated notes"}},
+    )
+    assert response.status_code == 200
+    assert response.json()["data"]["notes"] == "Updated notes"
+
+
+@pytest.mark.asyncio
+async def test_set_goal_metric_returns_notes(client: AsyncClient, test_workspace):
+    """Test that setting a goal's metric returns the stored notes."""
+    goal = await _create_goal(client, test_workspace, notes="Metric notes")
+
+    response = await client.post(
+        f"/api/1.0/goals/{goal['gid']}/setMetric",
+        json={"data": {"metric": {"metric_type": "number", "target_number_value": 10}}},
+    )
+    assert response.status_code == 200
+    assert response.json()["data"]["notes"] == "Metric notes"
+
+
+@pytest.mark.asyncio
+async def test_update_missing_goal_with_empty_body(client: AsyncClient):
+    """Test that an empty body is treated as {} and the missing goal is reported."""
+    response = await client.put("/api/1.0/goals/1234567890abcdef", content=b"")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_goal_malformed_gid(client: AsyncClient):
+    """Test that a GID that is not hex is rejected as a bad request."""
+    response = await client.get("/api/1.0/goals/not-a-gid")
+    assert response.status_code == 400
+    assert response.json()["errors"][0]["message"] == "'not-a-gid' is not a valid GID"
+
+
+@pytest.mark.asyncio
+async def test_goal_request_body_documented(client: AsyncClient):
+    """Test that goal request bodies appear in the OpenAPI schema."""
+    response = await client.get("/openapi.json")
+    assert response.status_code == 200
+    operation = response.json()["paths"]["/api/1.0/goals/{goal_gid}"]["put"]
+    assert "requestBody" in operation
+
+
+@pytest.mark.asyncio
+async def test_list_goals(client: AsyncClient, test_workspace):
+    """Test listing goals, with and without opt_fields."""
+    await _create_goal(client, test_workspace, notes="Listed notes", due_on="2026-01-02")
+
+    response = await client.get("/api/1.0/goals", params={"workspace": test_workspace.gid})
+    assert response.status_code == 200
+    (data,) = response.json()["data"]
+    assert data["notes"] == "Listed notes"
+    assert data["due_on"] == "2026-01-02"
+    assert data["workspace"] == {"gid": test_workspace.gid, "resource_type": "workspace"}
+
+    response = await client.get(
+        "/api/1.0/goals",
+        params={"workspace": test_workspace.gid, "opt_fields": "name,due_on"},
+    )
+    assert response.status_code == 200
+    (data,) = response.json()["data"]
+    assert data["name"] == "Test Goal"
+    assert data["due_on"] == "2026-01-02"
+
+
+def test_write_goal_json_matches_row_response():
+    """Test that the bytes writer encodes the same response as goal_row_to_response."""
+    full = SimpleNamespace(
+        gid="1234567890abcdef", name='Say "hi" 100%', notes="\u00e9\n", html_notes=None,
+        status="on_track", is_workspace_level=True, liked=False, num_likes=3,
+        workspace_gid="00000000000000a1", due_on=date(2026, 1, 2), start_on=date(2025, 12, 1),
+        owner_gid="00000000000000b2", team_gid="00000000000000c3",
+        time_period_gid="00000000000000d4",
+        metric={"metric_type": "number", "target_number_value": 10},
+    )
+    bare = SimpleNamespace(**{
+        **vars(full), "due_on": None, "start_on": None, "owner_gid": None,
+        "team_gid": None, "time_period_gid": None, "metric": None,
+    })
+    for row in (full, bare):
+        buf = bytearray()
+        write_goal_json(row, buf)
+        assert bytes(buf) == orjson.dumps(goal_row_to_response(row))
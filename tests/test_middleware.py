@@ -0,0 +1,60 @@
+import orjson
+import pytest
+from httpx import AsyncClient, Response
+
+from app.core.exceptions import NotFoundError, RateLimitError
+from app.core.middleware import SERVER_ERROR_BODY, ErrorAndTimingMiddleware
+
+
+def _raising_app(exc: Exception):
+    async def app(scope, receive, send):
+        raise exc
+    return app
+
+
+async def _get(app) -> Response:
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        return await client.get("/")
+
+
+@pytest.mark.asyncio
+async def test_api_exception_rendered():
+    """Test that an AsanaAPIException becomes an Asana-style error response."""
+    response = await _get(ErrorAndTimingMiddleware(_raising_app(NotFoundError("Task", "123"))))
+    assert response.status_code == 404
+    assert response.headers["content-type"] == "application/json"
+    assert "x-process-time" in response.headers
+    (error,) = response.json()["errors"]
+    assert error["message"] == "Task: Unknown object: 123"
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_sets_retry_after():
+    """Test that a RateLimitError carries its Retry-After header."""
+    response = await _get(ErrorAndTimingMiddleware(_raising_app(RateLimitError(retry_after=30))))
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "30"
+
+
+@pytest.mark.asyncio
+async def test_unexpected_exception_becomes_server_error():
+    """Test that any other exception is answered with a 500 and re-raised."""
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = ErrorAndTimingMiddleware(_raising_app(RuntimeError("boom")))
+    with pytest.raises(RuntimeError):
+        await middleware({"type": "http"}, None, send)
+    assert sent[0]["status"] == 500
+    assert sent[1]["body"] == SERVER_ERROR_BODY
+
+
+@pytest.mark.asyncio
+async def test_app_responses_timed(client: AsyncClient):
+    """Test that responses from the app carry X-Process-Time."""
+    response = await client.get("/api/1.0/goals/1234567890abcdef")
+    assert response.status_code == 404
+    assert float(response.headers["x-process-time"]) >= 0
+    assert orjson.loads(response.content)["errors"]
@@ -0,0 +1,65 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import generate_gid
+from app.models.portfolio import Portfolio
+from app.models.project import Project
+
+
+@pytest_asyncio.fixture
+async def item_project(db_session: AsyncSession, test_workspace) -> Project:
+    """Create a project to add to portfolios."""
+    project = Project(gid=generate_gid(), name="Original", workspace_gid=test_workspace.gid)
+    db_session.add(project)
+    await db_session.commit()
+    return project
+
+
+@pytest_asyncio.fixture
+async def portfolio(db_session: AsyncSession, test_workspace) -> Portfolio:
+    """Create an empty portfolio."""
+    portfolio = Portfolio(gid=generate_gid(), name="Portfolio", workspace_gid=test_workspace.gid)
+    db_session.add(portfolio)
+    await db_session.commit()
+    return portfolio
+
+
+@pytest.mark.asyncio
+async def test_portfolio_items_follow_project_updates(
+    client: AsyncClient, portfolio, item_project
+):
+    """Test that portfolio items reflect a project renamed after they were listed."""
+    response = await client.post(
+        f"/api/1.0/portfolios/{portfolio.gid}/addItem",
+        json={"data": {"item": item_project.gid}},
+    )
+    assert response.status_code == 200
+
+    response = await client.get(f"/api/1.0/portfolios/{portfolio.gid}/items")
+    assert [item["name"] for item in response.json()["data"]] == ["Original"]
+
+    response = await client.put(
+        f"/api/1.0/projects/{item_project.gid}",
+        json={"data": {"name": "Renamed"}},
+    )
+    assert response.status_code == 200
+
+    response = await client.get(f"/api/1.0/portfolios/{portfolio.gid}/items")
+    assert response.status_code == 200
+    assert [item["name"] for item in response.json()["data"]] == ["Renamed"]
+
+
+@pytest.mark.asyncio
+async def test_remove_portfolio_item(client: AsyncClient, portfolio, item_project):
+    """Test that a removed item is no longer listed."""
+    for action in ("addItem", "removeItem"):
+        response = await client.post(
+            f"/api/1.0/portfolios/{portfolio.gid}/{action}",
+            json={"data": {"item": item_project.gid}},
+        )
+        assert response.status_code == 200
+
+    response = await client.get(f"/api/1.0/portfolios/{portfolio.gid}/items")
+    assert response.json()["data"] == []
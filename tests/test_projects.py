@@ -1,5 +1,9 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.core.security import generate_gid
+from app.models.project import Project, ProjectMembership
 
 
 @pytest.mark.asyncio
@@ -105,3 +109,23 @@ async def test_delete_project(client: AsyncClient, auth_headers, test_workspace)
     assert get_response.status_code == 404
 
 
+
+
+@pytest.mark.asyncio
+async def test_add_members_skips_duplicates(client: AsyncClient, db_session, test_user, test_workspace):
+    """Test that repeated and already-present members get one membership."""
+    project_gid = generate_gid()
+    db_session.add(Project(gid=project_gid, name="Members", workspace_gid=test_workspace.gid))
+    await db_session.commit()
+
+    for _ in range(2):
+        response = await client.post(
+            f"/api/1.0/projects/{project_gid}/addMembers",
+            json={"data": {"members": [test_user.gid, test_user.gid]}},
+        )
+        assert response.status_code == 200
+
+    result = await db_session.execute(
+        select(ProjectMembership.user_gid).where(ProjectMembership.project_gid == project_gid)
+    )
+    assert result.scalars().all() == [test_user.gid]
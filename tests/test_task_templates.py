@@ -0,0 +1,55 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import generate_gid
+from app.models.project import Project
+from app.models.task import TaskTemplate
+
+
+@pytest_asyncio.fixture
+async def template_project(db_session: AsyncSession, test_workspace) -> Project:
+    """Create a project with one task template."""
+    project = Project(
+        gid=generate_gid(),
+        name="Template Project",
+        workspace_gid=test_workspace.gid,
+    )
+    db_session.add(project)
+    await db_session.flush()
+    db_session.add(TaskTemplate(
+        gid=generate_gid(),
+        name="Bug report",
+        description="Steps to reproduce",
+        project_gid=project.gid,
+    ))
+    await db_session.commit()
+    db_session.expunge_all()
+    return project
+
+
+@pytest.mark.asyncio
+async def test_get_task_templates(client: AsyncClient, template_project):
+    """Test listing task templates with their description."""
+    response = await client.get(
+        "/api/1.0/task_templates", params={"project": template_project.gid}
+    )
+    assert response.status_code == 200
+    (data,) = response.json()["data"]
+    assert data["name"] == "Bug report"
+    assert data["description"] == "Steps to reproduce"
+    assert data["project"] == {"gid": template_project.gid, "resource_type": "project"}
+
+
+@pytest.mark.asyncio
+async def test_get_task_templates_opt_fields(client: AsyncClient, template_project):
+    """Test that opt_fields leaving out description does not load it."""
+    response = await client.get(
+        "/api/1.0/task_templates",
+        params={"project": template_project.gid, "opt_fields": "name"},
+    )
+    assert response.status_code == 200
+    (data,) = response.json()["data"]
+    assert data["name"] == "Bug report"
+    assert "description" not in data
@@ -1,5 +1,9 @@
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.core.security import generate_gid
+from app.models.task import Task, TaskFollower
 
 
 @pytest.mark.asyncio
@@ -156,3 +160,55 @@ async def test_delete_task(client: AsyncClient, auth_headers, test_workspace):
     assert get_response.status_code == 404
 
 
+
+
+
+async def _num_subtasks(client: AsyncClient, db_session, task_gid: str) -> int:
+    # The trigger updates the parent row behind the session's back
+    db_session.expire_all()
+    response = await client.get(f"/api/1.0/tasks/{task_gid}")
+    assert response.status_code == 200
+    return response.json()["data"]["num_subtasks"]
+
+
+@pytest.mark.asyncio
+async def test_subtask_count(client: AsyncClient, db_session, test_workspace):
+    """Test that num_subtasks follows subtask creation, re-parenting and deletion."""
+    parent_gid, other_gid, subtask_gid = generate_gid(), generate_gid(), generate_gid()
+    db_session.add_all([Task(gid=parent_gid, name="Parent"), Task(gid=other_gid, name="Other")])
+    await db_session.flush()
+    db_session.add(Task(gid=subtask_gid, name="Subtask", parent_gid=parent_gid))
+    await db_session.commit()
+    assert await _num_subtasks(client, db_session, parent_gid) == 1
+
+    response = await client.post(
+        f"/api/1.0/tasks/{subtask_gid}/setParent",
+        json={"data": {"parent": other_gid}},
+    )
+    assert response.status_code == 200
+    assert await _num_subtasks(client, db_session, parent_gid) == 0
+    assert await _num_subtasks(client, db_session, other_gid) == 1
+
+    response = await client.delete(f"/api/1.0/tasks/{subtask_gid}")
+    assert response.status_code == 200
+    assert await _num_subtasks(client, db_session, other_gid) == 0
+
+
+@pytest.mark.asyncio
+async def test_add_followers_skips_duplicates(client: AsyncClient, db_session, test_user):
+    """Test that repeated and already-present followers are added once."""
+    task_gid = generate_gid()
+    db_session.add(Task(gid=task_gid, name="Followed"))
+    await db_session.commit()
+
+    for _ in range(2):
+        response = await client.post(
+            f"/api/1.0/tasks/{task_gid}/addFollowers",
+            json={"data": {"followers": f"{test_user.gid},{test_user.gid}"}},
+        )
+        assert response.status_code == 200
+
+    result = await db_session.execute(
+        select(TaskFollower.user_gid).where(TaskFollower.task_gid == task_gid)
+    )
+    assert result.scalars().all() == [test_user.gid]
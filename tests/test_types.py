@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.security import generate_gid
+from app.models.goal import Goal, STATUS_TYPES
+from app.models.types import GID, SmallEnum, UTCDateTime
+
+DIALECT = sqlite.dialect()
+
+
+def test_gid_round_trip():
+    """Test that a GID packs into 8 bytes and loads back as the same hex string."""
+    gid = generate_gid()
+    stored = GID().process_bind_param(gid, DIALECT)
+    assert stored == bytes.fromhex(gid)
+    assert len(stored) == 8
+    assert GID().process_result_value(stored, DIALECT) == gid
+    assert GID().process_bind_param(None, DIALECT) is None
+
+
+@pytest.mark.parametrize("value", ["not-a-gid", "abc", "zz" * 8])
+def test_gid_rejects_malformed_value(value):
+    """Test that binding a value that is not hex raises ValueError."""
+    with pytest.raises(ValueError, match="is not a valid GID"):
+        GID().process_bind_param(value, DIALECT)
+
+
+def test_small_enum_round_trip():
+    """Test that names are stored as their position in the list and load back."""
+    column_type = SmallEnum(*STATUS_TYPES)
+    for code, name in enumerate(STATUS_TYPES):
+        assert column_type.process_bind_param(name, DIALECT) == code
+        assert column_type.process_result_value(code, DIALECT) == name
+    assert column_type.process_bind_param(None, DIALECT) is None
+    with pytest.raises(ValueError, match="is not one of"):
+        column_type.process_bind_param("unknown", DIALECT)
+
+
+def test_utc_datetime_round_trip():
+    """Test that aware values are stored as naive UTC and load back as aware UTC."""
+    column_type = UTCDateTime()
+    value = datetime(2026, 3, 1, 9, 30, tzinfo=timezone(timedelta(hours=2)))
+    stored = column_type.process_bind_param(value, DIALECT)
+    assert stored == datetime(2026, 3, 1, 7, 30)
+    loaded = column_type.process_result_value(stored, DIALECT)
+    assert loaded == value
+    assert loaded.tzinfo is timezone.utc
+    # Naive values are taken to be UTC already
+    assert column_type.process_bind_param(stored, DIALECT) == stored
+
+
+@pytest.mark.asyncio
+async def test_column_types_round_trip_through_database(db_session: AsyncSession, test_workspace):
+    """Test GID, SmallEnum and UTCDateTime columns through an INSERT and SELECT."""
+    gid = generate_gid()
+    db_session.add(Goal(gid=gid, name="Typed", workspace_gid=test_workspace.gid, status="at_risk"))
+    await db_session.commit()
+
+    result = await db_session.execute(
+        select(Goal.gid, Goal.workspace_gid, Goal.status, Goal.created_at).where(Goal.gid == gid)
+    )
+    row = result.one()
+    assert row.gid == gid
+    assert row.workspace_gid == test_workspace.gid
+    assert row.status == "at_risk"
+    assert row.created_at.tzinfo is timezone.utc